@@ -36,14 +36,64 @@ v1.1.0 Changes:
 """
 
 import os
+import re
+import copy
+import gzip
+import hashlib
+import secrets
+import tempfile
 import json
+import time
+import zlib
+from collections import deque, namedtuple
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import quote
 import functools
-from datetime import datetime
-from flask import Blueprint, render_template_string, request, session, redirect, url_for, jsonify
+from concurrent.futures import ThreadPoolExecutor, wait, ALL_COMPLETED
+from datetime import datetime, timedelta
+try:
+    import orjson
+except ImportError:  # optional speedup; falls back to stdlib json
+    orjson = None
+try:
+    import brotli
+except ImportError:  # optional; responses are then gzipped only
+    brotli = None
+try:
+    import tiktoken
+except ImportError:  # optional; prompt sizes are then estimated at ~4 chars per token
+    tiktoken = None
+try:
+    import ijson
+except ImportError:  # optional; large files are then parsed whole
+    ijson = None
+from jinja2 import FileSystemBytecodeCache
+from jinja2.ext import Extension
+from flask import (Blueprint, current_app, render_template, stream_template, stream_with_context, request,
+                   session, redirect, url_for)
 
 # Blueprint setup
-admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
+admin_bp = Blueprint('admin', __name__, url_prefix='/admin', static_folder='static', template_folder='templates')
+
+def _asset_version(filename):
+    """Content hash of a static asset; part of its URL so it can be cached as immutable."""
+    with open(os.path.join(admin_bp.static_folder, filename), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+@functools.lru_cache(maxsize=None)
+def _template_version(name):
+    """Content hash of templates/admin/<name> and the layout it extends; part of the ETag of pages rendered from it."""
+    digest = hashlib.sha256()
+    for part in (name, "_base.html", "_macros.html"):
+        with open(os.path.join(admin_bp.root_path, admin_bp.template_folder, "admin", part), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+ADMIN_CSS_VERSION = _asset_version("admin.css")
+DASHBOARD_JS_VERSION = _asset_version("admin-dashboard.js")
+_ASSET_VERSIONS = {"admin.css": ADMIN_CSS_VERSION, "admin-dashboard.js": DASHBOARD_JS_VERSION}
 
 # Config
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "")
@@ -54,24 +104,100 @@ BOUNTY_WALLET_ADDRESS = os.getenv("BOUNTY_WALLET_ADDRESS", "7vvNkG3JF3JpxLEavqZS
 DATA_FILE = "/app/data/bounty_reviews.json"
 API_KEYS_FILE = "/app/data/api_keys.json"
 
+def _now_iso():
+    """Current UTC time as an ISO-8601 string with a Z suffix (second precision)."""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
 # =============================================================================
 # DATA STORAGE (JSON file)
 # =============================================================================
 
-def load_data():
-    """Load reviews data from JSON file."""
+# path -> ((st_mtime_ns, st_size), parsed data), shared by all the JSON loaders.
+# The cached object is read-only: every request thread may be iterating it. Code that
+# changes data to save it back loads with for_update=True and gets its own copy.
+_JSON_CACHE = {}
+
+def _json_loads(raw):
+    """Parse JSON from bytes or str."""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+def _json_dumps(data):
+    """Serialize data as compact JSON bytes."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+def _jsonify(data, status=200):
+    """JSON response serialized with _json_dumps rather than Flask's stdlib provider."""
+    return current_app.response_class(_json_dumps(data), status=status, mimetype="application/json")
+
+def _file_stamp(path):
+    """(mtime_ns, size) of path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def _load_json(path, default, for_update=False):
+    """Parse a JSON data file, reusing the last parse while the file is unchanged on disk.
+
+    The result is shared and must not be modified unless for_update is set, which returns a private copy.
+    """
+    stamp = _file_stamp(path)
+    if not stamp or not stamp[1]:
+        return default
+    cached = _JSON_CACHE.get(path)
+    if cached and cached[0] == stamp:
+        return copy.deepcopy(cached[1]) if for_update else cached[1]
+    try:
+        with open(path, 'rb') as f:
+            data = _json_loads(f.read())
+    except FileNotFoundError:  # removed between the stat and the open
+        return default
+    except ValueError as e:  # corrupt JSON or invalid UTF-8
+        print(f"[ADMIN] Warning: could not parse {path}, using defaults: {e}", flush=True)
+        return default
+    _JSON_CACHE[path] = (stamp, data)
+    return copy.deepcopy(data) if for_update else data
+
+def _atomic_write_json(path, data, durable=True):
+    """Write data to path via a temp file + os.replace, so readers never see a partial file.
+
+    durable=False skips the fsync: still atomic, but a crash may lose the write - fine for
+    counters, not for records. The cached parse for path becomes a parse of the written bytes -
+    not data itself, which stays the caller's - so the next load skips the read; on failure the
+    cache entry is dropped.
+    """
     try:
-        with open(DATA_FILE, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {"reviews": {}, "payouts": [], "history": []}
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        raw = _json_dumps(data)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(raw)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        st = os.stat(path)
+        _JSON_CACHE[path] = ((st.st_mtime_ns, st.st_size), _json_loads(raw))
+    except Exception:
+        _JSON_CACHE.pop(path, None)
+        raise
+
+def load_data(for_update=False):
+    """Load reviews data from JSON file (a private copy to modify and save if for_update)."""
+    return _load_json(DATA_FILE, {"reviews": {}, "payouts": [], "history": []}, for_update)
 
 def save_data(data):
     """Save reviews data to JSON file."""
     try:
-        os.makedirs(os.path.dirname(DATA_FILE), exist_ok=True)
-        with open(DATA_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        _atomic_write_json(DATA_FILE, data)
         return True
     except Exception as e:
         print(f"Error saving data: {e}")
@@ -81,29 +207,54 @@ def save_data(data):
 # API KEYS STORAGE
 # =============================================================================
 
-def load_api_keys():
-    """Load API keys from JSON file."""
-    try:
-        with open(API_KEYS_FILE, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {"keys": {}}
+def load_api_keys(for_update=False):
+    """Load API keys from JSON file (a private copy to modify and save if for_update)."""
+    return _load_json(API_KEYS_FILE, {"keys": {}}, for_update)
+
+def _key_created(item):
+    """Sort key for (key_id, key_data) pairs: creation timestamp."""
+    return item[1].get("created", "")
 
-def save_api_keys(data):
-    """Save API keys to JSON file."""
+def save_api_keys(data, durable=True):
+    """Save API keys to JSON file, kept in creation order (oldest first).
+
+    Pass durable=False for usage-count bumps, which need not be fsynced (see _atomic_write_json).
+    """
+    data["keys"] = dict(sorted(data.get("keys", {}).items(), key=_key_created))
     try:
-        os.makedirs(os.path.dirname(API_KEYS_FILE), exist_ok=True)
-        with open(API_KEYS_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        _atomic_write_json(API_KEYS_FILE, data, durable)
         return True
     except Exception as e:
         print(f"Error saving API keys: {e}")
         return False
 
+def hash_api_key(api_key):
+    """Storage id for an API key: sha256 hex digest, so the file never holds plaintext keys."""
+    return hashlib.sha256(api_key.encode()).hexdigest()
+
+def resolve_api_key(keys, api_key):
+    """Return the id under which api_key is stored in keys, or None.
+
+    Keys created before hashing are still stored under their plaintext value.
+    """
+    if not api_key:
+        return None
+    key_id = hash_api_key(api_key)
+    if key_id in keys:
+        return key_id
+    if api_key in keys:
+        return api_key
+    return None
+
+def api_key_label(key_id, key_data):
+    """Short display form of a stored key (prefix...suffix)."""
+    if "prefix" in key_data:
+        return f"{key_data['prefix']}...{key_data.get('suffix', '')}"
+    return f"{key_id[:8]}...{key_id[-4:]}"
+
 def generate_api_key():
-    """Generate a new UUID4 API key."""
-    import uuid
-    return str(uuid.uuid4())
+    """Generate a new API key: "wc_" + 32 random bytes, urlsafe base64 (47 chars)."""
+    return "wc_" + secrets.token_urlsafe(32)
 
 def get_tier_rate_limit(tier):
     """Get rate limit for a tier."""
@@ -126,6 +277,92 @@ def login_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+# =============================================================================
+# RESPONSE COMPRESSION
+# =============================================================================
+
+_COMPRESS_MIN_BYTES = 1024
+
+def _gzip_stream(chunks):
+    """Gzip a streamed response body incrementally. An empty chunk flushes what's buffered."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk) if chunk else compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def _brotli_stream(chunks):
+    """Brotli-compress a streamed response body incrementally. An empty chunk flushes what's buffered."""
+    compressor = brotli.Compressor(quality=5)
+    for chunk in chunks:
+        data = compressor.process(chunk) if chunk else compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+_COMPRESS_MIMETYPES = {"text/html", "text/plain", "text/css", "text/javascript", "application/javascript"}
+_compressed_assets = {}  # (static filename, encoding) -> compressed bytes
+
+@admin_bp.after_request
+def compress_html(response):
+    """Brotli- or gzip-compress admin HTML pages and static assets when the client accepts it."""
+    if request.endpoint == "admin.static":
+        # send_file hands the file straight to the server; read it so it can be compressed
+        response.direct_passthrough = False
+    if (response.status_code != 200 or response.mimetype not in _COMPRESS_MIMETYPES
+            or "Content-Encoding" in response.headers or response.direct_passthrough):
+        return response
+    if brotli is not None and "br" in request.accept_encodings:
+        encoding = "br"
+    elif "gzip" in request.accept_encodings:
+        encoding = "gzip"
+    else:
+        return response
+    
+    if request.endpoint == "admin.static":
+        # Assets only change with a deploy: compress each once, at the highest level
+        data = response.get_data()
+        key = (request.view_args["filename"], encoding)
+        if key not in _compressed_assets:
+            _compressed_assets[key] = (brotli.compress(data, quality=11) if encoding == "br"
+                                       else gzip.compress(data, compresslevel=9))
+        response.set_data(_compressed_assets[key])
+        response.headers.pop("Accept-Ranges", None)
+    elif response.is_streamed:
+        stream = _brotli_stream if encoding == "br" else _gzip_stream
+        response.response = stream(response.iter_encoded())
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        if len(data) < _COMPRESS_MIN_BYTES:
+            return response
+        if encoding == "br":
+            response.set_data(brotli.compress(data, quality=5))
+        else:
+            response.set_data(gzip.compress(data, compresslevel=6))
+        response.headers.pop("Accept-Ranges", None)
+    
+    response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    return response
+
+@admin_bp.after_request
+def cache_static(response):
+    """Versioned static assets never change under the same URL - let browsers keep them."""
+    version = request.args.get("v")
+    if (request.endpoint == "admin.static" and version
+            and version == _ASSET_VERSIONS.get(request.view_args.get("filename"))):
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = 31536000
+        response.cache_control.immutable = True
+    return response
+
+@admin_bp.context_processor
+def inject_asset_versions():
+    return {"admin_css_version": ADMIN_CSS_VERSION, "dashboard_js_version": DASHBOARD_JS_VERSION}
+
 # =============================================================================
 # GITHUB API
 # =============================================================================
@@ -137,33 +374,109 @@ def github_headers():
         headers["Authorization"] = f"token {GITHUB_TOKEN}"
     return headers
 
+# Shared session so consecutive GitHub calls reuse one keep-alive TLS connection
+_gh_session = requests.Session()
+_gh_session.headers.update(github_headers())
+# Transient GitHub failures are retried with backoff; POST is left out so comments are never
+# posted twice. Rate limiting (403/429, Retry-After) is handled by _gh_request instead, so a
+# long Retry-After can never stall a request inside the adapter.
+_gh_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=Retry(
+    total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504],
+    allowed_methods=["GET", "PATCH", "PUT"], respect_retry_after_header=False, raise_on_status=False)))
+
+# Background workers for independent GitHub calls made within one admin action.
+# Tasks running here must never submit to _executor and wait: a busy pool would deadlock.
+_executor = ThreadPoolExecutor(max_workers=4)
+# get_pr_detail() runs on _executor itself, so its diff fetch needs a pool of its own
+_diff_executor = ThreadPoolExecutor(max_workers=4)
+
+# While GitHub reports the rate limit as exhausted, calls fail fast with its last refusal
+_gh_blocked = {"until": 0, "response": None}
+_GH_SHORT_WAIT = 5  # seconds worth sleeping through before a single retry
+
+def _gh_request(method, url, **kwargs):
+    """Make a GitHub API call through _gh_session, honouring rate-limit responses.
+
+    A 403/429 carrying Retry-After or X-RateLimit-Remaining: 0 marks the API as blocked
+    until the advertised time; short waits are slept through and retried once, longer
+    ones make further calls return that response without touching the network.
+    """
+    now = time.time()
+    if now < _gh_blocked["until"]:
+        return _gh_blocked["response"]
+    resp = _gh_session.request(method, url, **kwargs)
+    if resp.status_code not in (403, 429):
+        return resp
+    retry_after = resp.headers.get("Retry-After")
+    if retry_after is not None:
+        retry_in = int(retry_after) if retry_after.isdigit() else 60
+    elif resp.headers.get("X-RateLimit-Remaining") == "0":
+        retry_in = max(int(resp.headers.get("X-RateLimit-Reset", 0) or 0) - now, 1)
+    else:
+        return resp  # an ordinary permission error
+    if retry_in <= _GH_SHORT_WAIT:
+        time.sleep(retry_in)
+        resp = _gh_session.request(method, url, **kwargs)
+        if resp.status_code not in (403, 429):
+            return resp
+        retry_in = 60
+    print(f"[ADMIN] GitHub rate limited, pausing API calls for {int(retry_in)}s", flush=True)
+    _gh_blocked["response"] = resp
+    _gh_blocked["until"] = now + retry_in
+    return resp
+
+def _gh_json(resp):
+    """Parse a GitHub response body, straight from bytes when orjson is available."""
+    return _json_loads(resp.content)
+
+# Short-lived caches for GitHub reads repeated across page views
+OPEN_PRS_TTL = 60        # 1 min - dashboard, claims and bulk close
+ISSUE_TITLE_TTL = 600    # 10 min - bounty amounts parsed from linked issue titles
+_open_prs_cache = {"data": None, "expires": 0}
+_issue_title_cache = {}  # issue_number -> (title, expires)
+
+def _invalidate_open_prs():
+    """Drop the cached open PR list after a PR is merged or closed from the admin."""
+    _open_prs_cache["expires"] = 0
+
 def get_open_prs():
     """Fetch open PRs from GitHub."""
+    now = time.time()
+    if _open_prs_cache["data"] is not None and now < _open_prs_cache["expires"]:
+        return _open_prs_cache["data"]
+    
     url = f"https://api.github.com/repos/{REPO}/pulls?state=open"
     try:
-        resp = requests.get(url, headers=github_headers(), timeout=15)
+        resp = _gh_request("GET", url, timeout=15)
         if resp.status_code == 200:
-            return resp.json()
+            prs = _gh_json(resp)
+            for pr in prs:
+                pr["created_date"] = (pr.get("created_at") or "")[:10]
+            _open_prs_cache["data"] = prs
+            _open_prs_cache["expires"] = now + OPEN_PRS_TTL
+            return prs
         return []
     except Exception as e:
         print(f"GitHub API error: {e}")
         return []
 
-def get_pr_detail(pr_number):
-    """Fetch PR details including diff."""
+def get_pr_diff(pr_number):
+    """Fetch a PR's diff, truncated for review; empty if GitHub doesn't return it."""
+    url = f"https://api.github.com/repos/{REPO}/pulls/{pr_number}"
+    resp = _gh_request("GET", url, headers={"Accept": "application/vnd.github.v3.diff"}, timeout=15)
+    return _truncate_diff(resp.text) if resp.status_code == 200 else ""
+
+def get_pr_detail(pr_number, with_diff=True):
+    """Fetch PR details, including the diff unless with_diff is False."""
     try:
-        # Get PR info
+        # Get PR info here while the diff is fetched alongside it
         url = f"https://api.github.com/repos/{REPO}/pulls/{pr_number}"
-        resp = requests.get(url, headers=github_headers(), timeout=15)
+        diff_future = _diff_executor.submit(get_pr_diff, pr_number) if with_diff else None
+        resp = _gh_request("GET", url, timeout=15)
+        diff = diff_future.result() if diff_future else None
         if resp.status_code != 200:
             return None
-        pr_data = resp.json()
-        
-        # Get diff
-        diff_headers = github_headers()
-        diff_headers["Accept"] = "application/vnd.github.v3.diff"
-        diff_resp = requests.get(url, headers=diff_headers, timeout=15)
-        diff = diff_resp.text[:15000] if diff_resp.status_code == 200 else ""
+        pr_data = _gh_json(resp)
         
         return {
             "number": pr_number,
@@ -174,91 +487,142 @@ def get_pr_detail(pr_number):
             "url": pr_data.get("html_url", ""),
             "state": pr_data.get("state", "unknown"),
             "created_at": pr_data.get("created_at", ""),
-            "labels": [l.get("name", "") for l in pr_data.get("labels", [])]
+            "labels": [l.get("name", "") for l in pr_data.get("labels", [])],
+            "changed_files": pr_data.get("changed_files", 0),
+            "additions": pr_data.get("additions", 0),
+            "deletions": pr_data.get("deletions", 0)
         }
     except Exception as e:
         print(f"Error fetching PR {pr_number}: {e}")
         return None
 
+_RE_ISSUE_REF = re.compile(r'#(\d+)')
+_RE_SOLSCAN_TX = re.compile(r'solscan\.io/tx/([A-Za-z0-9]+)')
+_RE_CLAIM = re.compile(r'\b(?:claiming|i\s+claim|claim\s+this)\b', re.IGNORECASE)
+
+# Open bounty issues with their comments in one call; same order and page sizes as the REST
+# fallback (newest 50 issues, first 30 comments each)
+_BOUNTY_ISSUES_QUERY = """
+query($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 50, labels: ["bounty"], states: OPEN, orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes {
+        number
+        title
+        comments(first: 30) { nodes { body createdAt author { login } } }
+      }
+    }
+  }
+}
+"""
+
+def _get_bounty_issues_graphql():
+    """Fetch open bounty issues and their comments through the GraphQL API.
+
+    Returns [(issue, comments)] shaped like the REST payloads, or None when GraphQL
+    isn't usable (no token, HTTP or query error) so the caller can fall back to REST.
+    """
+    if not GITHUB_TOKEN:
+        return None  # GraphQL has no anonymous access
+    owner, _, name = REPO.partition("/")
+    resp = _gh_request("POST", "https://api.github.com/graphql", timeout=15,
+                       json={"query": _BOUNTY_ISSUES_QUERY, "variables": {"owner": owner, "name": name}})
+    if resp.status_code != 200:
+        return None
+    payload = _gh_json(resp)
+    repo = (payload.get("data") or {}).get("repository")
+    if payload.get("errors") or not repo:
+        return None
+    return [
+        ({"number": node["number"], "title": node["title"]},
+         [{"body": c["body"], "created_at": c["createdAt"], "user": c["author"] or {}}
+          for c in node["comments"]["nodes"]])
+        for node in repo["issues"]["nodes"]
+    ]
+
 def get_bounty_claims():
     """Scan GitHub issues for bounty claims."""
-    import re
-    from datetime import datetime, timedelta
-    
     claims = []
     
     try:
-        # Get open issues with bounty label
-        url = f"https://api.github.com/repos/{REPO}/issues?state=open&labels=bounty&per_page=50"
-        resp = requests.get(url, headers=github_headers(), timeout=15)
-        if resp.status_code != 200:
-            return []
+        # Open PRs are fetched on the shared workers alongside the issues
+        prs_future = _executor.submit(get_open_prs)
+        
+        issues_with_comments = _get_bounty_issues_graphql()
+        if issues_with_comments is None:
+            # REST fallback: get open issues with bounty label, then each one's comments
+            url = f"https://api.github.com/repos/{REPO}/issues?state=open&labels=bounty&per_page=50"
+            resp = _gh_request("GET", url, timeout=15)
+            if resp.status_code != 200:
+                return []
+            
+            # Skip PRs (they show up in issues endpoint too)
+            issues = [issue for issue in _gh_json(resp) if not issue.get("pull_request")]
+            
+            def fetch_comments(issue):
+                comments_url = f"https://api.github.com/repos/{REPO}/issues/{issue.get('number')}/comments"
+                comments_resp = _gh_request("GET", comments_url, timeout=15)
+                return _gh_json(comments_resp) if comments_resp.status_code == 200 else None
+            
+            issues_with_comments = zip(issues, _executor.map(fetch_comments, issues))
         
-        issues = resp.json()
+        # (author, issue number) for every issue reference in an open PR body, scanned once
+        pr_refs = {
+            (pr.get("user", {}).get("login"), int(ref))
+            for pr in prs_future.result()
+            for ref in _RE_ISSUE_REF.findall(pr.get("body") or "")
+        }
         
-        for issue in issues:
-            # Skip PRs (they show up in issues endpoint too)
-            if issue.get("pull_request"):
+        for issue, comments in issues_with_comments:
+            if comments is None:
                 continue
             
             issue_number = issue.get("number")
             issue_title = issue.get("title", "")
             
-            # Get comments for this issue
-            comments_url = f"https://api.github.com/repos/{REPO}/issues/{issue_number}/comments"
-            comments_resp = requests.get(comments_url, headers=github_headers(), timeout=15)
-            if comments_resp.status_code != 200:
+            # Only the first claim per issue counts
+            claim_idx = next((i for i, c in enumerate(comments) if _RE_CLAIM.search(c.get("body") or "")), None)
+            if claim_idx is None:
                 continue
+            claim = comments[claim_idx]
+            claimant = claim.get("user", {}).get("login", "Unknown")
+            claim_date = claim.get("created_at", "")[:10]
+            
+            # Look for stake TX in subsequent comments by same user
+            stake_tx = None
+            for c in comments[claim_idx:]:
+                if c.get("user", {}).get("login") == claimant:
+                    tx_match = _RE_SOLSCAN_TX.search(c.get("body") or "")
+                    if tx_match:
+                        stake_tx = tx_match.group(1)
+                        break
             
-            comments = comments_resp.json()
+            # Calculate status
+            status = "pending_stake"
+            if stake_tx:
+                status = "staked"
+            
+            # Check if the claimant has opened a PR mentioning this issue
+            if (claimant, issue_number) in pr_refs:
+                status = "pr_opened"
+            
+            # Check expiry (7 days)
+            if claim_date and status in ["pending_stake", "staked"]:
+                try:
+                    claim_dt = datetime.fromisoformat(claim_date)
+                    if datetime.now() - claim_dt > timedelta(days=7):
+                        status = "expired"
+                except:
+                    pass
             
-            for comment in comments:
-                body = comment.get("body", "").lower()
-                if "claiming" in body or "i claim" in body or "claim this" in body:
-                    claimant = comment.get("user", {}).get("login", "Unknown")
-                    claim_date = comment.get("created_at", "")[:10]
-                    
-                    # Look for stake TX in subsequent comments by same user
-                    stake_tx = None
-                    for c in comments:
-                        if c.get("user", {}).get("login") == claimant:
-                            tx_match = re.search(r'solscan\.io/tx/([A-Za-z0-9]+)', c.get("body", ""))
-                            if tx_match:
-                                stake_tx = tx_match.group(1)
-                                break
-                    
-                    # Calculate status
-                    status = "pending_stake"
-                    if stake_tx:
-                        status = "staked"
-                    
-                    # Check if PR opened (search PRs mentioning this issue)
-                    prs = get_open_prs()
-                    for pr in prs:
-                        pr_body = (pr.get("body") or "").lower()
-                        if f"#{issue_number}" in pr_body or f"closes #{issue_number}" in pr_body:
-                            if pr.get("user", {}).get("login") == claimant:
-                                status = "pr_opened"
-                                break
-                    
-                    # Check expiry (7 days)
-                    if claim_date and status in ["pending_stake", "staked"]:
-                        try:
-                            claim_dt = datetime.fromisoformat(claim_date)
-                            if datetime.now() - claim_dt > timedelta(days=7):
-                                status = "expired"
-                        except:
-                            pass
-                    
-                    claims.append({
-                        "issue_number": issue_number,
-                        "issue_title": issue_title,
-                        "claimant": claimant,
-                        "claim_date": claim_date,
-                        "stake_tx": stake_tx,
-                        "status": status
-                    })
-                    break  # Only first claim per issue
+            claims.append({
+                "issue_number": issue_number,
+                "issue_title": issue_title,
+                "claimant": claimant,
+                "claim_date": claim_date,
+                "stake_tx": stake_tx,
+                "status": status
+            })
         
         return claims
     except Exception as e:
@@ -267,86 +631,105 @@ def get_bounty_claims():
 
 def get_issue_title(issue_number):
     """Fetch issue title from GitHub."""
+    now = time.time()
+    cached = _issue_title_cache.get(issue_number)
+    if cached and now < cached[1]:
+        return cached[0]
+    
     url = f"https://api.github.com/repos/{REPO}/issues/{issue_number}"
     try:
-        resp = requests.get(url, headers=github_headers(), timeout=10)
+        resp = _gh_request("GET", url, timeout=10)
         if resp.status_code == 200:
-            return resp.json().get("title", "")
+            title = _gh_json(resp).get("title", "")
+            _issue_title_cache[issue_number] = (title, now + ISSUE_TITLE_TTL)
+            return title
     except:
         pass
     return ""
 
+# Patterns for the PR body/title extractors below, compiled once
+_RE_WATT_AMOUNT = re.compile(r'(\d{1,3}(?:,?\d{3})*)\s*WATT', re.IGNORECASE)
+# "## Bounty\n50000" / "## Bounty Amount\n50000" section, or inline "Bounty: 50000 WATT"
+_RE_BOUNTY_BODY = re.compile(
+    r'(?i:##\s*Bounty(?:\s+Amount)?)[^\n]*\n\s*(\d{1,3}(?:,?\d{3})*)'
+    r'|[Bb]ounty[:\s]+(\d{1,3}(?:,?\d{3})*)\s*WATT')
+_RE_LINKED_ISSUE = re.compile(r'(?:closes|fixes|resolves)\s*#(\d+)', re.IGNORECASE)
+_RE_LABEL_AMOUNT = re.compile(r'(\d+)k?')
+# One separator run: a trailing \s* after [:\s=]+ matched the same text and made long runs of
+# whitespace backtrack quadratically
+_RE_CALLBACK_URL = re.compile(r'callback_url[:\s=]+(https?://\S+)', re.IGNORECASE)
+_RE_WALLET_PATTERNS = [
+    re.compile(r'##\s*Wallet[:\s]*([1-9A-HJ-NP-Za-km-z]{32,44})', re.IGNORECASE),  # ## Wallet section
+    re.compile(r'wallet[:\s=]+([1-9A-HJ-NP-Za-km-z]{32,44})', re.IGNORECASE),  # wallet: <address>
+    # Raw Solana address (43-44 chars typical). Case-sensitive: the class already lists both
+    # cases, and IGNORECASE would both slow every offset's class test and admit I/O/l
+    re.compile(r'\b([1-9A-HJ-NP-Za-km-z]{43,44})\b'),
+]
+
 def extract_bounty_amount(title="", body="", labels=None):
     """Extract bounty amount from PR title, body, linked issue, or labels."""
-    import re
-    
     # 1. Try PR title: "[BOUNTY] Description - 10000 WATT"
     if title:
-        match = re.search(r'(\d{1,3}(?:,?\d{3})*)\s*WATT', title, re.IGNORECASE)
+        match = _RE_WATT_AMOUNT.search(title)
         if match:
             return int(match.group(1).replace(',', ''))
     
-    # 2. Try PR body: "## Bounty\n50000 WATT" or "## Bounty Amount\n50000"
+    # 2. Try PR body: "## Bounty\n50000 WATT", "## Bounty Amount\n50000" or "Bounty: 50000 WATT"
     if body:
-        # Match ## Bounty or ## Bounty Amount section
-        match = re.search(r'##\s*Bounty(?:\s+Amount)?[^\n]*\n\s*(\d{1,3}(?:,?\d{3})*)', body, re.IGNORECASE)
-        if match:
-            return int(match.group(1).replace(',', ''))
-        
-        # Also try inline: "Bounty: 50000 WATT"
-        match = re.search(r'[Bb]ounty[:\s]+(\d{1,3}(?:,?\d{3})*)\s*WATT', body)
-        if match:
-            return int(match.group(1).replace(',', ''))
+        # One pass over the body; a ## Bounty section wins over an earlier inline mention
+        inline = None
+        for match in _RE_BOUNTY_BODY.finditer(body):
+            if match.group(1) is not None:
+                return int(match.group(1).replace(',', ''))
+            inline = inline or match
+        if inline:
+            return int(inline.group(2).replace(',', ''))
         
         # 3. Try linked issue: "Closes #6" or "Fixes #6"
-        issue_match = re.search(r'(?:closes|fixes|resolves)\s*#(\d+)', body, re.IGNORECASE)
+        issue_match = _RE_LINKED_ISSUE.search(body)
         if issue_match:
             issue_number = int(issue_match.group(1))
             issue_title = get_issue_title(issue_number)
             if issue_title:
                 # Look for bounty amount in issue title: "[BOUNTY: 100,000 WATT]"
-                amount_match = re.search(r'(\d{1,3}(?:,?\d{3})*)\s*WATT', issue_title, re.IGNORECASE)
+                amount_match = _RE_WATT_AMOUNT.search(issue_title)
                 if amount_match:
                     return int(amount_match.group(1).replace(',', ''))
     
     # 4. Fallback to labels
     if labels:
         for label in labels:
-            if "bounty" in label.lower():
-                match = re.search(r'(\d+)k?', label.lower())
+            label = label.lower()
+            if "bounty" in label:
+                match = _RE_LABEL_AMOUNT.search(label)
                 if match:
                     amount = int(match.group(1))
-                    if 'k' in label.lower():
+                    if 'k' in label:
                         amount *= 1000
                     return amount
     
     return 0
 
+@functools.lru_cache(maxsize=512)
 def extract_callback_url(body):
     """Extract callback_url from PR body."""
-    import re
     if not body:
         return None
     # Look for callback_url: https://... or callback_url=https://...
-    match = re.search(r'callback_url[:\s=]+\s*(https?://[^\s\n]+)', body, re.IGNORECASE)
+    match = _RE_CALLBACK_URL.search(body)
     if match:
         return match.group(1).strip()
     return None
 
+@functools.lru_cache(maxsize=512)
 def extract_wallet(body):
     """Extract Solana wallet address from PR body."""
-    import re
     if not body:
         return None
     # Look for wallet in ## Wallet section or wallet: <address>
     # Solana addresses are base58, typically 32-44 chars
-    patterns = [
-        r'##\s*Wallet[:\s]*\n*\s*([1-9A-HJ-NP-Za-km-z]{32,44})',  # ## Wallet section
-        r'wallet[:\s=]+\s*([1-9A-HJ-NP-Za-km-z]{32,44})',  # wallet: <address>
-        r'\b([1-9A-HJ-NP-Za-km-z]{43,44})\b'  # Raw Solana address (43-44 chars typical)
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, body, re.IGNORECASE)
+    for pattern in _RE_WALLET_PATTERNS:
+        match = pattern.search(body)
         if match:
             return match.group(1).strip()
     return None
@@ -370,13 +753,11 @@ def close_pr(pr_number):
     """Close a PR on GitHub."""
     url = f"https://api.github.com/repos/{REPO}/pulls/{pr_number}"
     try:
-        resp = requests.patch(
-            url, 
-            headers=github_headers(), 
-            json={"state": "closed"},
-            timeout=15
-        )
-        return resp.status_code == 200
+        resp = _gh_request("PATCH", url, json={"state": "closed"}, timeout=15)
+        if resp.status_code == 200:
+            _invalidate_open_prs()
+            return True
+        return False
     except Exception as e:
         print(f"Failed to close PR #{pr_number}: {e}")
         return False
@@ -385,20 +766,162 @@ def close_pr(pr_number):
 # AI REVIEW
 # =============================================================================
 
+# Token budgets for the PR description + diff in each review prompt; the diff gets whatever
+# the description leaves over
+_REVIEW_BODY_TOKENS = 400
+_REVIEW_TOKENS = 4000
+_INTERNAL_REVIEW_BODY_TOKENS = 500
+_INTERNAL_REVIEW_TOKENS = 3500
+
+@functools.lru_cache(maxsize=1)
+def _token_encoding():
+    """tiktoken's cl100k_base encoding, or None if tiktoken is missing or can't load it."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+def _cap_tokens(text, max_tokens):
+    """Truncate text to at most max_tokens tokens. Returns (text, tokens used)."""
+    enc = _token_encoding()
+    if enc is None:
+        text = text[:max_tokens * 4]
+        return text, (len(text) + 3) // 4
+    tokens = enc.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text, len(tokens)
+    return enc.decode(tokens[:max_tokens]), max_tokens
+
+# Files whose diffs are noise to a reviewer: lockfiles, minified bundles, binaries
+_RE_DIFF_NOISE_FILE = re.compile(r'(?:package-lock\.json|yarn\.lock|pnpm-lock\.yaml|poetry\.lock|\.min\.(?:js|css))$')
+
+def _truncate_diff(text, limit=15000):
+    """Cut a diff to at most limit chars at a file or hunk boundary, never mid-hunk."""
+    if len(text) <= limit:
+        return text
+    head = text[:limit]
+    cut = head.rfind("\ndiff --git ")
+    if cut < limit // 2:
+        cut = max(cut, head.rfind("\n@@"))
+    if cut <= 0:
+        cut = head.rfind("\n")
+    return head[:cut] if cut > 0 else head
+
+def _review_diff(diff, max_tokens):
+    """The minimized diff for a review prompt, capped to max_tokens at a hunk boundary."""
+    minimized = _minimize_diff(diff)
+    capped, _ = _cap_tokens(minimized, max_tokens)
+    return minimized if len(capped) == len(minimized) else _truncate_diff(minimized, len(capped))
+
+def _minimize_diff(diff, max_lines_per_file=200, keep_context=1):
+    """Shrink a unified diff for the AI prompt.
+
+    Keeps file/hunk headers and changed lines with keep_context lines around them, collapses
+    other context runs to "..." and lockfile/minified/binary files to a one-line marker, and
+    caps each file at max_lines_per_file lines.
+    """
+    if not diff:
+        return diff
+    out = []
+    for section in re.split(r'(?m)^(?=diff --git )', diff):
+        if not section:
+            continue
+        lines = section.split("\n")
+        header = lines[0]
+        path = header.rsplit(" b/", 1)[-1]
+        if _RE_DIFF_NOISE_FILE.search(path) or any(l.startswith("Binary files ") for l in lines[:6]):
+            out.append(header)
+            out.append(f"[... {len(lines) - 1} lines elided (generated/binary file)]")
+            continue
+        
+        # Context lines worth keeping: those within keep_context of a +/- line
+        changed = [i for i, l in enumerate(lines) if l[:1] in ("+", "-") and not l.startswith(("+++", "---"))]
+        keep = set()
+        for i in changed:
+            keep.update(range(i - keep_context, i + keep_context + 1))
+        
+        kept, skipped, in_hunk = [], [], False
+        for i, line in enumerate(lines + [None]):
+            if line is not None:
+                if line.startswith("@@"):
+                    in_hunk = True
+                elif in_hunk and line[:1] not in ("+", "-", "\\") and i not in keep:
+                    skipped.append(line)
+                    continue
+            # A lone context line costs about as much as the marker, so keep it
+            if len(skipped) > 1:
+                kept.append("...")
+            else:
+                kept.extend(skipped)
+            skipped = []
+            if line is not None:
+                kept.append(line)
+        if len(kept) > max_lines_per_file:
+            kept = kept[:max_lines_per_file] + [f"[... {len(kept) - max_lines_per_file} more lines in this file]"]
+        out.extend(kept)
+    return "\n".join(out)
+
+def _extract_json(content):
+    """The JSON object in an AI reply: the whole reply if it parses, else the first balanced {...}."""
+    try:
+        parsed = json.loads(content.strip())
+        return parsed if isinstance(parsed, dict) else None
+    except ValueError:
+        pass
+    start = content.find("{")
+    if start < 0:
+        return None
+    depth, in_str, escaped = 0, False, False
+    for i in range(start, len(content)):
+        ch = content[i]
+        if in_str:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            in_str = True
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                try:
+                    parsed = json.loads(content[start:i + 1])
+                except ValueError:
+                    return None
+                return parsed if isinstance(parsed, dict) else None
+    return None
+
+def _fail_on_concerns(parsed):
+    """Enforce on a parsed review: concerns listed → cannot pass or score 9+."""
+    if parsed.get("concerns"):
+        parsed["pass"] = False
+        score = parsed.get("score")
+        if isinstance(score, (int, float)) and score >= 9:
+            parsed["score"] = 8
+
 def call_ai_review(pr_info):
     """Send PR to AI for structured review with score."""
     if not AI_API_KEY:
         return {"error": "AI_API_KEY not configured"}
     
+    body, body_tokens = _cap_tokens(pr_info['body'], _REVIEW_BODY_TOKENS)
+    diff = _review_diff(pr_info['diff'], _REVIEW_TOKENS - body_tokens)
+    
     prompt = f"""You are a strict code reviewer for the WattCoin project — a production Solana utility token with live payments.
 
 PR #{pr_info['number']}: {pr_info['title']}
 Author: {pr_info['author']}
-Description: {pr_info['body'][:1500]}
+Description: {body}
 
 DIFF:
 ```
-{pr_info['diff']}
+{diff}
 ```
 
 Review for: functionality, code quality, security, scope match, breaking changes, dead code, test validity.
@@ -430,24 +953,14 @@ Do not include any text before or after the JSON."""
             return {"error": ai_error}
         
         # Parse structured JSON response
-        parsed = None
-        try:
-            import re
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                parsed = json.loads(json_match.group())
-                # Enforce: concerns listed → cannot pass
-                if parsed.get("concerns") and len(parsed["concerns"]) > 0:
-                    parsed["pass"] = False
-                    if parsed.get("score", 0) >= 9:
-                        parsed["score"] = 8
-        except (json.JSONDecodeError, Exception):
-            pass
+        parsed = _extract_json(content)
+        if parsed:
+            _fail_on_concerns(parsed)
         
         result = {
             "success": True,
             "review": content,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": _now_iso()
         }
         
         if parsed:
@@ -488,6 +1001,9 @@ def call_ai_review_internal(pr_info):
         print("[INTERNAL-REVIEW] WSI_INTERNAL_CONTEXT not set — falling back to generic review", flush=True)
         return call_ai_review(pr_info)
 
+    body, body_tokens = _cap_tokens(pr_info.get('body') or 'No description', _INTERNAL_REVIEW_BODY_TOKENS)
+    diff = _review_diff(pr_info['diff'], _INTERNAL_REVIEW_TOKENS - body_tokens)
+
     prompt = f"""You are the senior code reviewer for WattCoin's internal development pipeline. Your reviews serve dual purposes: (1) ensuring production quality for critical infrastructure, and (2) generating high-fidelity training data for WSI, WattCoin's self-improving code intelligence model.
 
 {internal_context}
@@ -502,11 +1018,11 @@ PR Details:
 - Additions: +{pr_info.get('additions', 0)} / Deletions: -{pr_info.get('deletions', 0)}
 
 PR Description:
-{(pr_info.get('body') or 'No description')[:2000]}
+{body}
 
 Code Diff:
 ```diff
-{pr_info['diff'][:12000]}
+{diff}
 ```
 
 ---
@@ -583,24 +1099,14 @@ Do not include any text before or after the JSON."""
             return {"error": ai_error}
 
         # Parse structured JSON response
-        parsed = None
-        try:
-            import re
-            json_match = re.search(r'\{.*\}', content, re.DOTALL)
-            if json_match:
-                parsed = json.loads(json_match.group())
-                # Enforce: concerns listed → cannot pass
-                if parsed.get("concerns") and len(parsed["concerns"]) > 0:
-                    parsed["pass"] = False
-                    if parsed.get("score", 0) >= 9:
-                        parsed["score"] = 8
-        except (json.JSONDecodeError, Exception):
-            pass
+        parsed = _extract_json(content)
+        if parsed:
+            _fail_on_concerns(parsed)
 
         result = {
             "success": True,
             "review": content,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "prompt_version": "internal_v1.0"
         }
 
@@ -624,1344 +1130,100 @@ Do not include any text before or after the JSON."""
 # HTML TEMPLATES
 # =============================================================================
 
-LOGIN_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>WattCoin Admin - Login</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-</head>
-<body class="bg-gray-900 text-gray-100 min-h-screen flex items-center justify-center">
-    <div class="bg-gray-800 p-8 rounded-lg shadow-xl w-full max-w-md">
-        <h1 class="text-2xl font-bold text-green-400 mb-6">⚡ WattCoin Admin</h1>
-        {% if error %}
-        <div class="bg-red-900/50 border border-red-500 text-red-300 px-4 py-2 rounded mb-4">{{ error }}</div>
-        {% endif %}
-        <form method="POST">
-            <input type="password" name="password" placeholder="Password" 
-                   class="w-full bg-gray-700 border border-gray-600 rounded px-4 py-3 mb-4 focus:outline-none focus:border-green-400">
-            <button type="submit" class="w-full bg-green-500 hover:bg-green-600 text-black font-bold py-3 rounded transition">
-                Login
-            </button>
-        </form>
-    </div>
-</body>
-</html>
-"""
+_PRE_BLOCK = re.compile(r'(<pre\b.*?</pre>)', re.DOTALL)
+_LINE_INDENT = re.compile(r'\n\s+')
+_BLOCK_TAG_NEWLINE = re.compile(r'%\}\n')
 
-DASHBOARD_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PR Reviews & Payouts - WattCoin Admin</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-</head>
-<body class="bg-gray-900 text-gray-100 min-h-screen">
-    <div class="max-w-6xl mx-auto p-6">
-        <!-- Header -->
-        <div class="flex justify-between items-center mb-4">
-            <div>
-                <h1 class="text-2xl font-bold text-green-400">⚡ WattCoin Admin</h1>
-                <p class="text-gray-500 text-sm">v3.8.0 | PR Reviews & Bounty Payouts | Pass threshold: ≥9/10</p>
-            </div>
-            <div class="flex items-center gap-3">
-                <!-- System Health -->
-                <div id="health-widget" class="flex items-center gap-2 bg-gray-800 rounded-lg px-3 py-2">
-                    <span id="health-dot" class="w-3 h-3 rounded-full bg-gray-600 animate-pulse"></span>
-                    <div class="text-xs">
-                        <span id="health-label" class="text-gray-500">Checking...</span>
-                        <div id="health-detail" class="text-gray-600"></div>
-                    </div>
-                </div>
-                <!-- Webhook Status -->
-                <div id="webhook-widget" class="flex items-center gap-2 bg-gray-800 rounded-lg px-3 py-2">
-                    <span id="webhook-dot" class="w-3 h-3 rounded-full bg-gray-600 animate-pulse"></span>
-                    <div class="text-xs">
-                        <span id="webhook-label" class="text-gray-500">Webhooks...</span>
-                        <div id="webhook-detail" class="text-gray-600"></div>
-                    </div>
-                </div>
-                <!-- Payment Queue Badge -->
-                <div id="queue-widget" class="flex items-center gap-2 bg-gray-800 rounded-lg px-3 py-2" style="display:none;">
-                    <span class="w-3 h-3 rounded-full bg-yellow-400 animate-pulse"></span>
-                    <div class="text-xs">
-                        <span id="queue-label" class="text-yellow-400">⏳ Payments</span>
-                        <div id="queue-detail" class="text-yellow-500"></div>
-                    </div>
-                </div>
-                <!-- Active Nodes -->
-                <div id="nodes-widget" class="flex items-center gap-2 bg-gray-800 rounded-lg px-3 py-2">
-                    <span class="text-xs">🖥️</span>
-                    <div class="text-xs">
-                        <span id="nodes-label" class="text-gray-500">Nodes</span>
-                        <div id="nodes-detail" class="text-gray-600">...</div>
-                    </div>
-                </div>
-                <a href="{{ url_for('admin.logout') }}" class="text-gray-400 hover:text-red-400 text-sm">Logout</a>
-            </div>
-        </div>
-        
-        <!-- Nav Tabs -->
-        <div class="flex gap-1 mb-6 border-b border-gray-700">
-            <a href="{{ url_for('admin.dashboard') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-green-400 text-green-400">
-                🎯 PR Bounties
-            </a>
-            <a href="{{ url_for('admin.submissions') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                📋 Agent Tasks
-            </a>
-
-            <a href="{{ url_for('internal.internal_page') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🔧 Internal Pipeline
-            </a>
-            <a href="{{ url_for('admin.api_keys') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🔑 Scraper Keys
-            </a>
-            <a href="{{ url_for('admin.clear_data') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🗑️ Clear Data
-            </a>
-            <a href="{{ url_for('admin.security_scan') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🔒 Security Scan
-            </a>
-        </div>
-        
-        {% if message %}
-        <div class="bg-green-900/50 border border-green-500 text-green-300 px-4 py-2 rounded mb-6">{{ message }}</div>
-        {% endif %}
-        
-        {% if error %}
-        <div class="bg-red-900/50 border border-red-500 text-red-300 px-4 py-2 rounded mb-6">{{ error }}</div>
-        {% endif %}
-        
-        <!-- Stats -->
-        <div class="grid grid-cols-3 gap-4 mb-8">
-            <div class="bg-gray-800 rounded-lg p-4">
-                <div class="text-3xl font-bold text-blue-400">{{ stats.open_prs }}</div>
-                <div class="text-gray-500 text-sm">Open PRs</div>
-            </div>
-            <div class="bg-gray-800 rounded-lg p-4">
-                <div class="text-3xl font-bold text-green-400">{{ stats.approved }}</div>
-                <div class="text-gray-500 text-sm">Approved</div>
-            </div>
-            <div class="bg-gray-800 rounded-lg p-4">
-                <div class="text-3xl font-bold text-red-400">{{ stats.rejected }}</div>
-                <div class="text-gray-500 text-sm">Rejected</div>
-            </div>
-        </div>
-        
-        <!-- Payment Queue Detail -->
-        <div id="queue-detail-section" class="mb-8" style="display:none;">
-            <div class="flex justify-between items-center mb-3">
-                <h2 class="text-lg font-semibold text-yellow-400">⏳ Pending Payments</h2>
-                <button onclick="processQueue()" class="px-3 py-1 bg-green-600 hover:bg-green-700 text-white text-sm font-bold rounded transition">
-                    ⚡ Process All
-                </button>
-            </div>
-            <div id="queue-items" class="space-y-2"></div>
-        </div>
-        
-        <!-- PR List -->
-        <div class="flex justify-between items-center mb-4">
-            <h2 class="text-xl font-semibold">Open Pull Requests</h2>
-            {% if prs %}
-            <form method="POST" action="{{ url_for('admin.close_all_prs') }}"
-                  onsubmit="return confirm('Close ALL {{ prs|length }} open PRs?')">
-                <button type="submit" class="px-4 py-2 bg-red-600 hover:bg-red-700 text-white font-bold rounded transition text-sm">
-                    ❌ Close All ({{ prs|length }})
-                </button>
-            </form>
-            {% endif %}
-        </div>
-        
-        {% if prs %}
-        <div class="space-y-4">
-            {% for pr in prs %}
-            <div class="bg-gray-800 rounded-lg p-4 border-l-4 {% if pr.number|string in reviews %}{% if reviews[pr.number|string].get('passed') %}border-green-500{% elif reviews[pr.number|string].get('score') %}border-red-500{% else %}border-blue-500{% endif %}{% else %}border-gray-600{% endif %}">
-                <div class="flex justify-between items-start">
-                    <div>
-                        <a href="{{ pr.html_url }}" target="_blank" class="text-lg font-medium hover:text-green-400">
-                            #{{ pr.number }} - {{ pr.title }}
-                        </a>
-                        <div class="text-gray-500 text-sm mt-1">
-                            by {{ pr.user.login }} • {{ pr.created_at[:10] }}
-                            {% for label in pr.labels %}
-                            <span class="ml-2 px-2 py-0.5 bg-gray-700 rounded text-xs">{{ label.name }}</span>
-                            {% endfor %}
-                        </div>
-                    </div>
-                    <div class="flex gap-2 items-center">
-                        {% if pr.number|string in reviews %}
-                            {% set rev = reviews[pr.number|string] %}
-                            {% if rev.get('score') %}
-                                {% if rev.get('passed') %}
-                                <span class="px-3 py-1 bg-green-900/50 text-green-400 rounded text-sm font-mono">✅ {{ rev.score }}/10 PASS</span>
-                                {% elif rev.score >= 7 %}
-                                <span class="px-3 py-1 bg-yellow-900/50 text-yellow-400 rounded text-sm font-mono">⚠️ {{ rev.score }}/10</span>
-                                {% else %}
-                                <span class="px-3 py-1 bg-red-900/50 text-red-400 rounded text-sm font-mono">❌ {{ rev.score }}/10 FAIL</span>
-                                {% endif %}
-                            {% elif rev.get('status') == 'approved' %}
-                                <span class="px-3 py-1 bg-green-900/50 text-green-400 rounded text-sm">✅ Merged</span>
-                            {% elif rev.get('status') == 'rejected' %}
-                                <span class="px-3 py-1 bg-red-900/50 text-red-400 rounded text-sm">❌ Rejected</span>
-                            {% else %}
-                                <span class="px-3 py-1 bg-blue-900/50 text-blue-400 rounded text-sm">Reviewed</span>
-                            {% endif %}
-                        {% endif %}
-                        <a href="{{ url_for('admin.pr_detail', pr_number=pr.number) }}" 
-                           class="px-4 py-1 bg-blue-600 hover:bg-blue-700 rounded text-sm transition">
-                            View
-                        </a>
-                        <form method="POST" action="{{ url_for('admin.close_pr_route', pr_number=pr.number) }}" 
-                              onsubmit="return confirm('Close PR #{{ pr.number }}?')" class="inline">
-                            <button type="submit" class="px-4 py-1 bg-red-600 hover:bg-red-700 rounded text-sm transition">
-                                Close
-                            </button>
-                        </form>
-                    </div>
-                </div>
-                {% if pr.number|string in reviews and reviews[pr.number|string].get('feedback') %}
-                <div class="mt-2 text-gray-400 text-sm">{{ reviews[pr.number|string].feedback[:120] }}{% if reviews[pr.number|string].feedback|length > 120 %}...{% endif %}</div>
-                {% endif %}
-            </div>
-            {% endfor %}
-        </div>
-        {% else %}
-        <div class="bg-gray-800 rounded-lg p-8 text-center text-gray-500">
-            No open pull requests
-        </div>
-        {% endif %}
-        
-        <!-- Manual Payment Queue -->
-        <div class="mt-8 pt-6 border-t border-gray-700">
-            <div class="flex justify-between items-center mb-4">
-                <h2 class="text-xl font-semibold">💳 Manual Payment</h2>
-                <div class="flex gap-3">
-                    <form method="POST" action="{{ url_for('admin.clear_payment_queue') }}" 
-                          onsubmit="return confirm('Clear all pending payments from queue?')">
-                        <button type="submit" class="px-4 py-2 bg-red-600 hover:bg-red-700 text-white font-bold rounded transition">
-                            🗑️ Clear Queue
-                        </button>
-                    </form>
-                    <button onclick="processQueue()" id="process-btn" 
-                            class="px-4 py-2 bg-green-600 hover:bg-green-700 text-white font-bold rounded transition flex items-center gap-2">
-                        ⚡ Process Payment Queue
-                    </button>
-                </div>
-            </div>
-            <div id="process-result" class="mb-4 hidden"></div>
-            
-            <div class="bg-gray-800 rounded-lg p-5">
-                <p class="text-gray-400 text-sm mb-4">Queue a payment for a merged PR that missed auto-payment (e.g. wallet was missing at merge time).</p>
-                <form method="POST" action="{{ url_for('admin.queue_manual_payment') }}" class="grid grid-cols-2 gap-4">
-                    <div>
-                        <label class="block text-gray-400 text-xs mb-1">PR Number *</label>
-                        <input type="number" name="pr_number" required placeholder="e.g. 75"
-                               class="w-full bg-gray-700 border border-gray-600 rounded px-3 py-2 text-sm focus:outline-none focus:border-green-400">
-                    </div>
-                    <div>
-                        <label class="block text-gray-400 text-xs mb-1">Bounty Issue # (optional)</label>
-                        <input type="number" name="bounty_issue_id" placeholder="e.g. 44"
-                               class="w-full bg-gray-700 border border-gray-600 rounded px-3 py-2 text-sm focus:outline-none focus:border-green-400">
-                    </div>
-                    <div>
-                        <label class="block text-gray-400 text-xs mb-1">Wallet Address *</label>
-                        <input type="text" name="wallet" required placeholder="Solana wallet address" minlength="32" maxlength="44"
-                               class="w-full bg-gray-700 border border-gray-600 rounded px-3 py-2 text-sm font-mono focus:outline-none focus:border-green-400">
-                    </div>
-                    <div>
-                        <label class="block text-gray-400 text-xs mb-1">Amount (WATT) *</label>
-                        <input type="number" name="amount" required placeholder="e.g. 5000" min="1" max="100000"
-                               class="w-full bg-gray-700 border border-gray-600 rounded px-3 py-2 text-sm focus:outline-none focus:border-green-400">
-                    </div>
-                    <div class="col-span-2">
-                        <label class="block text-gray-400 text-xs mb-1">Reason</label>
-                        <input type="text" name="reason" value="Late payout - wallet missing at merge time" 
-                               class="w-full bg-gray-700 border border-gray-600 rounded px-3 py-2 text-sm focus:outline-none focus:border-green-400">
-                    </div>
-                    <div class="col-span-2">
-                        <button type="submit" class="px-4 py-2 bg-yellow-600 hover:bg-yellow-700 text-black font-bold rounded transition">
-                            📥 Queue Payment
-                        </button>
-                        <span class="text-gray-500 text-xs ml-3">Queues only — hit "Process Payment Queue" to send on-chain.</span>
-                    </div>
-                </form>
-            </div>
-        </div>
-        
-        <!-- SwarmSolve Solutions Status -->
-        <div class="mt-8 pt-6 border-t border-gray-700">
-            <h2 class="text-xl font-semibold mb-4">🔬 SwarmSolve Solutions</h2>
-            <div id="swarmsolve-section">
-                <div class="text-gray-500 text-sm">Loading solutions...</div>
-            </div>
-        </div>
-        
-        <!-- Navigation Links -->
-        <div class="mt-8 pt-6 border-t border-gray-700 flex justify-between items-center">
-            <div class="flex gap-6">
-                <a href="{{ url_for('admin.payouts') }}" class="text-green-400 hover:text-green-300">
-                    💰 Payout Queue
-                </a>
-                <a href="{{ url_for('admin.claims') }}" class="text-blue-400 hover:text-blue-300">
-                    🎯 Bounty Claims
-                </a>
-            </div>
-        </div>
-    </div>
-    
-    <script>
-        async function processQueue() {
-            const btn = document.getElementById('process-btn');
-            const resultDiv = document.getElementById('process-result');
-            
-            btn.disabled = true;
-            btn.textContent = '⏳ Processing...';
-            resultDiv.className = 'mb-4 bg-gray-800 rounded-lg p-4';
-            resultDiv.innerHTML = '<span class="text-yellow-400">Processing payments...</span>';
-            
-            try {
-                const resp = await fetch('{{ url_for("admin.process_payment_queue") }}', { method: 'POST' });
-                const data = await resp.json();
-                
-                if (data.success && data.results && data.results.length > 0) {
-                    resultDiv.innerHTML = '<div class="text-green-400 font-bold mb-2">Payment Results:</div>' +
-                        data.results.map(r => '<div class="text-sm py-1">' + r + '</div>').join('');
-                } else if (data.success && data.processed === 0) {
-                    resultDiv.innerHTML = '<span class="text-gray-400">No pending payments in queue.</span>';
-                } else {
-                    resultDiv.innerHTML = '<span class="text-red-400">Error: ' + (data.message || 'Unknown error') + '</span>';
-                }
-            } catch (err) {
-                resultDiv.innerHTML = '<span class="text-red-400">Request failed: ' + err.message + '</span>';
-            }
-            
-            btn.disabled = false;
-            btn.textContent = '⚡ Process Payment Queue';
-            
-            // Refresh webhook health to update badge
-            checkWebhooks();
-        }
-        
-        async function checkHealth() {
-            const dot = document.getElementById('health-dot');
-            const label = document.getElementById('health-label');
-            const detail = document.getElementById('health-detail');
-            
-            try {
-                const resp = await fetch('/health', { timeout: 5000 });
-                const data = await resp.json();
-                
-                if (data.status === 'ok') {
-                    dot.className = 'w-3 h-3 rounded-full bg-green-400 shadow-lg shadow-green-400/50';
-                    label.textContent = 'System Online';
-                    label.className = 'text-green-400';
-                    
-                    // Format uptime
-                    const secs = data.uptime_seconds || 0;
-                    const hrs = Math.floor(secs / 3600);
-                    const mins = Math.floor((secs % 3600) / 60);
-                    const uptimeStr = hrs > 0 ? hrs + 'h ' + mins + 'm' : mins + 'm';
-                    detail.textContent = 'v' + (data.version || '?') + ' · ' + uptimeStr + ' uptime';
-                    detail.className = 'text-gray-500';
-                    
-                    // Active nodes/jobs
-                    const nodesLabel = document.getElementById('nodes-label');
-                    const nodesDetail = document.getElementById('nodes-detail');
-                    const jobs = data.active_jobs || 0;
-                    nodesLabel.textContent = 'Active Jobs';
-                    nodesLabel.className = jobs > 0 ? 'text-blue-400' : 'text-gray-400';
-                    nodesDetail.textContent = jobs + ' running';
-                    nodesDetail.className = jobs > 0 ? 'text-blue-300' : 'text-gray-500';
-                } else {
-                    dot.className = 'w-3 h-3 rounded-full bg-yellow-400 shadow-lg shadow-yellow-400/50';
-                    label.textContent = 'Degraded';
-                    label.className = 'text-yellow-400';
-                    detail.textContent = data.status || 'Unknown status';
-                }
-            } catch (err) {
-                dot.className = 'w-3 h-3 rounded-full bg-red-500 shadow-lg shadow-red-500/50';
-                label.textContent = 'System Offline';
-                label.className = 'text-red-400';
-                detail.textContent = 'Health check failed';
-                detail.className = 'text-red-500';
-            }
-        }
-        
-        async function checkWebhooks() {
-            const dot = document.getElementById('webhook-dot');
-            const label = document.getElementById('webhook-label');
-            const wDetail = document.getElementById('webhook-detail');
-            const queueWidget = document.getElementById('queue-widget');
-            const queueLabel = document.getElementById('queue-label');
-            const queueDetail = document.getElementById('queue-detail');
-            
-            try {
-                const resp = await fetch('/webhooks/health', { timeout: 5000 });
-                const data = await resp.json();
-                
-                if (data.status === 'ok' && data.webhook_secret_configured) {
-                    dot.className = 'w-3 h-3 rounded-full bg-green-400 shadow-lg shadow-green-400/50';
-                    label.textContent = 'Webhooks OK';
-                    label.className = 'text-green-400';
-                    wDetail.textContent = 'Secret configured';
-                    wDetail.className = 'text-gray-500';
-                } else if (data.status === 'ok') {
-                    dot.className = 'w-3 h-3 rounded-full bg-yellow-400 shadow-lg shadow-yellow-400/50';
-                    label.textContent = 'Webhooks ⚠️';
-                    label.className = 'text-yellow-400';
-                    wDetail.textContent = 'No secret set';
-                    wDetail.className = 'text-yellow-500';
-                }
-                
-                // Payment queue badge
-                const pending = data.pending_payments || 0;
-                if (pending > 0) {
-                    queueWidget.style.display = 'flex';
-                    queueLabel.textContent = '⏳ ' + pending + ' Payment' + (pending > 1 ? 's' : '');
-                    queueDetail.textContent = 'Pending in queue';
-                } else {
-                    queueWidget.style.display = 'none';
-                }
-            } catch (err) {
-                dot.className = 'w-3 h-3 rounded-full bg-red-500 shadow-lg shadow-red-500/50';
-                label.textContent = 'Webhooks Down';
-                label.className = 'text-red-400';
-                wDetail.textContent = 'Check failed';
-                wDetail.className = 'text-red-500';
-            }
-        }
-        
-        // Check on load, then every 30s
-        checkHealth();
-        checkWebhooks();
-        loadSwarmSolve();
-        loadQueueDetail();
-        setInterval(checkHealth, 30000);
-        setInterval(checkWebhooks, 30000);
-        setInterval(loadQueueDetail, 30000);
-        
-        async function loadQueueDetail() {
-            const section = document.getElementById('queue-detail-section');
-            const items = document.getElementById('queue-items');
-            try {
-                const resp = await fetch('{{ url_for("admin.api_queue") }}');
-                const data = await resp.json();
-                const pending = data.pending || [];
-                
-                if (pending.length === 0) {
-                    section.style.display = 'none';
-                    return;
-                }
-                
-                section.style.display = 'block';
-                let html = '';
-                for (const p of pending) {
-                    const wallet = p.wallet || '';
-                    const short = wallet.length > 12 ? wallet.substring(0,4) + '...' + wallet.slice(-4) : wallet;
-                    const age = p.queued_ago || '';
-                    html += '<div class="bg-yellow-900/20 border border-yellow-700 rounded-lg px-4 py-3 flex justify-between items-center">';
-                    html += '<div>';
-                    html += '<span class="text-yellow-400 font-medium">PR #' + p.pr_number + '</span>';
-                    html += ' → <code class="text-gray-400 text-xs">' + short + '</code>';
-                    html += ' • <span class="text-white font-bold">' + (p.amount ? p.amount.toLocaleString() : '?') + ' WATT</span>';
-                    if (p.author) html += ' • <span class="text-gray-500">@' + p.author + '</span>';
-                    html += '</div>';
-                    html += '<div class="text-gray-500 text-xs">' + age + '</div>';
-                    html += '</div>';
-                }
-                items.innerHTML = html;
-            } catch (err) {
-                section.style.display = 'none';
-            }
-        }
-        
-        async function loadSwarmSolve() {
-            const section = document.getElementById('swarmsolve-section');
-            try {
-                const resp = await fetch('/api/v1/solutions');
-                const data = await resp.json();
-                const solutions = data.solutions || [];
-                
-                if (solutions.length === 0) {
-                    section.innerHTML = '<div class="bg-gray-800 rounded-lg p-6 text-center text-gray-500">No SwarmSolve solutions yet</div>';
-                    return;
-                }
-                
-                let html = '<div class="space-y-3">';
-                for (const s of solutions) {
-                    const statusColors = {
-                        'open': 'bg-blue-900/40 border-blue-600 text-blue-400',
-                        'approved': 'bg-green-900/40 border-green-600 text-green-400',
-                        'refunded': 'bg-gray-800 border-gray-600 text-gray-400',
-                        'expired': 'bg-gray-800 border-gray-600 text-gray-500'
-                    };
-                    const statusIcons = {
-                        'open': '🔵',
-                        'approved': '✅',
-                        'refunded': '↩️',
-                        'expired': '⏰'
-                    };
-                    const colors = statusColors[s.status] || 'bg-gray-800 border-gray-600 text-gray-400';
-                    const icon = statusIcons[s.status] || '❓';
-                    
-                    html += '<div class="' + colors + ' border rounded-lg p-4">';
-                    html += '<div class="flex justify-between items-start">';
-                    html += '<div>';
-                    html += '<div class="font-medium">' + icon + ' ' + (s.title || 'Untitled') + '</div>';
-                    html += '<div class="text-xs text-gray-500 mt-1">';
-                    html += 'ID: ' + (s.id || '-').substring(0, 12) + '... ';
-                    html += '• Budget: ' + (s.budget_watt ? s.budget_watt.toLocaleString() : '?') + ' WATT ';
-                    if (s.deadline_date) html += '• Deadline: ' + s.deadline_date;
-                    if (s.claim_count !== undefined && s.status === 'open') html += ' • Claims: ' + s.claim_count + '/' + (s.max_claims || 5);
-                    html += '</div>';
-                    html += '</div>';
-                    html += '<div class="flex items-center gap-2">';
-                    
-                    // Scan status badge
-                    if (s.status === 'approved') {
-                        html += '<span class="px-2 py-1 bg-green-900/50 text-green-400 rounded text-xs">🛡️ Scan Passed</span>';
-                    } else if (s.status === 'open') {
-                        html += '<span class="px-2 py-1 bg-gray-700 text-gray-400 rounded text-xs">🔍 Scan on approve</span>';
-                    }
-                    
-                    html += '<span class="px-2 py-1 bg-gray-700 rounded text-xs uppercase">' + s.status + '</span>';
-                    html += '</div>';
-                    html += '</div>';
-                    
-                    // Show GitHub issue link if exists
-                    if (s.github_issue_url) {
-                        html += '<div class="mt-2 text-xs"><a href="' + s.github_issue_url + '" target="_blank" class="text-blue-400 hover:underline">→ GitHub Issue</a></div>';
-                    }
-                    
-                    html += '</div>';
-                }
-                html += '</div>';
-                
-                section.innerHTML = html;
-            } catch (err) {
-                section.innerHTML = '<div class="bg-gray-800 rounded-lg p-4 text-red-400 text-sm">Failed to load solutions: ' + err.message + '</div>';
-            }
-        }
-    </script>
-</body>
-</html>
-"""
+def _minify_html(source):
+    """Drop indentation and blank lines from template source (once, as Jinja loads it).
 
-PR_DETAIL_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>PR #{{ pr.number }} - WattCoin Admin</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-</head>
-<body class="bg-gray-900 text-gray-100 min-h-screen">
-    <div class="max-w-4xl mx-auto p-6">
-        <!-- Back link -->
-        <a href="{{ url_for('admin.dashboard') }}" class="text-gray-500 hover:text-gray-300 text-sm mb-4 inline-block">
-            ← Back to Dashboard
-        </a>
-        
-        <!-- PR Header -->
-        <div class="bg-gray-800 rounded-lg p-6 mb-6">
-            <h1 class="text-xl font-bold mb-2">#{{ pr.number }} - {{ pr.title }}</h1>
-            <div class="text-gray-400 text-sm mb-4">
-                by <span class="text-blue-400">{{ pr.author }}</span> • 
-                <a href="{{ pr.url }}" target="_blank" class="text-green-400 hover:underline">View on GitHub</a>
-            </div>
-            
-            {% if pr.labels %}
-            <div class="mb-4">
-                {% for label in pr.labels %}
-                <span class="px-2 py-1 bg-gray-700 rounded text-xs mr-2">{{ label }}</span>
-                {% endfor %}
-            </div>
-            {% endif %}
-            
-            <div class="bg-gray-900 rounded p-4 text-sm">
-                <pre class="whitespace-pre-wrap">{{ pr.body or 'No description provided.' }}</pre>
-            </div>
-        </div>
-        
-        {% if message %}
-        <div class="bg-green-900/50 border border-green-500 text-green-300 px-4 py-2 rounded mb-6">{{ message }}</div>
-        {% endif %}
-        
-        {% if error %}
-        <div class="bg-red-900/50 border border-red-500 text-red-300 px-4 py-2 rounded mb-6">{{ error }}</div>
-        {% endif %}
-        
-        <!-- AI Review Section -->
-        <div class="bg-gray-800 rounded-lg p-6 mb-6">
-            <h2 class="text-lg font-semibold mb-4 flex items-center gap-2">
-                🤖 AI Review
-                {% if review %}
-                <span class="text-xs text-gray-500">{{ review.timestamp[:16] }}</span>
-                {% endif %}
-            </h2>
-            
-            {% if review %}
-            
-            <!-- Score Badge -->
-            {% if review.score %}
-            <div class="flex items-center gap-4 mb-4">
-                {% if review.get('passed') %}
-                <div class="px-4 py-2 bg-green-900/50 border border-green-600 rounded-lg text-green-400 font-bold text-lg">✅ {{ review.score }}/10 PASS</div>
-                {% elif review.score >= 7 %}
-                <div class="px-4 py-2 bg-yellow-900/50 border border-yellow-600 rounded-lg text-yellow-400 font-bold text-lg">⚠️ {{ review.score }}/10</div>
-                {% else %}
-                <div class="px-4 py-2 bg-red-900/50 border border-red-600 rounded-lg text-red-400 font-bold text-lg">❌ {{ review.score }}/10 FAIL</div>
-                {% endif %}
-                
-                {% if review.recommendation %}
-                <span class="text-gray-400 text-sm">{{ review.recommendation }}</span>
-                {% endif %}
-                {% if review.completeness %}
-                <span class="text-gray-500 text-sm">• {{ review.completeness }} complete</span>
-                {% endif %}
-                {% if review.suggested_payout %}
-                <span class="text-gray-500 text-sm">• Payout: {{ review.suggested_payout }}</span>
-                {% endif %}
-            </div>
-            {% endif %}
-            
-            <!-- Feedback -->
-            {% if review.feedback %}
-            <div class="bg-gray-900 rounded p-4 mb-4">
-                <div class="text-gray-300">{{ review.feedback }}</div>
-            </div>
-            {% endif %}
-            
-            <!-- Concerns -->
-            {% if review.concerns %}
-            <div class="bg-red-900/20 border border-red-800/50 rounded p-4 mb-4">
-                <div class="text-red-400 font-semibold text-sm mb-2">⚠️ Concerns ({{ review.concerns|length }})</div>
-                {% for c in review.concerns %}
-                <div class="text-red-300 text-sm py-1">• {{ c }}</div>
-                {% endfor %}
-            </div>
-            {% endif %}
-            
-            <!-- Suggested Changes -->
-            {% if review.suggested_changes %}
-            <div class="bg-blue-900/20 border border-blue-800/50 rounded p-4 mb-4">
-                <div class="text-blue-400 font-semibold text-sm mb-2">💡 Suggested Changes</div>
-                {% for s in review.suggested_changes %}
-                <div class="text-blue-300 text-sm py-1">• {{ s }}</div>
-                {% endfor %}
-            </div>
-            {% endif %}
-            
-            <!-- Raw Review (collapsible) -->
-            {% if review.review %}
-            <details class="mt-4">
-                <summary class="cursor-pointer text-gray-500 hover:text-gray-300 text-sm">View raw AI response</summary>
-                <div class="bg-gray-900 rounded p-4 mt-2">
-                    <pre class="whitespace-pre-wrap text-sm text-gray-400">{{ review.review }}</pre>
-                </div>
-            </details>
-            {% endif %}
-            
-            {% else %}
-            <p class="text-gray-500 mb-4">No AI review yet.</p>
-            {% endif %}
-            
-            <div class="mt-4">
-                <form method="POST" action="{{ url_for('admin.trigger_review', pr_number=pr.number) }}">
-                    <button type="submit" class="px-4 py-2 bg-orange-600 hover:bg-orange-700 rounded transition">
-                        {% if review %}🔄 Re-run AI Review{% else %}🚀 Run AI Review{% endif %}
-                    </button>
-                </form>
-            </div>
-        </div>
-        
-        <!-- Actions -->
-        <div class="bg-gray-800 rounded-lg p-6">
-            <h2 class="text-lg font-semibold mb-4">Actions</h2>
-            <div class="flex gap-4">
-                <form method="POST" action="{{ url_for('admin.approve_pr', pr_number=pr.number) }}" 
-                      onsubmit="return confirm('Approve and merge this PR?')">
-                    <button type="submit" class="px-6 py-2 bg-green-600 hover:bg-green-700 rounded font-medium transition">
-                        ✅ Approve & Merge
-                    </button>
-                </form>
-                <form method="POST" action="{{ url_for('admin.reject_pr', pr_number=pr.number) }}"
-                      onsubmit="return confirm('Reject this PR?')">
-                    <button type="submit" class="px-6 py-2 bg-red-600 hover:bg-red-700 rounded font-medium transition">
-                        ❌ Reject
-                    </button>
-                </form>
-            </div>
-        </div>
-        
-        <!-- Diff Preview -->
-        <div class="mt-6">
-            <details class="bg-gray-800 rounded-lg">
-                <summary class="p-4 cursor-pointer hover:bg-gray-750">View Diff ({{ pr.diff|length }} chars)</summary>
-                <div class="p-4 pt-0">
-                    <pre class="bg-gray-900 rounded p-4 text-xs overflow-x-auto">{{ pr.diff }}</pre>
-                </div>
-            </details>
-        </div>
-    </div>
-</body>
-</html>
-"""
-
-PAYOUTS_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Payout Queue - WattCoin Admin</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <style>
-        .toast {
-            position: fixed; bottom: 20px; right: 20px;
-            background: #10b981; color: #000; padding: 12px 20px;
-            border-radius: 8px; font-weight: 600; opacity: 0;
-            transition: opacity 0.3s; z-index: 1000;
-        }
-        .toast.show { opacity: 1; }
-        .toast.error { background: #ef4444; color: #fff; }
-        .spinner { animation: spin 1s linear infinite; }
-        @keyframes spin { to { transform: rotate(360deg); } }
-    </style>
-</head>
-<body class="bg-gray-900 text-gray-100 min-h-screen">
-    <div id="toast" class="toast"></div>
-    
-    <div class="max-w-5xl mx-auto p-6">
-        <!-- Header with wallet connection -->
-        <div class="flex justify-between items-center mb-4">
-            <a href="{{ url_for('admin.dashboard') }}" class="text-gray-500 hover:text-gray-300 text-sm">
-                ← Back to Dashboard
-            </a>
-            <div id="walletSection">
-                <button onclick="connectWallet()" id="connectBtn"
-                    class="px-4 py-2 bg-purple-600 hover:bg-purple-700 rounded text-sm font-medium transition">
-                    🔌 Connect Phantom
-                </button>
-            </div>
-        </div>
-        
-        <h1 class="text-2xl font-bold text-green-400 mb-6">💰 Payout Queue</h1>
-        
-        {% if payouts %}
-        <div class="bg-gray-800 rounded-lg overflow-hidden">
-            <table class="w-full">
-                <thead class="bg-gray-700">
-                    <tr>
-                        <th class="px-4 py-3 text-left text-sm">PR</th>
-                        <th class="px-4 py-3 text-left text-sm">Contributor</th>
-                        <th class="px-4 py-3 text-left text-sm">Amount</th>
-                        <th class="px-4 py-3 text-left text-sm">Status</th>
-                        <th class="px-4 py-3 text-left text-sm">Action</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {% for payout in payouts %}
-                    <tr class="border-t border-gray-700" id="row-{{ payout.pr_number }}">
-                        <td class="px-4 py-3">
-                            <a href="https://github.com/{{ repo }}/pull/{{ payout.pr_number }}" 
-                               target="_blank" class="text-blue-400 hover:underline">
-                                #{{ payout.pr_number }}
-                            </a>
-                        </td>
-                        <td class="px-4 py-3">
-                            {{ payout.author }}
-                            {% if payout.wallet %}
-                            <div class="text-xs text-gray-500 truncate max-w-[150px]" title="{{ payout.wallet }}">
-                                {{ payout.wallet[:8] }}...{{ payout.wallet[-4:] }}
-                            </div>
-                            {% endif %}
-                        </td>
-                        <td class="px-4 py-3 text-green-400 font-mono">{{ "{:,}".format(payout.amount) }} WATT</td>
-                        <td class="px-4 py-3">
-                            <span id="status-{{ payout.pr_number }}" class="px-2 py-1 rounded text-xs 
-                                {% if payout.status == 'pending' %}bg-yellow-900/50 text-yellow-400
-                                {% elif payout.status == 'paid' %}bg-green-900/50 text-green-400
-                                {% endif %}">
-                                {{ payout.status }}
-                            </span>
-                            {% if payout.tx_sig %}
-                            <a href="https://solscan.io/tx/{{ payout.tx_sig }}" target="_blank" 
-                               class="text-xs text-green-400 hover:underline ml-2" id="txlink-{{ payout.pr_number }}">TX ↗</a>
-                            {% else %}
-                            <span id="txlink-{{ payout.pr_number }}"></span>
-                            {% endif %}
-                        </td>
-                        <td class="px-4 py-3" id="actions-{{ payout.pr_number }}">
-                            {% if payout.status == 'pending' and payout.wallet %}
-                            <div class="flex gap-2">
-                                <button onclick="sendPayout('{{ payout.wallet }}', {{ payout.amount }}, {{ payout.pr_number }})"
-                                   class="px-3 py-1.5 bg-green-600 hover:bg-green-700 rounded text-sm font-medium transition inline-flex items-center gap-1"
-                                   id="payBtn-{{ payout.pr_number }}">
-                                    ⚡ Pay
-                                </button>
-                                <button onclick="copyWallet('{{ payout.wallet }}', {{ payout.amount }})"
-                                   class="px-3 py-1.5 bg-gray-600 hover:bg-gray-700 rounded text-sm font-medium transition"
-                                   title="Copy wallet for manual payment">
-                                    📋
-                                </button>
-                            </div>
-                            {% elif payout.status == 'pending' and not payout.wallet %}
-                            <span class="text-xs text-red-400">No wallet</span>
-                            {% else %}
-                            <span class="text-xs text-gray-500">✓ Complete</span>
-                            {% endif %}
-                        </td>
-                    </tr>
-                    {% endfor %}
-                </tbody>
-            </table>
-        </div>
-        
-        <div class="mt-6 p-4 bg-gray-800 rounded-lg">
-            <p class="text-sm text-gray-400">
-                <strong>Source Wallet:</strong> {{ bounty_wallet }} (bounty fund)
-            </p>
-            <p class="text-sm text-gray-500 mt-2" id="walletStatus">
-                Connect Phantom to pay directly, or use 📋 to copy wallet for manual payment.
-            </p>
-        </div>
-        {% else %}
-        <div class="bg-gray-800 rounded-lg p-8 text-center text-gray-500">
-            No pending payouts
-        </div>
-        {% endif %}
-    </div>
-    
-    <script type="module">
-        // Constants
-        const WATT_MINT = 'Gpmbh4PoQnL1kNgpMYDED3iv4fczcr7d3qNBLf8rpump';
-        const WATT_DECIMALS = 6;
-        const RPC_URL = 'https://solana.publicnode.com';
-        
-        // State
-        let walletConnected = false;
-        let walletPubkey = null;
-        
-        // Make functions globally available
-        window.connectWallet = connectWallet;
-        window.sendPayout = sendPayout;
-        window.copyWallet = copyWallet;
-        
-        // Toast helper
-        function showToast(msg, isError = false) {
-            const toast = document.getElementById('toast');
-            toast.textContent = msg;
-            toast.className = 'toast show' + (isError ? ' error' : '');
-            setTimeout(() => toast.classList.remove('show'), 4000);
-        }
-        
-        // Connect Phantom
-        async function connectWallet() {
-            try {
-                if (!window.solana || !window.solana.isPhantom) {
-                    window.open('https://phantom.app/', '_blank');
-                    showToast('Please install Phantom wallet', true);
-                    return;
-                }
-                
-                const resp = await window.solana.connect();
-                walletPubkey = resp.publicKey.toString();
-                walletConnected = true;
-                
-                document.getElementById('connectBtn').innerHTML = 
-                    '✓ ' + walletPubkey.slice(0,4) + '...' + walletPubkey.slice(-4);
-                document.getElementById('connectBtn').className = 
-                    'px-4 py-2 bg-green-600 rounded text-sm font-medium cursor-default';
-                document.getElementById('walletStatus').textContent = 
-                    'Connected: ' + walletPubkey.slice(0,8) + '...' + walletPubkey.slice(-8);
-                
-                showToast('Wallet connected!');
-            } catch (err) {
-                console.error(err);
-                showToast('Connection failed: ' + err.message, true);
-            }
-        }
-        
-        // Send payout via Phantom
-        async function sendPayout(recipientWallet, amount, prNumber) {
-            // If not connected, fall back to manual
-            if (!walletConnected) {
-                const txSig = prompt('Wallet not connected.\\n\\nEnter TX signature after manual payment (or Cancel):');
-                if (txSig !== null && txSig.trim()) {
-                    markPaidOnServer(prNumber, txSig.trim());
-                }
-                return;
-            }
-            
-            const btn = document.getElementById('payBtn-' + prNumber);
-            const originalText = btn.innerHTML;
-            btn.innerHTML = '<span class="spinner">⏳</span> Sending...';
-            btn.disabled = true;
-            
-            try {
-                // Dynamic import Solana libraries
-                const { Connection, PublicKey, Transaction } = await import('https://esm.sh/@solana/web3.js@1.87.6');
-                const { getAssociatedTokenAddress, createTransferInstruction, TOKEN_PROGRAM_ID } = 
-                    await import('https://esm.sh/@solana/spl-token@0.3.9');
-                
-                const connection = new Connection(RPC_URL, 'confirmed');
-                const mintPubkey = new PublicKey(WATT_MINT);
-                const recipientPubkey = new PublicKey(recipientWallet);
-                const senderPubkey = new PublicKey(walletPubkey);
-                
-                // Get token accounts
-                const senderATA = await getAssociatedTokenAddress(mintPubkey, senderPubkey);
-                const recipientATA = await getAssociatedTokenAddress(mintPubkey, recipientPubkey);
-                
-                // Build transfer instruction
-                const amountInSmallestUnit = BigInt(amount) * BigInt(10 ** WATT_DECIMALS);
-                const transferIx = createTransferInstruction(
-                    senderATA,
-                    recipientATA,
-                    senderPubkey,
-                    amountInSmallestUnit
-                );
-                
-                // Build transaction
-                const tx = new Transaction().add(transferIx);
-                tx.feePayer = senderPubkey;
-                const { blockhash } = await connection.getLatestBlockhash();
-                tx.recentBlockhash = blockhash;
-                
-                // Sign and send via Phantom
-                const signed = await window.solana.signTransaction(tx);
-                const signature = await connection.sendRawTransaction(signed.serialize());
-                
-                // Wait for confirmation
-                await connection.confirmTransaction(signature, 'confirmed');
-                
-                showToast('✓ Payment sent! TX: ' + signature.slice(0,8) + '...');
-                
-                // Mark as paid on server
-                markPaidOnServer(prNumber, signature);
-                
-                // Update UI immediately
-                updateRowToPaid(prNumber, signature);
-                
-            } catch (err) {
-                console.error(err);
-                btn.innerHTML = originalText;
-                btn.disabled = false;
-                
-                if (err.message.includes('User rejected')) {
-                    showToast('Transaction cancelled', true);
-                } else {
-                    showToast('Error: ' + err.message, true);
-                }
-            }
-        }
-        
-        // Mark paid on server
-        function markPaidOnServer(prNumber, txSig) {
-            fetch('/admin/payout/' + prNumber + '/paid?tx=' + encodeURIComponent(txSig))
-                .then(() => console.log('Server updated'))
-                .catch(err => console.error('Server update failed:', err));
-        }
-        
-        // Update row UI to show paid
-        function updateRowToPaid(prNumber, txSig) {
-            const statusEl = document.getElementById('status-' + prNumber);
-            const actionsEl = document.getElementById('actions-' + prNumber);
-            const txLinkEl = document.getElementById('txlink-' + prNumber);
-            
-            if (statusEl) {
-                statusEl.textContent = 'paid';
-                statusEl.className = 'px-2 py-1 rounded text-xs bg-green-900/50 text-green-400';
-            }
-            if (actionsEl) {
-                actionsEl.innerHTML = '<span class="text-xs text-gray-500">✓ Complete</span>';
-            }
-            if (txLinkEl) {
-                txLinkEl.innerHTML = '<a href="https://solscan.io/tx/' + txSig + '" target="_blank" ' +
-                    'class="text-xs text-green-400 hover:underline ml-2">TX ↗</a>';
-            }
-        }
-        
-        // Copy wallet fallback
-        function copyWallet(wallet, amount) {
-            navigator.clipboard.writeText(wallet).then(() => {
-                showToast('✓ Copied! Send ' + amount.toLocaleString() + ' WATT');
-            });
-        }
-        
-        // Auto-connect if already authorized
-        if (window.solana && window.solana.isPhantom) {
-            window.solana.connect({ onlyIfTrusted: true })
-                .then(resp => {
-                    walletPubkey = resp.publicKey.toString();
-                    walletConnected = true;
-                    document.getElementById('connectBtn').innerHTML = 
-                        '✓ ' + walletPubkey.slice(0,4) + '...' + walletPubkey.slice(-4);
-                    document.getElementById('connectBtn').className = 
-                        'px-4 py-2 bg-green-600 rounded text-sm font-medium cursor-default';
-                })
-                .catch(() => {}); // Not pre-authorized, that's fine
-        }
-    </script>
-</body>
-</html>
-"""
-
-CLAIMS_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Bounty Claims - WattCoin Admin</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-</head>
-<body class="bg-gray-900 text-gray-100 min-h-screen">
-    <div class="max-w-5xl mx-auto p-6">
-        <a href="{{ url_for('admin.dashboard') }}" class="text-gray-500 hover:text-gray-300 text-sm mb-4 inline-block">
-            ← Back to Dashboard
-        </a>
-        
-        <h1 class="text-2xl font-bold text-green-400 mb-6">🎯 Bounty Claims</h1>
-        
-        {% if claims %}
-        <div class="bg-gray-800 rounded-lg overflow-hidden">
-            <table class="w-full">
-                <thead class="bg-gray-700">
-                    <tr>
-                        <th class="px-4 py-3 text-left text-sm">Issue</th>
-                        <th class="px-4 py-3 text-left text-sm">Claimant</th>
-                        <th class="px-4 py-3 text-left text-sm">Date</th>
-                        <th class="px-4 py-3 text-left text-sm">Stake TX</th>
-                        <th class="px-4 py-3 text-left text-sm">Status</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {% for claim in claims %}
-                    <tr class="border-t border-gray-700">
-                        <td class="px-4 py-3">
-                            <a href="https://github.com/{{ repo }}/issues/{{ claim.issue_number }}" 
-                               target="_blank" class="text-blue-400 hover:underline">
-                                #{{ claim.issue_number }}
-                            </a>
-                            <div class="text-xs text-gray-500 truncate max-w-[200px]">{{ claim.issue_title }}</div>
-                        </td>
-                        <td class="px-4 py-3">
-                            <a href="https://github.com/{{ claim.claimant }}" target="_blank" class="hover:text-blue-400">
-                                {{ claim.claimant }}
-                            </a>
-                        </td>
-                        <td class="px-4 py-3 text-sm text-gray-400">{{ claim.claim_date }}</td>
-                        <td class="px-4 py-3">
-                            {% if claim.stake_tx %}
-                            <a href="https://solscan.io/tx/{{ claim.stake_tx }}" target="_blank" 
-                               class="text-xs text-green-400 hover:underline">
-                                {{ claim.stake_tx[:8] }}...
-                            </a>
-                            {% else %}
-                            <span class="text-xs text-gray-500">—</span>
-                            {% endif %}
-                        </td>
-                        <td class="px-4 py-3">
-                            <span class="px-2 py-1 rounded text-xs 
-                                {% if claim.status == 'pending_stake' %}bg-yellow-900/50 text-yellow-400
-                                {% elif claim.status == 'staked' %}bg-blue-900/50 text-blue-400
-                                {% elif claim.status == 'pr_opened' %}bg-green-900/50 text-green-400
-                                {% elif claim.status == 'expired' %}bg-red-900/50 text-red-400
-                                {% endif %}">
-                                {% if claim.status == 'pending_stake' %}Pending Stake
-                                {% elif claim.status == 'staked' %}Staked
-                                {% elif claim.status == 'pr_opened' %}PR Opened
-                                {% elif claim.status == 'expired' %}Expired
-                                {% endif %}
-                            </span>
-                        </td>
-                    </tr>
-                    {% endfor %}
-                </tbody>
-            </table>
-        </div>
-        {% else %}
-        <div class="bg-gray-800 rounded-lg p-8 text-center text-gray-500">
-            No bounty claims found
-        </div>
-        {% endif %}
-        
-        <div class="mt-6 p-4 bg-gray-800 rounded-lg">
-            <p class="text-sm text-gray-500">
-                Claims are detected by scanning issue comments for "Claiming" keyword.
-                Status updates when stake TX is posted or PR references the issue.
-            </p>
-        </div>
-    </div>
-</body>
-</html>
-"""
+    The newline after a {% block tag %} goes too, as Jinja's trim_blocks would drop it, but
+    only for these templates rather than app-wide. Other newlines are kept so inline <script>
+    comments stay terminated; <pre> blocks are left as-is.
+    """
+    parts = _PRE_BLOCK.split(source)
+    return "".join(
+        part if part.startswith("<pre") else _BLOCK_TAG_NEWLINE.sub("%}", _LINE_INDENT.sub("\n", part))
+        for part in parts
+    ).strip()
+
+class _MinifyAdminTemplates(Extension):
+    """Apply _minify_html to templates/admin/*.html as Jinja loads them."""
+    def preprocess(self, source, name, filename=None):
+        if name and name.startswith("admin/"):
+            return _minify_html(source)
+        return source
+
+@admin_bp.record_once
+def _register_template_minifier(state):
+    state.app.jinja_env.add_extension(_MinifyAdminTemplates)
+
+@admin_bp.record_once
+def _register_bytecode_cache(state):
+    """Keep compiled file templates in the temp dir so restarted workers skip the compile."""
+    if state.app.jinja_env.bytecode_cache is None:
+        state.app.jinja_env.bytecode_cache = FileSystemBytecodeCache(pattern="__wattcoin_jinja_%s.cache")
+
+@admin_bp.record_once
+def _precompile_templates(state):
+    """Load the admin page templates at registration so no request pays for compiling them."""
+    for name in ("_base", "login", "dashboard_head", "dashboard", "_macros", "pr_detail", "payouts_head", "payouts",
+                 "claims_head", "claims", "api_keys", "clear_data", "security_scan", "swarmsolve_partial",
+                 "submissions"):
+        state.app.jinja_env.get_template(f"admin/{name}.html")
+
+def _page_etag(template, *stamps):
+    """ETag for a page of this request's URL rendered from template and the data behind stamps."""
+    key = f"{_template_version(template)}:{ADMIN_CSS_VERSION}:{request.query_string!r}:{stamps}"
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+def _revalidated(etag, render):
+    """304 if the client already has this ETag, else render(); either way the client revalidates next time."""
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.make_response(render())
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "private, must-revalidate"
+    return response
 
-API_KEYS_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Scraper API Keys - WattCoin Admin</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <style>
-        .toast {
-            position: fixed; bottom: 20px; right: 20px;
-            background: #10b981; color: #000; padding: 12px 20px;
-            border-radius: 8px; font-weight: 600; opacity: 0;
-            transition: opacity 0.3s; z-index: 1000;
-        }
-        .toast.show { opacity: 1; }
-    </style>
-</head>
-<body class="bg-gray-900 text-gray-100 min-h-screen">
-    <div id="toast" class="toast"></div>
-    
-    <div class="max-w-6xl mx-auto p-6">
-        <!-- Header -->
-        <div class="flex justify-between items-center mb-4">
-            <div>
-                <h1 class="text-2xl font-bold text-green-400">⚡ WattCoin Admin</h1>
-                <p class="text-gray-500 text-sm">v2.1.0 | Scraper API Keys - Premium Access (Skip WATT Payment)</p>
-            </div>
-            <a href="{{ url_for('admin.logout') }}" class="text-gray-400 hover:text-red-400 text-sm">Logout</a>
-        </div>
-        
-        <!-- Nav Tabs -->
-        <div class="flex gap-1 mb-6 border-b border-gray-700">
-            <a href="{{ url_for('admin.dashboard') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🎯 PR Bounties
-            </a>
-            <a href="{{ url_for('admin.submissions') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                📋 Agent Tasks
-            </a>
-
-            <a href="{{ url_for('internal.internal_page') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🔧 Internal Pipeline
-            </a>
-            <a href="{{ url_for('admin.api_keys') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-green-400 text-green-400">
-                🔑 Scraper Keys
-            </a>
-            <a href="{{ url_for('admin.clear_data') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🗑️ Clear Data
-            </a>
-            <a href="{{ url_for('admin.security_scan') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🔒 Security Scan
-            </a>
-        </div>
-        
-        {% if message %}
-        <div class="bg-green-900/50 border border-green-500 text-green-300 px-4 py-2 rounded mb-6">{{ message }}</div>
-        {% endif %}
-        
-        <!-- Stats -->
-        <div class="grid grid-cols-3 gap-4 mb-8">
-            <div class="bg-gray-800 rounded-lg p-4">
-                <div class="text-3xl font-bold text-blue-400">{{ stats.total }}</div>
-                <div class="text-gray-500 text-sm">Total Keys</div>
-            </div>
-            <div class="bg-gray-800 rounded-lg p-4">
-                <div class="text-3xl font-bold text-green-400">{{ stats.active }}</div>
-                <div class="text-gray-500 text-sm">Active</div>
-            </div>
-            <div class="bg-gray-800 rounded-lg p-4">
-                <div class="text-3xl font-bold text-gray-400">{{ "{:,}".format(stats.total_requests) }}</div>
-                <div class="text-gray-500 text-sm">Total Requests</div>
-            </div>
-        </div>
-        
-        <!-- Create Key Form -->
-        <div class="bg-gray-800 rounded-lg p-6 mb-8">
-            <h2 class="text-lg font-semibold mb-4">Create New API Key</h2>
-            <form action="{{ url_for('admin.create_api_key') }}" method="POST" class="flex gap-4 items-end">
-                <div class="flex-1">
-                    <label class="block text-sm text-gray-400 mb-1">Owner Wallet</label>
-                    <input type="text" name="owner_wallet" placeholder="Solana wallet address" 
-                           class="w-full bg-gray-700 border border-gray-600 rounded px-3 py-2 text-sm focus:border-green-500 focus:outline-none">
-                </div>
-                <div>
-                    <label class="block text-sm text-gray-400 mb-1">Tier</label>
-                    <select name="tier" class="bg-gray-700 border border-gray-600 rounded px-3 py-2 text-sm focus:border-green-500 focus:outline-none">
-                        <option value="basic">Basic (500/hr)</option>
-                        <option value="premium">Premium (2000/hr)</option>
-                    </select>
-                </div>
-                <div>
-                    <label class="block text-sm text-gray-400 mb-1">TX Signature</label>
-                    <div class="flex gap-2">
-                        <input type="text" name="tx_sig" id="tx_sig_input" placeholder="Payment TX (optional)" 
-                               class="flex-1 bg-gray-700 border border-gray-600 rounded px-3 py-2 text-sm focus:border-green-500 focus:outline-none">
-                        <button type="button" onclick="verifyTx()" 
-                                class="px-3 py-2 bg-blue-600 hover:bg-blue-700 rounded text-sm font-medium transition whitespace-nowrap">
-                            🔍 Verify
-                        </button>
-                    </div>
-                </div>
-                <button type="submit" class="px-4 py-2 bg-green-600 hover:bg-green-700 rounded text-sm font-medium transition">
-                    + Create Key
-                </button>
-            </form>
-        </div>
-        
-        <!-- Keys List -->
-        <h2 class="text-lg font-semibold mb-4">Active Keys</h2>
-        
-        {% if keys %}
-        <div class="bg-gray-800 rounded-lg overflow-hidden">
-            <table class="w-full">
-                <thead class="bg-gray-700">
-                    <tr>
-                        <th class="px-4 py-3 text-left text-sm">API Key</th>
-                        <th class="px-4 py-3 text-left text-sm">Owner</th>
-                        <th class="px-4 py-3 text-left text-sm">Tier</th>
-                        <th class="px-4 py-3 text-left text-sm">Requests</th>
-                        <th class="px-4 py-3 text-left text-sm">Created</th>
-                        <th class="px-4 py-3 text-left text-sm">Action</th>
-                    </tr>
-                </thead>
-                <tbody>
-                    {% for key in keys %}
-                    <tr class="border-t border-gray-700">
-                        <td class="px-4 py-3">
-                            <code class="text-xs bg-gray-700 px-2 py-1 rounded cursor-pointer" 
-                                  onclick="copyKey('{{ key.key }}')" title="Click to copy">
-                                {{ key.key[:8] }}...{{ key.key[-4:] }}
-                            </code>
-                        </td>
-                        <td class="px-4 py-3">
-                            {% if key.owner_wallet %}
-                            <span class="text-xs text-gray-400" title="{{ key.owner_wallet }}">
-                                {{ key.owner_wallet[:6] }}...{{ key.owner_wallet[-4:] }}
-                            </span>
-                            {% else %}
-                            <span class="text-xs text-gray-500">—</span>
-                            {% endif %}
-                        </td>
-                        <td class="px-4 py-3">
-                            <span class="px-2 py-1 rounded text-xs 
-                                {% if key.tier == 'premium' %}bg-purple-900/50 text-purple-400
-                                {% else %}bg-blue-900/50 text-blue-400{% endif %}">
-                                {{ key.tier }}
-                            </span>
-                        </td>
-                        <td class="px-4 py-3 text-sm text-gray-400">{{ "{:,}".format(key.usage_count) }}</td>
-                        <td class="px-4 py-3 text-sm text-gray-500">{{ key.created[:10] }}</td>
-                        <td class="px-4 py-3">
-                            {% if key.status == 'active' %}
-                            <form action="{{ url_for('admin.revoke_api_key', key_id=key.key) }}" method="POST" 
-                                  onsubmit="return confirm('Revoke this API key?');" style="display:inline;">
-                                <button type="submit" class="text-xs text-red-400 hover:text-red-300">Revoke</button>
-                            </form>
-                            {% else %}
-                            <span class="text-xs text-gray-500">Revoked</span>
-                            {% endif %}
-                        </td>
-                    </tr>
-                    {% endfor %}
-                </tbody>
-            </table>
-        </div>
-        {% else %}
-        <div class="bg-gray-800 rounded-lg p-8 text-center text-gray-500">
-            No API keys created yet
-        </div>
-        {% endif %}
-        
-        <!-- How It Works -->
-        <div class="mt-6 grid md:grid-cols-2 gap-4">
-            <div class="p-4 bg-gray-800 rounded-lg">
-                <p class="text-sm text-green-400 font-semibold mb-3">📋 How to Issue Keys</p>
-                <ol class="text-xs text-gray-400 space-y-2 list-decimal list-inside">
-                    <li>User pays <strong>1000 WATT</strong> to bounty wallet</li>
-                    <li>User sends you TX proof (X, Discord, etc.)</li>
-                    <li>Verify TX on Solscan</li>
-                    <li>Create key above → share with user</li>
-                </ol>
-                <p class="text-xs text-gray-500 mt-3">Bounty wallet: <code class="bg-gray-700 px-1 rounded">7vvNkG3...dXVSF</code></p>
-            </div>
-            
-            <div class="p-4 bg-gray-800 rounded-lg">
-                <p class="text-sm text-blue-400 font-semibold mb-3">⚡ Rate Limits</p>
-                <table class="text-xs text-gray-400 w-full">
-                    <tr><td class="py-1">No key (IP-based)</td><td class="text-right">100/hr</td></tr>
-                    <tr><td class="py-1">Basic key</td><td class="text-right text-blue-400">500/hr</td></tr>
-                    <tr><td class="py-1">Premium key</td><td class="text-right text-purple-400">2000/hr</td></tr>
-                </table>
-            </div>
-        </div>
-        
-        <div class="mt-4 p-4 bg-gray-800 rounded-lg">
-            <p class="text-sm text-gray-400 mb-2"><strong>User Usage (share with key recipients):</strong></p>
-            <code class="text-xs bg-gray-700 px-3 py-2 rounded block overflow-x-auto">
-                curl -X POST https://your-backend-url/api/v1/scrape \<br>
-                &nbsp;&nbsp;-H "X-API-Key: your-key-here" \<br>
-                &nbsp;&nbsp;-H "Content-Type: application/json" \<br>
-                &nbsp;&nbsp;-d '{"url": "https://example.com", "format": "text"}'
-            </code>
-            <p class="text-xs text-gray-500 mt-2">Formats: <code class="bg-gray-700 px-1 rounded">text</code> | <code class="bg-gray-700 px-1 rounded">html</code> | <code class="bg-gray-700 px-1 rounded">json</code></p>
-        </div>
-    </div>
-    
-    <script>
-        function copyKey(key) {
-            navigator.clipboard.writeText(key).then(() => {
-                const toast = document.getElementById('toast');
-                toast.textContent = '✓ API key copied to clipboard';
-                toast.classList.add('show');
-                setTimeout(() => toast.classList.remove('show'), 3000);
-            });
-        }
-        
-        function verifyTx() {
-            const txSig = document.getElementById('tx_sig_input').value.trim();
-            if (!txSig) {
-                alert('Enter a TX signature first');
-                return;
-            }
-            window.open('https://solscan.io/tx/' + txSig, '_blank');
-        }
-    </script>
-</body>
-</html>
-"""
+def _url_pattern(endpoint, arg):
+    """URL builder for one endpoint and path argument: the URL map is walked once, not once per row."""
+    # Build it once around a placeholder both int and string converters accept
+    prefix, suffix = url_for(endpoint, **{arg: 987654321}).split("987654321")
+    return lambda value: f"{prefix}{quote(str(value), safe='')}{suffix}"
 
 # =============================================================================
 # ROUTES
 # =============================================================================
 
+_login_pages = {}  # request.script_root -> (rendered login page bytes, its ETag)
+
 @admin_bp.route('/login', methods=['GET', 'POST'])
 def login():
     """Admin login page."""
     if not ADMIN_PASSWORD:
-        return render_template_string(LOGIN_TEMPLATE, error="ADMIN_PASSWORD not configured in env vars")
+        return render_template('admin/login.html', error="ADMIN_PASSWORD not configured in env vars")
     
     if request.method == 'POST':
         if request.form.get('password') == ADMIN_PASSWORD:
             session['admin_logged_in'] = True
             return redirect(url_for('admin.dashboard'))
-        return render_template_string(LOGIN_TEMPLATE, error="Invalid password")
-    
-    return render_template_string(LOGIN_TEMPLATE)
+        return render_template('admin/login.html', error="Invalid password")
+    
+    # The error-free page only varies with where the app is mounted: render it once per root
+    cached = _login_pages.get(request.script_root)
+    if cached is None:
+        html = render_template('admin/login.html').encode()
+        cached = _login_pages[request.script_root] = (html, hashlib.blake2b(html, digest_size=8).hexdigest())
+    html, etag = cached
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(html, mimetype="text/html")
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "private, max-age=60"
+    return response
 
 @admin_bp.route('/logout')
 def logout():
@@ -1969,52 +1231,112 @@ def logout():
     session.pop('admin_logged_in', None)
     return redirect(url_for('admin.login'))
 
+# Approved/rejected review counts for the dashboard stats, keyed by the data file stamp they were counted at
+_review_counts_cache = {"stamp": None, "counts": (0, 0)}
+
+def _review_counts():
+    """(approved, rejected) review counts, recounted only when the data file has changed."""
+    # Stat before loading: a write in between leaves a stale stamp, which just means a recount next time
+    stamp = _file_stamp(DATA_FILE)
+    if stamp is None or stamp != _review_counts_cache["stamp"]:
+        approved = rejected = 0
+        for r in load_data().get("reviews", {}).values():
+            status = r.get("status")
+            if status == "approved":
+                approved += 1
+            elif status == "rejected":
+                rejected += 1
+        _review_counts_cache.update(stamp=stamp, counts=(approved, rejected))
+    return _review_counts_cache["counts"]
+
+# The stored review fields a dashboard card shows; feedback is already cut to its preview
+_ReviewSummary = namedtuple("_ReviewSummary", "score passed status feedback")
+
+def _dashboard_rows(prs, reviews):
+    """Pair each open PR with a summary of its stored review (or None), its card's border colour and links."""
+    detail_url = _url_pattern('admin.pr_detail', 'pr_number')
+    close_url = _url_pattern('admin.close_pr_route', 'pr_number')
+    rows = []
+    for pr in prs:
+        rev = reviews.get(str(pr.get("number")))
+        if rev is None:
+            border = "border-gray-600"
+        else:
+            feedback = rev.get("feedback") or ""
+            if len(feedback) > 120:
+                feedback = feedback[:120] + "..."
+            rev = _ReviewSummary(rev.get("score"), rev.get("passed"), rev.get("status"), feedback)
+            border = "border-green-500" if rev.passed else "border-red-500" if rev.score else "border-blue-500"
+        rows.append({"pr": pr, "rev": rev, "border": border,
+                     "detail_url": detail_url(pr.get("number")), "close_url": close_url(pr.get("number"))})
+    return rows
+
 @admin_bp.route('/')
 @admin_bp.route('/dashboard')
 @login_required
 def dashboard():
     """Main dashboard - list open PRs."""
-    prs = get_open_prs()
-    data = load_data()
-    reviews = data.get("reviews", {})
-    
-    # Count stats
-    approved_count = len([r for r in reviews.values() if r.get("status") == "approved"])
-    rejected_count = len([r for r in reviews.values() if r.get("status") == "rejected"])
+    prs_future = _executor.submit(get_open_prs)
+    context = {"message": request.args.get('message'), "error": request.args.get('error')}
+    current_app.update_template_context(context)
     
-    stats = {
-        "open_prs": len(prs),
-        "approved": approved_count,
-        "rejected": rejected_count
-    }
+    def generate():
+        # Page head first, flushed through any compression, while GitHub is queried
+        yield from current_app.jinja_env.get_template('admin/dashboard_head.html').generate(context)
+        yield ""
+        
+        prs = prs_future.result()
+        data = load_data()
+        reviews = data.get("reviews", {})
+        
+        # Count stats
+        approved_count, rejected_count = _review_counts()
+        
+        stats = {
+            "open_prs": len(prs),
+            "approved": approved_count,
+            "rejected": rejected_count
+        }
+        
+        yield from current_app.jinja_env.get_template('admin/dashboard.html').generate(context,
+            pr_rows=_dashboard_rows(prs, reviews),
+            stats=stats,
+            repo=REPO
+        )
     
-    return render_template_string(DASHBOARD_TEMPLATE, 
-        prs=prs, 
-        reviews=reviews,
-        stats=stats,
-        repo=REPO,
-        message=request.args.get('message'),
-        error=request.args.get('error')
-    )
+    return current_app.response_class(stream_with_context(generate()), mimetype="text/html")
 
 @admin_bp.route('/pr/<int:pr_number>')
 @login_required
 def pr_detail(pr_number):
-    """PR detail page with AI review."""
-    pr = get_pr_detail(pr_number)
+    """PR detail page with AI review; the diff and raw AI response are fetched separately when expanded."""
+    pr = get_pr_detail(pr_number, with_diff=False)
     if not pr:
         return redirect(url_for('admin.dashboard', error=f"PR #{pr_number} not found"))
     
     data = load_data()
     review = data.get("reviews", {}).get(str(pr_number))
     
-    return render_template_string(PR_DETAIL_TEMPLATE,
+    return render_template('admin/pr_detail.html',
         pr=pr,
         review=review,
         message=request.args.get('message'),
         error=request.args.get('error')
     )
 
+@admin_bp.route('/pr/<int:pr_number>/diff')
+@login_required
+def pr_diff(pr_number):
+    """A PR's (truncated) diff as plain text, for the detail page's diff preview."""
+    return current_app.response_class(get_pr_diff(pr_number), mimetype="text/plain")
+
+@admin_bp.route('/pr/<int:pr_number>/raw_review')
+@login_required
+def pr_raw_review(pr_number):
+    """A PR's stored raw AI review response as plain text, for the detail page's collapsible section."""
+    review = load_data().get("reviews", {}).get(str(pr_number)) or {}
+    return current_app.response_class(review.get("review", ""), mimetype="text/plain")
+
 @admin_bp.route('/pr/<int:pr_number>/review', methods=['POST'])
 @login_required
 def trigger_review(pr_number):
@@ -2026,7 +1348,7 @@ def trigger_review(pr_number):
     result = call_ai_review(pr)
     
     if result.get("success"):
-        data = load_data()
+        data = load_data(for_update=True)
         review_entry = {
             "review": result["review"],
             "timestamp": result["timestamp"],
@@ -2049,55 +1371,59 @@ def trigger_review(pr_number):
 @login_required
 def approve_pr(pr_number):
     """Approve and merge a PR."""
-    # Get PR info first for callback
-    pr = get_pr_detail(pr_number)
-    callback_url = extract_callback_url(pr.get("body", "")) if pr else None
-    bounty = extract_bounty_amount(pr.get("title", ""), pr.get("body", ""), pr.get("labels", [])) if pr else 0
+    # Get PR info first for callback (title, body and labels - the diff isn't needed)
+    pr = get_pr_detail(pr_number, with_diff=False)
+    body = pr.get("body", "") if pr else ""
+    callback_url = extract_callback_url(body) if pr else None
+    bounty = extract_bounty_amount(pr.get("title", ""), body, pr.get("labels", [])) if pr else 0
     
     # Merge via GitHub API
     url = f"https://api.github.com/repos/{REPO}/pulls/{pr_number}/merge"
     try:
-        resp = requests.put(url, headers=github_headers(), json={
+        resp = _gh_request("PUT", url, json={
             "commit_title": f"Merge PR #{pr_number} - Bounty approved",
             "merge_method": "squash"
         }, timeout=15)
         
         if resp.status_code in [200, 201]:
+            _invalidate_open_prs()
+            
             # Update data
-            data = load_data()
+            data = load_data(for_update=True)
             review_text = ""
-            if str(pr_number) in data["reviews"]:
-                data["reviews"][str(pr_number)]["status"] = "approved"
-                data["reviews"][str(pr_number)]["approved_at"] = datetime.now().isoformat()
-                review_text = data["reviews"][str(pr_number)].get("review", "")
+            review = data["reviews"].get(str(pr_number))
+            if review is not None:
+                review["status"] = "approved"
+                review["approved_at"] = _now_iso()
+                review_text = review.get("review", "")
             
             # Add to payout queue
             if pr:
-                recipient_wallet = extract_wallet(pr.get("body", ""))
+                recipient_wallet = extract_wallet(body)
                 data["payouts"].append({
                     "pr_number": pr_number,
                     "author": pr["author"],
                     "amount": bounty,
                     "wallet": recipient_wallet,
                     "status": "pending",
-                    "approved_at": datetime.now().isoformat()
+                    "approved_at": _now_iso()
                 })
             
             save_data(data)
             
-            # Send callback notification
-            send_callback(callback_url, {
+            # Notify the agent in the background - the merge is already done
+            _executor.submit(send_callback, callback_url, {
                 "pr_number": pr_number,
                 "status": "approved",
                 "bounty": bounty,
                 "review_summary": review_text[:1000],
                 "payout_wallet": BOUNTY_WALLET_ADDRESS,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             })
             
             return redirect(url_for('admin.dashboard', message=f"PR #{pr_number} merged successfully"))
         else:
-            error_msg = resp.json().get("message", "Unknown error")
+            error_msg = _gh_json(resp).get("message", "Unknown error")
             return redirect(url_for('admin.pr_detail', pr_number=pr_number, error=f"Merge failed: {error_msg}"))
     except Exception as e:
         return redirect(url_for('admin.pr_detail', pr_number=pr_number, error=f"Merge error: {str(e)}"))
@@ -2106,14 +1432,12 @@ def approve_pr(pr_number):
 @login_required
 def reject_pr(pr_number):
     """Reject and close a PR."""
-    # Get PR info for callback
-    pr = get_pr_detail(pr_number)
-    callback_url = extract_callback_url(pr.get("body", "")) if pr else None
-    bounty = extract_bounty_amount(pr.get("title", ""), pr.get("body", ""), pr.get("labels", [])) if pr else 0
+    # PR info is only needed for the callback, so fetch it alongside the comment and close below
+    pr_future = _executor.submit(get_pr_detail, pr_number, with_diff=False)
     
-    data = load_data()
-    review = data.get("reviews", {}).get(str(pr_number), {})
-    review_text = review.get('review', 'No detailed review available.')
+    data = load_data(for_update=True)
+    review = data.get("reviews", {}).get(str(pr_number))
+    review_text = (review or {}).get('review', 'No detailed review available.')
     
     # Post rejection comment
     comment = f"""## ❌ Bounty Review - Not Approved
@@ -2126,46 +1450,109 @@ This PR has been reviewed but not approved for the bounty at this time.
 *This is an automated response from the WattCoin bounty system. Please address the issues above and submit a new PR.*
 """
     
+    # Post the comment and close the PR in parallel - they touch different resources.
+    # Comment posting is best-effort: its exception (if any) stays on the future.
     url = f"https://api.github.com/repos/{REPO}/issues/{pr_number}/comments"
-    try:
-        requests.post(url, headers=github_headers(), json={"body": comment}, timeout=15)
-    except:
-        pass  # Comment posting is best-effort
-    
-    # Close the PR on GitHub
-    close_pr(pr_number)
-    
-    # Update status
-    if str(pr_number) in data.get("reviews", {}):
-        data["reviews"][str(pr_number)]["status"] = "rejected"
-        data["reviews"][str(pr_number)]["rejected_at"] = datetime.now().isoformat()
+    comment_future = _executor.submit(_gh_request, "POST", url, json={"body": comment}, timeout=15)
+    close_future = _executor.submit(close_pr, pr_number)
+    wait([pr_future, comment_future, close_future], return_when=ALL_COMPLETED)
+    
+    pr = pr_future.result()
+    body = pr.get("body", "") if pr else ""
+    callback_url = extract_callback_url(body) if pr else None
+    bounty = extract_bounty_amount(pr.get("title", ""), body, pr.get("labels", [])) if pr else 0
+    
+    # Update status (same dict loaded above - no second read)
+    if review is not None:
+        review["status"] = "rejected"
+        review["rejected_at"] = _now_iso()
         save_data(data)
     
-    # Send callback notification
-    send_callback(callback_url, {
+    # Notify the agent in the background - the PR is already closed
+    _executor.submit(send_callback, callback_url, {
         "pr_number": pr_number,
         "status": "rejected",
         "bounty": bounty,
         "review_summary": review_text[:1000],
         "payout_wallet": None,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _now_iso()
     })
     
     return redirect(url_for('admin.dashboard', message=f"PR #{pr_number} rejected and closed"))
 
+# Badge classes (and labels) for the status column of the payouts and claims tables
+_PAYOUT_STATUS_CSS = {"pending": "bg-yellow-900/50 text-yellow-400", "paid": "bg-green-900/50 text-green-400"}
+_CLAIM_STATUS = {
+    "pending_stake": ("bg-yellow-900/50 text-yellow-400", "Pending Stake"),
+    "staked": ("bg-blue-900/50 text-blue-400", "Staked"),
+    "pr_opened": ("bg-green-900/50 text-green-400", "PR Opened"),
+    "expired": ("bg-red-900/50 text-red-400", "Expired"),
+}
+
+def _payout_row(payout):
+    """Payout dict plus the formatted amount, status badge class and action cell its table row displays."""
+    if payout.get("status") != "pending":
+        action = "complete"
+    else:
+        action = "pay" if payout.get("wallet") else "no_wallet"
+    return dict(payout,
+        amount_fmt=f"{payout.get('amount', 0):,}",
+        status_css=_PAYOUT_STATUS_CSS.get(payout.get("status"), ""),
+        action=action,
+    )
+
+def _claim_row(claim):
+    """Claim dict plus its status badge class and label and the shortened stake TX it links."""
+    status_css, status_label = _CLAIM_STATUS.get(claim["status"], ("", ""))
+    return dict(claim, status_css=status_css, status_label=status_label,
+                stake_tx_short=f"{claim['stake_tx'][:8]}..." if claim.get("stake_tx") else "")
+
 @admin_bp.route('/payouts')
 @login_required
 def payouts():
     """Payout queue page."""
+    # A payout still missing its wallet or amount is retried from its PR on every view,
+    # and the PR can change without the data file changing - so no 304 until all are filled
+    if any(_needs_backfill(p) for p in load_data().get("payouts", [])):
+        return _render_payouts()
+    # Otherwise shown from the review data file alone: an unchanged file means an unchanged page
+    etag = _page_etag("payouts.html", _template_version("payouts_head.html"), _file_stamp(DATA_FILE))
+    return _revalidated(etag, _render_payouts)
+
+def _render_payouts():
+    """Stream the payout queue; the page top goes out before missing wallets and amounts are backfilled."""
+    context = {}
+    current_app.update_template_context(context)
+    
+    def generate():
+        # Page top first, flushed through any compression, while GitHub is queried
+        yield from current_app.jinja_env.get_template('admin/payouts_head.html').generate(context)
+        yield ""
+        yield from current_app.jinja_env.get_template('admin/payouts.html').generate(context,
+            payouts=[_payout_row(p) for p in _backfilled_payouts()],
+            repo=REPO,
+            bounty_wallet=BOUNTY_WALLET_ADDRESS
+        )
+    
+    return current_app.response_class(stream_with_context(generate()), mimetype="text/html")
+
+def _needs_backfill(payout):
+    """Whether a payout is missing the wallet or amount that its PR may provide."""
+    return not payout.get("wallet") or payout.get("amount", 0) == 0
+
+def _backfilled_payouts():
+    """The payout list, with missing wallets and amounts filled in from their PRs and saved."""
     data = load_data()
+    if any(_needs_backfill(p) for p in data.get("payouts", [])):
+        data = load_data(for_update=True)
     payout_list = data.get("payouts", [])
     
-    # Backfill missing wallets and amounts from PR
+    # Backfill missing wallets and amounts from PR (fetch each PR once, concurrently)
     updated = False
+    missing = list({p.get("pr_number") for p in payout_list if _needs_backfill(p)})
+    prs = dict(zip(missing, _executor.map(functools.partial(get_pr_detail, with_diff=False), missing)))
     for payout in payout_list:
-        pr = None
-        if not payout.get("wallet") or payout.get("amount", 0) == 0:
-            pr = get_pr_detail(payout.get("pr_number"))
+        pr = prs.get(payout.get("pr_number")) if _needs_backfill(payout) else None
         
         if pr:
             if not payout.get("wallet"):
@@ -2184,48 +1571,107 @@ def payouts():
     if updated:
         save_data(data)
     
-    return render_template_string(PAYOUTS_TEMPLATE,
-        payouts=payout_list,
-        repo=REPO,
-        bounty_wallet=BOUNTY_WALLET_ADDRESS
-    )
+    return payout_list
 
 @admin_bp.route('/claims')
 @login_required
 def claims():
     """Bounty claims page."""
-    claim_list = get_bounty_claims()
-    return render_template_string(CLAIMS_TEMPLATE,
-        claims=claim_list,
-        repo=REPO
-    )
+    context = {}
+    current_app.update_template_context(context)
+    
+    def generate():
+        # Page top first, flushed through any compression, while GitHub is queried
+        yield from current_app.jinja_env.get_template('admin/claims_head.html').generate(context)
+        yield ""
+        # On this thread, not _executor: get_bounty_claims fans its own GitHub calls out to _executor
+        yield from current_app.jinja_env.get_template('admin/claims.html').generate(context,
+            claims=[_claim_row(c) for c in get_bounty_claims()],
+            repo=REPO
+        )
+    
+    return current_app.response_class(stream_with_context(generate()), mimetype="text/html")
 
 @admin_bp.route('/payout/<int:pr_number>/paid')
 @login_required
 def mark_paid(pr_number):
     """Mark a payout as paid."""
-    tx_sig = request.args.get('tx', '').strip()
-    
-    data = load_data()
+    _mark_payouts_paid({pr_number: request.args.get('tx', '').strip()})
+    return redirect(url_for('admin.payouts', message=f"PR #{pr_number} marked as paid"))
+
+@admin_bp.route('/payouts/paid', methods=['POST'])
+@login_required
+def mark_paid_batch():
+    """Mark several payouts as paid from a JSON list of {pr_number, tx_sig}, saving the data file once."""
+    items = request.get_json(silent=True)
+    if not isinstance(items, list):
+        return _jsonify({"success": False, "message": "Expected a JSON list"}, 400)
+    try:
+        tx_by_pr = {int(item["pr_number"]): str(item.get("tx_sig") or "").strip() for item in items}
+    except (TypeError, KeyError, ValueError):
+        return _jsonify({"success": False, "message": "Each item needs a numeric pr_number"}, 400)
+    
+    updated = _mark_payouts_paid(tx_by_pr)
+    return _jsonify({"success": True, "updated": updated})
+
+def _mark_payouts_paid(tx_by_pr):
+    """Set the payouts for the PR numbers in tx_by_pr to paid, with their TX signatures. Returns the PRs updated."""
+    data = load_data(for_update=True)
+    paid_at = _now_iso()
+    updated = []
     for payout in data.get("payouts", []):
-        if payout.get("pr_number") == pr_number:
+        pr_number = payout.get("pr_number")
+        if pr_number in tx_by_pr and pr_number not in updated:
             payout["status"] = "paid"
-            payout["paid_at"] = datetime.now().isoformat()
-            if tx_sig:
-                payout["tx_sig"] = tx_sig
-            break
+            payout["paid_at"] = paid_at
+            if tx_by_pr[pr_number]:
+                payout["tx_sig"] = tx_by_pr[pr_number]
+            updated.append(pr_number)
     
     save_data(data)
-    return redirect(url_for('admin.payouts', message=f"PR #{pr_number} marked as paid"))
+    return updated
 
 # =============================================================================
 # API KEYS ROUTES
 # =============================================================================
 
+# Only a key's hash is stored, so create_api_key hands the plaintext to the page it redirects to
+# through this map: reveal token -> (key, expiry). The first GET with the token pops it, so the key
+# is shown once, and never travels in a URL or the (signed, not encrypted) session cookie.
+# Process memory is enough: the app runs as a single worker.
+_pending_reveals = {}
+REVEAL_TTL_SECONDS = 120
+
+def _stash_new_key(key):
+    """Hold a just-created key for one reveal; returns the token that fetches it."""
+    now = time.time()
+    for token, (_, expires) in list(_pending_reveals.items()):
+        if expires <= now:
+            _pending_reveals.pop(token, None)
+    token = secrets.token_urlsafe(16)
+    _pending_reveals[token] = (key, now + REVEAL_TTL_SECONDS)
+    return token
+
+def _pop_new_key(token):
+    """The key held under token, if it is still unexpired; either way the token is used up."""
+    key, expires = _pending_reveals.pop(token, (None, 0))
+    return key if expires > time.time() else None
+
 @admin_bp.route('/api-keys')
 @login_required
 def api_keys():
     """API keys management page."""
+    token = request.args.get('reveal')
+    if token:
+        new_key = _pop_new_key(token)
+        message = None if new_key else "The new key was already shown and cannot be displayed again"
+        response = current_app.make_response(_render_api_keys(new_key, message))
+        response.headers["Cache-Control"] = "no-store"
+        return response
+    return _revalidated(_page_etag("api_keys.html", _file_stamp(API_KEYS_FILE)), _render_api_keys)
+
+def _render_api_keys(new_key=None, message=None):
+    """Render the API keys page, newest key first; new_key is the just-created key to show once."""
     data = load_api_keys()
     keys_dict = data.get("keys", {})
     
@@ -2234,27 +1680,29 @@ def api_keys():
     total_requests = 0
     active_count = 0
     
-    for key_id, key_data in keys_dict.items():
-        key_data["key"] = key_id
-        keys_list.append(key_data)
+    # Keys are stored oldest-first (see save_api_keys), so walk backwards for newest-first
+    for key_id, key_data in reversed(keys_dict.items()):
+        keys_list.append(dict(key_data, key=key_id, label=api_key_label(key_id, key_data),
+                              usage_fmt=f"{key_data.get('usage_count', 0):,}",
+                              created_date=(key_data.get("created") or "")[:10]))
         total_requests += key_data.get("usage_count", 0)
         if key_data.get("status") == "active":
             active_count += 1
     
-    # Sort by created date (newest first)
-    keys_list.sort(key=lambda x: x.get("created", ""), reverse=True)
-    
     stats = {
         "total": len(keys_list),
         "active": active_count,
-        "total_requests": total_requests
+        "total_requests": total_requests,
+        "total_requests_fmt": f"{total_requests:,}"
     }
     
-    return render_template_string(API_KEYS_TEMPLATE,
+    return stream_template('admin/api_keys.html',
         keys=keys_list,
+        revoke_url=_url_pattern('admin.revoke_api_key', 'key_id'),
         stats=stats,
         repo=REPO,
-        message=request.args.get('message')
+        message=message or request.args.get('message'),
+        new_key=new_key
     )
 
 @admin_bp.route('/api-keys/create', methods=['POST'])
@@ -2272,34 +1720,50 @@ def create_api_key():
     new_key = generate_api_key()
     
     # Load and update data
-    data = load_api_keys()
-    data["keys"][new_key] = {
+    data = load_api_keys(for_update=True)
+    data["keys"][hash_api_key(new_key)] = {
+        "prefix": new_key[:8],
+        "suffix": new_key[-4:],
         "owner_wallet": owner_wallet,
         "tier": tier,
         "tx_sig": tx_sig if tx_sig else None,
         "usage_count": 0,
-        "created": datetime.now().isoformat(),
+        "created": _now_iso(),
         "status": "active"
     }
     
-    save_api_keys(data)
+    if not save_api_keys(data):
+        return redirect(url_for('admin.api_keys', message="Failed to save the new key"))
     
-    return redirect(url_for('admin.api_keys', message=f"Key created: {new_key[:8]}..."))
+    return redirect(url_for('admin.api_keys', reveal=_stash_new_key(new_key), message=f"Key created: {new_key[:8]}..."))
 
 @admin_bp.route('/api-keys/revoke/<key_id>', methods=['POST'])
 @login_required
 def revoke_api_key(key_id):
     """Revoke an API key."""
-    data = load_api_keys()
+    data = load_api_keys(for_update=True)
     
     if key_id in data.get("keys", {}):
         data["keys"][key_id]["status"] = "revoked"
-        data["keys"][key_id]["revoked_at"] = datetime.now().isoformat()
+        data["keys"][key_id]["revoked_at"] = _now_iso()
         save_api_keys(data)
-        return redirect(url_for('admin.api_keys', message=f"Key revoked: {key_id[:8]}..."))
+        return redirect(url_for('admin.api_keys', message=f"Key revoked: {api_key_label(key_id, data['keys'][key_id])}"))
     
     return redirect(url_for('admin.api_keys', message="Key not found"))
 
+# path -> ((st_mtime_ns, st_size), record counts) for the clear data page
+_counts_cache = {}
+
+def _record_counts(path, count):
+    """count() of the records in a data file, cached on the file's stamp."""
+    stamp = _file_stamp(path)  # taken first: a write during count() just means a recount next view
+    cached = _counts_cache.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    counts = count()
+    _counts_cache[path] = (stamp, counts)
+    return counts
+
 @admin_bp.route('/clear-data')
 @login_required
 def clear_data():
@@ -2307,19 +1771,23 @@ def clear_data():
     message = request.args.get('message', '')
     error = request.args.get('error', '')
     
-    # Get current counts
-    bounty_data = load_data()
-    submissions_data = load_submissions()
-    external_data = load_external_tasks()
+    # Counted only after a file changes; external tasks are streamed, so a large file is never held in memory
+    def bounty_counts():
+        data = load_data()
+        return len(data.get("reviews", {})), len(data.get("payouts", []))
+    
+    reviews, payouts = _record_counts(DATA_FILE, bounty_counts)
+    submissions_count = _record_counts(SUBMISSIONS_FILE, lambda: len(load_submissions().get("submissions", [])))
+    tasks = _record_counts(EXTERNAL_TASKS_FILE, lambda: sum(1 for _ in _iter_external_tasks()))
     
     counts = {
-        "bounty_reviews": len(bounty_data.get("reviews", {})),
-        "bounty_payouts": len(bounty_data.get("payouts", [])),
-        "task_submissions": len(submissions_data.get("submissions", [])),
-        "external_tasks": len(external_data.get("tasks", []))
+        "bounty_reviews": reviews,
+        "bounty_payouts": payouts,
+        "task_submissions": submissions_count,
+        "external_tasks": tasks
     }
     
-    return render_template_string(CLEAR_DATA_HTML, counts=counts, message=message, error=error)
+    return render_template('admin/clear_data.html', counts=counts, message=message, error=error)
 
 @admin_bp.route('/clear-data/execute', methods=['POST'])
 @login_required
@@ -2338,9 +1806,7 @@ def clear_data_execute():
     if request.form.get('clear_external_tasks'):
         # Save empty external tasks
         try:
-            os.makedirs(os.path.dirname(EXTERNAL_TASKS_FILE), exist_ok=True)
-            with open(EXTERNAL_TASKS_FILE, 'w') as f:
-                json.dump({"tasks": []}, f, indent=2)
+            _atomic_write_json(EXTERNAL_TASKS_FILE, {"tasks": []})
             cleared.append("External tasks")
         except Exception as e:
             return redirect(url_for('admin.clear_data', error=f"Failed to clear external tasks: {e}"))
@@ -2350,126 +1816,47 @@ def clear_data_execute():
     else:
         return redirect(url_for('admin.clear_data', error="Nothing selected"))
 
-CLEAR_DATA_HTML = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Clear Data - WattCoin Admin</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <style>body { background: #0a0a0a; color: #e5e5e5; }</style>
-</head>
-<body class="p-8">
-    <div class="max-w-2xl mx-auto">
-        <div class="flex justify-between items-center mb-6">
-            <div>
-                <h1 class="text-2xl font-bold text-green-400">⚡ WattCoin Admin</h1>
-                <p class="text-gray-500 text-sm">v2.1.0 | Clear Test Data</p>
-            </div>
-            <a href="{{ url_for('admin.logout') }}" class="text-gray-400 hover:text-red-400 text-sm">Logout</a>
-        </div>
-        
-        <!-- Nav Tabs -->
-        <div class="flex gap-1 mb-6 border-b border-gray-700">
-            <a href="{{ url_for('admin.dashboard') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🎯 PR Bounties
-            </a>
-            <a href="{{ url_for('admin.submissions') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                📋 Agent Tasks
-            </a>
-
-            <a href="{{ url_for('internal.internal_page') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🔧 Internal Pipeline
-            </a>
-            <a href="{{ url_for('admin.api_keys') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🔑 Scraper Keys
-            </a>
-            <a href="{{ url_for('admin.clear_data') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-green-400 text-green-400">
-                🗑️ Clear Data
-            </a>
-            <a href="{{ url_for('admin.security_scan') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🔒 Security Scan
-            </a>
-        </div>
-        
-        {% if message %}
-        <div class="bg-green-900/50 border border-green-500 text-green-300 px-4 py-2 rounded mb-6">{{ message }}</div>
-        {% endif %}
-        
-        {% if error %}
-        <div class="bg-red-900/50 border border-red-500 text-red-300 px-4 py-2 rounded mb-6">{{ error }}</div>
-        {% endif %}
-        
-        <form method="POST" action="{{ url_for('admin.clear_data_execute') }}" class="bg-gray-900 rounded-lg p-6">
-            <p class="text-yellow-400 text-sm mb-6">⚠️ This action cannot be undone. Only clear test data, not real usage.</p>
-            
-            <div class="space-y-4">
-                <label class="flex items-center gap-3 p-4 bg-gray-800 rounded-lg cursor-pointer hover:bg-gray-750">
-                    <input type="checkbox" name="clear_bounty_reviews" class="w-5 h-5 rounded">
-                    <div>
-                        <div class="font-medium">Bounty Reviews</div>
-                        <div class="text-gray-500 text-sm">{{ counts.bounty_reviews }} reviews, {{ counts.bounty_payouts }} payouts</div>
-                    </div>
-                </label>
-                
-                <label class="flex items-center gap-3 p-4 bg-gray-800 rounded-lg cursor-pointer hover:bg-gray-750">
-                    <input type="checkbox" name="clear_task_submissions" class="w-5 h-5 rounded">
-                    <div>
-                        <div class="font-medium">Task Submissions</div>
-                        <div class="text-gray-500 text-sm">{{ counts.task_submissions }} submissions</div>
-                    </div>
-                </label>
-                
-                <label class="flex items-center gap-3 p-4 bg-gray-800 rounded-lg cursor-pointer hover:bg-gray-750">
-                    <input type="checkbox" name="clear_external_tasks" class="w-5 h-5 rounded">
-                    <div>
-                        <div class="font-medium">External Tasks</div>
-                        <div class="text-gray-500 text-sm">{{ counts.external_tasks }} tasks (agent-posted)</div>
-                    </div>
-                </label>
-            </div>
-            
-            <div class="mt-6 flex gap-3">
-                <button type="submit" class="bg-red-600 hover:bg-red-700 text-white font-medium px-6 py-2 rounded-lg">
-                    Clear Selected
-                </button>
-                <a href="{{ url_for('admin.dashboard') }}" class="bg-gray-700 hover:bg-gray-600 text-white font-medium px-6 py-2 rounded-lg">
-                    Cancel
-                </a>
-            </div>
-        </form>
-    </div>
-</body>
-</html>
-"""
-
 # =============================================================================
 # SUBMISSIONS PAGE
 # =============================================================================
 
 SUBMISSIONS_FILE = "/app/data/task_submissions.json"
 
-def load_submissions():
-    """Load task submissions."""
-    try:
-        with open(SUBMISSIONS_FILE, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {"submissions": []}
+def load_submissions(for_update=False):
+    """Load task submissions (a private copy to modify and save if for_update)."""
+    return _load_json(SUBMISSIONS_FILE, {"submissions": []}, for_update)
+
+# (stamp of the cached submissions parse, id -> position in its list)
+_submission_positions = (None, {})
+
+def _find_submission(data, sub_id):
+    """Look up a submission by id in data, the caller's own load of the submissions file.
+
+    Positions are indexed once per version of the file on disk, so they also hold for a
+    for_update copy; a position whose id does not match (a list from elsewhere, or edited
+    since) falls back to a linear scan.
+    """
+    global _submission_positions
+    subs = data.get("submissions", [])
+    cached = _JSON_CACHE.get(SUBMISSIONS_FILE)
+    if cached:
+        stamp, positions = _submission_positions
+        if stamp != cached[0]:
+            positions = {}
+            for i, s in enumerate(cached[1].get("submissions", [])):
+                positions.setdefault(s.get("id"), i)  # the first submission with an id wins, as in a scan
+            _submission_positions = (cached[0], positions)
+        i = positions.get(sub_id)
+        if i is None and subs is cached[1].get("submissions"):
+            return None  # the shared parse itself: the index is complete
+        if i is not None and i < len(subs) and subs[i].get("id") == sub_id:
+            return subs[i]
+    return next((s for s in subs if s.get("id") == sub_id), None)
 
 def save_submissions(data):
     """Save task submissions."""
     try:
-        os.makedirs(os.path.dirname(SUBMISSIONS_FILE), exist_ok=True)
-        with open(SUBMISSIONS_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
+        _atomic_write_json(SUBMISSIONS_FILE, data)
         return True
     except:
         return False
@@ -2478,325 +1865,51 @@ EXTERNAL_TASKS_FILE = "/app/data/external_tasks.json"
 
 def load_external_tasks():
     """Load external tasks from JSON file."""
-    try:
-        with open(EXTERNAL_TASKS_FILE, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {"tasks": []}
-
-SUBMISSIONS_HTML = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Agent Task Submissions - WattCoin Admin</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <style>
-        body { background: #0a0a0a; color: #e5e5e5; }
-        .truncate-id { max-width: 100px; overflow: hidden; text-overflow: ellipsis; white-space: nowrap; }
-    </style>
-</head>
-<body class="p-8">
-    <div class="max-w-6xl mx-auto">
-        <!-- Header -->
-        <div class="flex justify-between items-center mb-4">
-            <div>
-                <h1 class="text-2xl font-bold text-green-400">⚡ WattCoin Admin</h1>
-                <p class="text-gray-500 text-sm">v2.1.0 | Agent Task Submissions + External Tasks Monitor</p>
-            </div>
-            <a href="{{ url_for('admin.logout') }}" class="text-gray-400 hover:text-red-400 text-sm">Logout</a>
-        </div>
-        
-        <!-- Nav Tabs -->
-        <div class="flex gap-1 mb-6 border-b border-gray-700">
-            <a href="{{ url_for('admin.dashboard') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🎯 PR Bounties
-            </a>
-            <a href="{{ url_for('admin.submissions') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-green-400 text-green-400">
-                📋 Agent Tasks
-            </a>
-
-            <a href="{{ url_for('internal.internal_page') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🔧 Internal Pipeline
-            </a>
-            <a href="{{ url_for('admin.api_keys') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🔑 Scraper Keys
-            </a>
-            <a href="{{ url_for('admin.clear_data') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🗑️ Clear Data
-            </a>
-            <a href="{{ url_for('admin.security_scan') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🔒 Security Scan
-            </a>
-        </div>
-        
-        {% if message %}
-        <div class="bg-green-900/50 border border-green-500 text-green-300 px-4 py-2 rounded mb-6">{{ message }}</div>
-        {% endif %}
-        
-        {% if error %}
-        <div class="bg-red-900/50 border border-red-500 text-red-300 px-4 py-2 rounded mb-6">{{ error }}</div>
-        {% endif %}
-        
-        <!-- Stats -->
-        <div class="grid grid-cols-4 gap-4 mb-8">
-            <div class="bg-gray-800 rounded-lg p-4">
-                <div class="text-3xl font-bold text-yellow-400">{{ stats.pending }}</div>
-                <div class="text-gray-500 text-sm">Pending Review</div>
-            </div>
-            <div class="bg-gray-800 rounded-lg p-4">
-                <div class="text-3xl font-bold text-blue-400">{{ stats.approved }}</div>
-                <div class="text-gray-500 text-sm">Approved</div>
-            </div>
-            <div class="bg-gray-800 rounded-lg p-4">
-                <div class="text-3xl font-bold text-green-400">{{ stats.paid }}</div>
-                <div class="text-gray-500 text-sm">Paid</div>
-            </div>
-            <div class="bg-gray-800 rounded-lg p-4">
-                <div class="text-3xl font-bold text-red-400">{{ stats.rejected }}</div>
-                <div class="text-gray-500 text-sm">Rejected</div>
-            </div>
-        </div>
-        
-        <!-- External Tasks Monitor -->
-        {% if external_tasks %}
-        <div class="bg-gray-900 rounded-lg p-6 mb-6 border border-purple-900">
-            <h2 class="text-lg font-bold text-purple-400 mb-4">🌐 External Tasks (Agent Posted) - {{ external_tasks|length }}</h2>
-            <div class="grid grid-cols-4 gap-3 mb-4">
-                <div class="bg-gray-800 rounded p-3">
-                    <div class="text-xl font-bold text-green-400">{{ ext_stats.open }}</div>
-                    <div class="text-gray-500 text-xs">Open</div>
-                </div>
-                <div class="bg-gray-800 rounded p-3">
-                    <div class="text-xl font-bold text-blue-400">{{ ext_stats.completed }}</div>
-                    <div class="text-gray-500 text-xs">Completed</div>
-                </div>
-                <div class="bg-gray-800 rounded p-3">
-                    <div class="text-xl font-bold text-yellow-400">{{ "{:,}".format(ext_stats.total_posted) }}</div>
-                    <div class="text-gray-500 text-xs">Total WATT Posted</div>
-                </div>
-                <div class="bg-gray-800 rounded p-3">
-                    <div class="text-xl font-bold text-green-400">{{ "{:,}".format(ext_stats.total_paid) }}</div>
-                    <div class="text-gray-500 text-xs">Total WATT Paid</div>
-                </div>
-            </div>
-            <table class="w-full text-sm">
-                <thead>
-                    <tr class="text-gray-400 border-b border-gray-700">
-                        <th class="text-left pb-2">ID</th>
-                        <th class="text-left pb-2">Title</th>
-                        <th class="text-right pb-2">WATT</th>
-                        <th class="text-left pb-2">Poster</th>
-                        <th class="text-left pb-2">Status</th>
-                        <th class="text-left pb-2">Created</th>
-                    </tr>
-                </thead>
-                <tbody>
-                {% for task in external_tasks[-15:] | reverse %}
-                    <tr class="border-b border-gray-800">
-                        <td class="py-2 font-mono text-xs text-purple-400">{{ task.id }}</td>
-                        <td class="py-2">{{ task.title[:40] }}{% if task.title|length > 40 %}...{% endif %}</td>
-                        <td class="py-2 text-right font-mono text-green-400">{{ "{:,}".format(task.amount) }}</td>
-                        <td class="py-2 font-mono text-xs">{{ task.poster[:8] }}...</td>
-                        <td class="py-2">
-                            {% if task.status == 'open' %}
-                            <span class="px-2 py-1 bg-green-900 text-green-300 rounded text-xs">open</span>
-                            {% elif task.status == 'completed' %}
-                            <span class="px-2 py-1 bg-blue-900 text-blue-300 rounded text-xs">completed</span>
-                            {% else %}
-                            <span class="px-2 py-1 bg-gray-700 text-gray-300 rounded text-xs">{{ task.status }}</span>
-                            {% endif %}
-                        </td>
-                        <td class="py-2 text-gray-500 text-xs">{{ task.created_at[:10] }}</td>
-                    </tr>
-                {% endfor %}
-                </tbody>
-            </table>
-        </div>
-        {% else %}
-        <div class="bg-gray-900 rounded-lg p-6 mb-6 border border-purple-900/50">
-            <h2 class="text-lg font-bold text-purple-400 mb-2">🌐 External Tasks</h2>
-            <p class="text-gray-500">No external tasks posted yet. Agents can post tasks via POST /api/v1/tasks</p>
-        </div>
-        {% endif %}
-        
-        <!-- Pending Submissions -->
-        {% if pending %}
-        <div class="bg-gray-900 rounded-lg p-6 mb-6">
-            <h2 class="text-lg font-bold text-yellow-400 mb-4">⏳ Pending Review ({{ pending|length }})</h2>
-            <table class="w-full text-sm">
-                <thead>
-                    <tr class="text-gray-500 border-b border-gray-700">
-                        <th class="text-left pb-2">ID</th>
-                        <th class="text-left pb-2">Task</th>
-                        <th class="text-left pb-2">Wallet</th>
-                        <th class="text-right pb-2">Amount</th>
-                        <th class="text-left pb-2">AI Review</th>
-                        <th class="text-left pb-2">Submitted</th>
-                        <th class="text-right pb-2">Actions</th>
-                    </tr>
-                </thead>
-                <tbody>
-                {% for sub in pending %}
-                    <tr class="border-b border-gray-800">
-                        <td class="py-3 font-mono text-xs truncate-id" title="{{ sub.id }}">{{ sub.id }}</td>
-                        <td class="py-3">
-                            <a href="https://github.com/WattCoin-Org/wattcoin/issues/{{ sub.task_id }}" 
-                               target="_blank" class="text-blue-400 hover:underline">
-                                #{{ sub.task_id }}
-                            </a>
-                            <span class="text-gray-500">{{ sub.task_title[:30] }}...</span>
-                        </td>
-                        <td class="py-3 font-mono text-xs">{{ sub.wallet[:8] }}...</td>
-                        <td class="py-3 text-right text-green-400">{{ "{:,}".format(sub.amount) }} WATT</td>
-                        <td class="py-3">
-                            {% if sub.ai_review %}
-                                {% if sub.ai_review.pass %}
-                                    <span class="text-green-400">✓ {{ (sub.ai_review.confidence * 100)|int }}%</span>
-                                {% else %}
-                                    <span class="text-red-400">✗ {{ (sub.ai_review.confidence * 100)|int }}%</span>
-                                {% endif %}
-                            {% else %}
-                                <span class="text-gray-500">-</span>
-                            {% endif %}
-                        </td>
-                        <td class="py-3 text-gray-500 text-xs">{{ sub.submitted_at[:10] }}</td>
-                        <td class="py-3 text-right">
-                            <form action="{{ url_for('admin.approve_submission', sub_id=sub.id) }}" method="POST" class="inline">
-                                <button type="submit" class="px-3 py-1 bg-green-600 hover:bg-green-700 rounded text-xs mr-1">
-                                    ✓ Approve
-                                </button>
-                            </form>
-                            <form action="{{ url_for('admin.reject_submission', sub_id=sub.id) }}" method="POST" class="inline">
-                                <button type="submit" class="px-3 py-1 bg-red-600 hover:bg-red-700 rounded text-xs">
-                                    ✗ Reject
-                                </button>
-                            </form>
-                        </td>
-                    </tr>
-                    <tr class="border-b border-gray-800 bg-gray-800/30">
-                        <td colspan="7" class="py-2 px-4">
-                            <details class="text-xs">
-                                <summary class="cursor-pointer text-gray-400 hover:text-gray-200">View result</summary>
-                                <pre class="mt-2 p-2 bg-black rounded overflow-x-auto text-green-400">{{ sub.result | tojson(indent=2) }}</pre>
-                                {% if sub.ai_review and sub.ai_review.reason %}
-                                <p class="mt-2 text-gray-400"><strong>AI:</strong> {{ sub.ai_review.reason }}</p>
-                                {% endif %}
-                            </details>
-                        </td>
-                    </tr>
-                {% endfor %}
-                </tbody>
-            </table>
-        </div>
-        {% endif %}
-        
-        <!-- Payout History -->
-        <div class="bg-gray-900 rounded-lg p-6">
-            <h2 class="text-lg font-bold text-green-400 mb-4">💰 Payout History ({{ paid|length }})</h2>
-            {% if paid %}
-            <table class="w-full text-sm">
-                <thead>
-                    <tr class="text-gray-500 border-b border-gray-700">
-                        <th class="text-left pb-2">Task</th>
-                        <th class="text-left pb-2">Wallet</th>
-                        <th class="text-right pb-2">Amount</th>
-                        <th class="text-left pb-2">TX</th>
-                        <th class="text-left pb-2">Paid At</th>
-                    </tr>
-                </thead>
-                <tbody>
-                {% for sub in paid %}
-                    <tr class="border-b border-gray-800">
-                        <td class="py-3">
-                            <a href="https://github.com/WattCoin-Org/wattcoin/issues/{{ sub.task_id }}" 
-                               target="_blank" class="text-blue-400 hover:underline">
-                                #{{ sub.task_id }}
-                            </a>
-                            {{ sub.task_title[:25] }}...
-                        </td>
-                        <td class="py-3 font-mono text-xs">{{ sub.wallet[:12] }}...</td>
-                        <td class="py-3 text-right text-green-400">{{ "{:,}".format(sub.amount) }} WATT</td>
-                        <td class="py-3">
-                            {% if sub.tx_signature %}
-                            <a href="https://solscan.io/tx/{{ sub.tx_signature }}" target="_blank" 
-                               class="text-blue-400 hover:underline text-xs font-mono">
-                                {{ sub.tx_signature[:12] }}...
-                            </a>
-                            {% else %}
-                            <span class="text-gray-500">-</span>
-                            {% endif %}
-                        </td>
-                        <td class="py-3 text-gray-500 text-xs">{{ sub.paid_at[:16] if sub.paid_at else '-' }}</td>
-                    </tr>
-                {% endfor %}
-                </tbody>
-            </table>
-            {% else %}
-            <p class="text-gray-500">No payouts yet.</p>
-            {% endif %}
-        </div>
-        
-        <!-- Rejected -->
-        {% if rejected %}
-        <div class="bg-gray-900 rounded-lg p-6 mt-6">
-            <h2 class="text-lg font-bold text-red-400 mb-4">❌ Rejected ({{ rejected|length }})</h2>
-            <table class="w-full text-sm">
-                <thead>
-                    <tr class="text-gray-500 border-b border-gray-700">
-                        <th class="text-left pb-2">Task</th>
-                        <th class="text-left pb-2">Wallet</th>
-                        <th class="text-left pb-2">Reason</th>
-                        <th class="text-left pb-2">Date</th>
-                    </tr>
-                </thead>
-                <tbody>
-                {% for sub in rejected[-10:] %}
-                    <tr class="border-b border-gray-800">
-                        <td class="py-3">
-                            <a href="https://github.com/WattCoin-Org/wattcoin/issues/{{ sub.task_id }}" 
-                               target="_blank" class="text-blue-400 hover:underline">
-                                #{{ sub.task_id }}
-                            </a>
-                        </td>
-                        <td class="py-3 font-mono text-xs">{{ sub.wallet[:8] }}...</td>
-                        <td class="py-3 text-gray-400 text-xs">
-                            {{ sub.ai_review.reason[:60] if sub.ai_review else sub.get('reject_reason', '-') }}...
-                        </td>
-                        <td class="py-3 text-gray-500 text-xs">{{ sub.submitted_at[:10] }}</td>
-                    </tr>
-                {% endfor %}
-                </tbody>
-            </table>
-        </div>
-        {% endif %}
-        
-    </div>
-</body>
-</html>
-"""
+    return _load_json(EXTERNAL_TASKS_FILE, {"tasks": []})
+
+def _submission_row(sub, wallet_len, title_len):
+    """Submission dict plus the truncated/formatted strings its table row displays."""
+    review = sub.get("ai_review")
+    return dict(sub,
+        wallet_short=(sub.get("wallet") or "")[:wallet_len],
+        title_short=(sub.get("task_title") or "")[:title_len],
+        amount_fmt=f"{sub.get('amount', 0):,}",
+        submitted_day=(sub.get("submitted_at") or "")[:10],
+        paid_short=(sub.get("paid_at") or "-")[:16],
+        tx_short=(sub.get("tx_signature") or "")[:12],
+        reason_short=(review.get("reason") or "")[:60] if review else sub.get("reject_reason", "-"),
+    )
 
-@admin_bp.route('/submissions')
-@login_required
-def submissions():
-    """Task submissions management page."""
-    message = request.args.get('message', '')
-    error = request.args.get('error', '')
-    
+def _external_task_row(task):
+    """External task dict plus the strings shown in the monitor table."""
+    title = task.get("title") or ""
+    return dict(task,
+        title_short=title[:40] + ("..." if len(title) > 40 else ""),
+        amount_fmt=f"{task.get('amount', 0):,}",
+        poster_short=(task.get("poster") or "")[:8],
+        created_day=(task.get("created_at") or "")[:10],
+    )
+
+def _submissions_view_data(page, size):
+    """Categorized, paginated submission rows and counts for the submissions page."""
     data = load_submissions()
     subs = data.get("submissions", [])
     
-    # Categorize
-    pending = [s for s in subs if s.get("status") in ["pending_review", "approved"]]
-    paid = [s for s in subs if s.get("status") == "paid"]
-    rejected = [s for s in subs if s.get("status") == "rejected"]
+    # Categorize in one pass
+    pending, paid, rejected = [], [], []
+    pending_count = approved_count = 0
+    for s in subs:
+        status = s.get("status")
+        if status == "pending_review":
+            pending.append(s)
+            pending_count += 1
+        elif status == "approved":
+            pending.append(s)
+            approved_count += 1
+        elif status == "paid":
+            paid.append(s)
+        elif status == "rejected":
+            rejected.append(s)
     
     # Sort by date descending
     pending.sort(key=lambda x: x.get("submitted_at", ""), reverse=True)
@@ -2804,58 +1917,165 @@ def submissions():
     rejected.sort(key=lambda x: x.get("submitted_at", ""), reverse=True)
     
     stats = {
-        "pending": len([s for s in subs if s.get("status") == "pending_review"]),
-        "approved": len([s for s in subs if s.get("status") == "approved"]),
+        "pending": pending_count,
+        "approved": approved_count,
         "paid": len(paid),
         "rejected": len(rejected)
     }
     
-    # Load external tasks
-    ext_data = load_external_tasks()
-    external_tasks = ext_data.get("tasks", [])
-    ext_stats = {
-        "open": len([t for t in external_tasks if t.get("status") == "open"]),
-        "completed": len([t for t in external_tasks if t.get("status") == "completed"]),
-        "total_posted": sum(t.get("amount", 0) for t in external_tasks),
-        "total_paid": sum(t.get("amount", 0) for t in external_tasks if t.get("status") == "completed")
+    # Paginate the pending and paid tables (same page number for both)
+    pages = max((max(len(pending), len(paid)) + size - 1) // size, 1)
+    offset = (page - 1) * size
+    
+    # Display strings are formatted here once rather than per row in the template
+    return {
+        "stats": stats,
+        "pending": [_submission_row(s, 8, 30) for s in pending[offset:offset + size]],
+        "paid": [_submission_row(s, 12, 25) for s in paid[offset:offset + size]],
+        "pending_total": len(pending),
+        "page": page,
+        "pages": pages,
+        "size": size,
+        "rejected": [_submission_row(s, 8, 0) for s in rejected[-10:]],
     }
-    
-    return render_template_string(SUBMISSIONS_HTML,
-        stats=stats,
-        pending=pending,
-        paid=paid,
-        rejected=rejected,
-        external_tasks=external_tasks,
-        ext_stats=ext_stats,
+
+# Above this size the external tasks file is streamed rather than loaded whole
+_STREAM_PARSE_MIN_BYTES = 1_000_000
+
+def _iter_external_tasks():
+    """Yield external tasks one at a time, streaming large files through ijson when available."""
+    stamp = _file_stamp(EXTERNAL_TASKS_FILE)
+    if ijson is None or not stamp or stamp[1] <= _STREAM_PARSE_MIN_BYTES:
+        yield from load_external_tasks().get("tasks", [])
+        return
+    try:
+        with open(EXTERNAL_TASKS_FILE, 'rb') as f:
+            yield from ijson.items(f, 'tasks.item', use_float=True)
+    except (OSError, ijson.JSONError):
+        return
+
+def _external_tasks_view_data():
+    """Recent external task rows and totals for the submissions page."""
+    recent = deque(maxlen=15)
+    total = 0
+    ext_stats = {"open": 0, "completed": 0, "total_posted": 0, "total_paid": 0}
+    for t in _iter_external_tasks():
+        recent.append(t)
+        total += 1
+        amount = t.get("amount", 0)
+        ext_stats["total_posted"] += amount
+        if t.get("status") == "open":
+            ext_stats["open"] += 1
+        elif t.get("status") == "completed":
+            ext_stats["completed"] += 1
+            ext_stats["total_paid"] += amount
+    ext_stats["total"] = total
+    ext_stats["total_posted_fmt"] = f"{ext_stats['total_posted']:,}"
+    ext_stats["total_paid_fmt"] = f"{ext_stats['total_paid']:,}"
+    
+    return {
+        "external_tasks": [_external_task_row(t) for t in reversed(recent)],
+        "ext_stats": ext_stats,
+    }
+
+@admin_bp.route('/submissions')
+@login_required
+def submissions():
+    """Task submissions management page."""
+    message = request.args.get('message', '')
+    error = request.args.get('error', '')
+    try:
+        page = max(int(request.args.get('page', 1)), 1)
+        size = min(max(int(request.args.get('size', 50)), 1), 200)
+    except ValueError:
+        page, size = 1, 50
+    
+    # The page only changes when one of its data files does - let refreshes revalidate
+    etag = _page_etag("submissions.html", _file_stamp(SUBMISSIONS_FILE), _file_stamp(EXTERNAL_TASKS_FILE))
+    return _revalidated(etag, lambda: render_template('admin/submissions.html',
+        **_submissions_view_data(page, size),
+        **_external_tasks_view_data(),
+        approve_url=_url_pattern('admin.approve_submission', 'sub_id'),
+        reject_url=_url_pattern('admin.reject_submission', 'sub_id'),
+        result_url=_url_pattern('admin.submission_result', 'sub_id'),
         message=message,
         error=error
-    )
+    ))
+
+@admin_bp.route('/submissions/<sub_id>/result.json')
+@login_required
+def submission_result(sub_id):
+    """A submission's result payload, fetched when its row is expanded."""
+    sub = _find_submission(load_submissions(), sub_id)
+    if sub is None:
+        return _jsonify({"error": "Submission not found"}, 404)
+    return _jsonify(sub.get("result"))
 
 @admin_bp.route('/submissions/approve/<sub_id>', methods=['POST'])
 @login_required
 def approve_submission(sub_id):
     """Approve a pending submission and trigger payout."""
-    data = load_submissions()
+    ok, msg = _approve_submission(sub_id)
+    if ok:
+        return redirect(url_for('admin.submissions', message=msg))
+    return redirect(url_for('admin.submissions', error=msg))
+
+@admin_bp.route('/submissions/approve_batch', methods=['POST'])
+@login_required
+def approve_submissions_batch():
+    """Approve several submissions in one request.
+
+    Each payout is saved as soon as it is sent, like a single approval: a batch cut short by a
+    crash or redeploy must not forget submissions that were already paid on-chain.
+    """
+    sub_ids = request.form.getlist('sub_ids')
+    if not sub_ids:
+        return redirect(url_for('admin.submissions', error="No submissions selected"))
+    
+    paid, failed = [], []
+    for sub_id in sub_ids:
+        ok, msg = _approve_submission(sub_id)
+        if ok:
+            paid.append(sub_id)
+        else:
+            failed.append(f"{sub_id[:12]}: {msg}")
     
-    for sub in data.get("submissions", []):
-        if sub.get("id") == sub_id:
-            if sub.get("status") == "paid":
-                return redirect(url_for('admin.submissions', error="Already paid"))
-            
-            # Try to send payout
-            from api_tasks import send_watt_payout
-            success, result = send_watt_payout(sub["wallet"], sub["amount"])
-            
-            if success:
-                sub["status"] = "paid"
-                sub["tx_signature"] = result
-                sub["paid_at"] = datetime.now().isoformat() + "Z"
-                sub["approved_by"] = "admin"
-                save_submissions(data)
-                
-                # Post GitHub comment
-                try:
-                    comment = f"""## ✅ Task Completed - Admin Approved
+    if failed:
+        return redirect(url_for('admin.submissions', error=f"Paid {len(paid)}, failed: " + " | ".join(failed)))
+    return redirect(url_for('admin.submissions', message=f"Paid {len(paid)} submission(s)"))
+
+def _approve_submission(sub_id):
+    """Pay out one submission. Returns (success, message)."""
+    data = load_submissions()
+    sub = _find_submission(data, sub_id)
+    if sub is None:
+        return False, "Submission not found"
+    if sub.get("status") == "paid":
+        return False, "Already paid"
+    
+    # Try to send payout
+    from api_tasks import send_watt_payout
+    success, result = send_watt_payout(sub["wallet"], sub["amount"])
+    
+    if not success:
+        return False, f"Payout failed: {result}"
+    
+    # Record the payout against a fresh read: other writes may have landed while it was sent.
+    # If the submission was removed meanwhile, put it back - a sent payout must stay on record.
+    data = load_submissions(for_update=True)
+    fresh = _find_submission(data, sub_id)
+    if fresh is None:
+        fresh = dict(sub)
+        data.setdefault("submissions", []).append(fresh)
+    sub = fresh
+    sub["status"] = "paid"
+    sub["tx_signature"] = result
+    sub["paid_at"] = _now_iso()
+    sub["approved_by"] = "admin"
+    save_submissions(data)
+    
+    # Post GitHub comment in the background - the payout is already done
+    comment = f"""## ✅ Task Completed - Admin Approved
 
 **Submission ID:** `{sub_id}`
 **Agent Wallet:** `{sub['wallet']}`
@@ -2865,36 +2085,27 @@ def approve_submission(sub_id):
 ---
 *Manually approved by admin*
 """
-                    requests.post(
-                        f"https://api.github.com/repos/{REPO}/issues/{sub['task_id']}/comments",
-                        headers={"Authorization": f"token {GITHUB_TOKEN}", "Accept": "application/vnd.github.v3+json"},
-                        json={"body": comment},
-                        timeout=10
-                    )
-                except:
-                    pass
-                
-                return redirect(url_for('admin.submissions', message=f"Paid {sub['amount']:,} WATT! TX: {result[:12]}..."))
-            else:
-                return redirect(url_for('admin.submissions', error=f"Payout failed: {result}"))
+    _executor.submit(
+        _gh_request, "POST",
+        f"https://api.github.com/repos/{REPO}/issues/{sub['task_id']}/comments",
+        json={"body": comment},
+        timeout=10
+    )
     
-    return redirect(url_for('admin.submissions', error="Submission not found"))
+    return True, f"Paid {sub['amount']:,} WATT! TX: {result[:12]}..."
 
 @admin_bp.route('/process_payments', methods=['POST'])
 def process_payment_queue():
     """Process all pending payments in the queue"""
-    import json
-    import os
-    from datetime import datetime
     
     queue_file = "/app/data/payment_queue.json"
     
     if not os.path.exists(queue_file):
-        return jsonify({"success": False, "message": "No payments in queue"}), 404
+        return _jsonify({"success": False, "message": "No payments in queue"}, 404)
     
     # Load queue
-    with open(queue_file, 'r') as f:
-        queue = json.load(f)
+    with open(queue_file, 'rb') as f:
+        queue = _json_loads(f.read())
     
     results = []
     updated_queue = []
@@ -2922,16 +2133,13 @@ def process_payment_queue():
             payment["processed_at"] = datetime.utcnow().isoformat()
             results.append(f"✅ PR #{pr_number}: {amount:,} WATT → {tx_signature[:16]}...")
             
-            # Post TX confirmation comment to PR
-            try:
-                comment = (
-                    f"✅ **Bounty paid!** {amount:,} WATT sent.\n\n"
-                    f"**TX:** [View on Solscan](https://solscan.io/tx/{tx_signature})\n\n"
-                    f"Thank you for contributing to the WattCoin agent economy! ⚡🤖"
-                )
-                post_github_comment(pr_number, comment)
-            except Exception as comment_err:
-                print(f"[QUEUE] Warning: Failed to post PR comment for #{pr_number}: {comment_err}", flush=True)
+            # Post TX confirmation comment to PR in the background
+            comment = (
+                f"✅ **Bounty paid!** {amount:,} WATT sent.\n\n"
+                f"**TX:** [View on Solscan](https://solscan.io/tx/{tx_signature})\n\n"
+                f"Thank you for contributing to the WattCoin agent economy! ⚡🤖"
+            )
+            _executor.submit(post_github_comment, pr_number, comment)
         else:
             payment["status"] = "failed"
             payment["error"] = error
@@ -2941,10 +2149,10 @@ def process_payment_queue():
         updated_queue.append(payment)
     
     # Save updated queue
-    with open(queue_file, 'w') as f:
-        json.dump(updated_queue, f, indent=2)
+    _atomic_write_json(queue_file, updated_queue)
+    _invalidate_status()
     
-    return jsonify({
+    return _jsonify({
         "success": True,
         "processed": len(results),
         "results": results
@@ -2957,9 +2165,6 @@ def queue_manual_payment():
     """Manually queue a payment for a merged PR that missed auto-payment.
     Goes through the same pipeline as automated payments (on-chain memo, PR comment, Discord).
     """
-    import json
-    import os
-    from datetime import datetime
     
     pr_number = request.form.get('pr_number', type=int)
     wallet = request.form.get('wallet', '').strip()
@@ -2988,8 +2193,8 @@ def queue_manual_payment():
     queue = []
     if os.path.exists(queue_file):
         try:
-            with open(queue_file, 'r') as f:
-                queue = json.load(f)
+            with open(queue_file, 'rb') as f:
+                queue = _json_loads(f.read())
         except:
             queue = []
     
@@ -3009,8 +2214,8 @@ def queue_manual_payment():
     
     queue.append(payment)
     
-    with open(queue_file, 'w') as f:
-        json.dump(queue, f, indent=2)
+    _atomic_write_json(queue_file, queue)
+    _invalidate_status()
     
     print(f"[ADMIN] Manual payment queued: PR #{pr_number}, {amount:,} WATT to {wallet[:8]}... Reason: {reason}", flush=True)
     
@@ -3022,24 +2227,22 @@ def queue_manual_payment():
 @login_required
 def clear_payment_queue():
     """Clear all pending payments from the queue (keeps completed/failed for history)."""
-    import json
-    import os
     
     queue_file = "/app/data/payment_queue.json"
     
     if not os.path.exists(queue_file):
         return redirect(url_for('admin.dashboard', message="Queue already empty"))
     
-    with open(queue_file, 'r') as f:
-        queue = json.load(f)
+    with open(queue_file, 'rb') as f:
+        queue = _json_loads(f.read())
     
     pending_count = len([p for p in queue if p.get("status") == "pending"])
     
     # Keep completed/failed for history, remove only pending
     queue = [p for p in queue if p.get("status") != "pending"]
     
-    with open(queue_file, 'w') as f:
-        json.dump(queue, f, indent=2)
+    _atomic_write_json(queue_file, queue)
+    _invalidate_status()
     
     print(f"[ADMIN] Cleared {pending_count} pending payments from queue", flush=True)
     
@@ -3060,6 +2263,7 @@ def close_pr_route(pr_number):
 @login_required
 def close_all_prs():
     """Close all open PRs from admin dashboard."""
+    _invalidate_open_prs()
     prs = get_open_prs()
     closed = []
     failed = []
@@ -3077,46 +2281,41 @@ def close_all_prs():
     return redirect(url_for('admin.dashboard', message=f"✅ Closed {len(closed)} open PR(s)"))
 
 
+@admin_bp.route('/submissions/reject/<sub_id>', methods=['POST'])
+@login_required
 def reject_submission(sub_id):
     """Reject a pending submission."""
-    data = load_submissions()
+    data = load_submissions(for_update=True)
+    sub = _find_submission(data, sub_id)
+    if sub is None:
+        return redirect(url_for('admin.submissions', error="Submission not found"))
+    if sub.get("status") == "paid":
+        return redirect(url_for('admin.submissions', error="Cannot reject - already paid"))
     
-    for sub in data.get("submissions", []):
-        if sub.get("id") == sub_id:
-            if sub.get("status") == "paid":
-                return redirect(url_for('admin.submissions', error="Cannot reject - already paid"))
-            
-            sub["status"] = "rejected"
-            sub["reject_reason"] = "Rejected by admin"
-            sub["rejected_at"] = datetime.now().isoformat() + "Z"
-            save_submissions(data)
-            
-            return redirect(url_for('admin.submissions', message=f"Submission {sub_id[:12]}... rejected"))
+    sub["status"] = "rejected"
+    sub["reject_reason"] = "Rejected by admin"
+    sub["rejected_at"] = _now_iso()
+    save_submissions(data)
     
-    return redirect(url_for('admin.submissions', error="Submission not found"))
+    return redirect(url_for('admin.submissions', message=f"Submission {sub_id[:12]}... rejected"))
 
 
 # =============================================================================
 # ADMIN API ENDPOINTS (Dashboard Data)
 # =============================================================================
 
-@admin_bp.route('/api/queue')
-@login_required
-def api_queue():
-    """Return pending payment queue items for dashboard display."""
-    import json as _json
-    import os as _os
-    
+def _pending_queue():
+    """Pending payment queue items for dashboard display."""
     queue_file = "/app/data/payment_queue.json"
     
-    if not _os.path.exists(queue_file):
-        return jsonify({"pending": [], "count": 0})
+    if not os.path.exists(queue_file):
+        return {"pending": [], "count": 0}
     
     try:
-        with open(queue_file, 'r') as f:
-            queue = _json.load(f)
+        with open(queue_file, 'rb') as f:
+            queue = _json_loads(f.read())
     except:
-        return jsonify({"pending": [], "count": 0})
+        return {"pending": [], "count": 0}
     
     pending = []
     for p in queue:
@@ -3128,9 +2327,8 @@ def api_queue():
         age_str = ""
         if queued_at:
             try:
-                from datetime import datetime as _dt
-                queued_dt = _dt.fromisoformat(queued_at)
-                delta = _dt.utcnow() - queued_dt
+                queued_dt = datetime.fromisoformat(queued_at)
+                delta = datetime.utcnow() - queued_dt
                 mins = int(delta.total_seconds() / 60)
                 if mins < 60:
                     age_str = f"{mins}m ago"
@@ -3153,39 +2351,140 @@ def api_queue():
             "manual": p.get("manual", False)
         })
     
-    return jsonify({"pending": pending, "count": len(pending)})
+    return {"pending": pending, "count": len(pending)}
+
+# Polled JSON is cached briefly by the browser, then revalidated against its ETag
+POLL_MAX_AGE = 15
+
+def _polled_json(data):
+    """JSON response for a polled endpoint: 304 if the client already has this body."""
+    body = _json_dumps(data)
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(body, mimetype="application/json")
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = f"private, max-age={POLL_MAX_AGE}"
+    return response
+
+@admin_bp.route('/api/queue')
+@login_required
+def api_queue():
+    """Return pending payment queue items for dashboard display."""
+    return _polled_json(_pending_queue())
+
+# Dashboard widget state pushed over /stream. One snapshot every STATUS_POLL_SECONDS is
+# shared by all open tabs; each tab is only sent the parts that changed since its last push.
+STATUS_POLL_SECONDS = 5
+STATUS_STREAM_SECONDS = 60  # a stream then ends and the browser reconnects, so no tab holds a worker thread for long
+_status_cache = {"data": None, "expires": 0}
+
+def _invalidate_status():
+    """Drop the cached widget snapshot after an admin action changes the payment queue."""
+    _status_cache["expires"] = 0
+
+def _view_json(endpoint):
+    """JSON body of another registered view (the app's /health etc.), or None if it's missing or fails."""
+    view = current_app.view_functions.get(endpoint)
+    if view is None:
+        return None
+    try:
+        return current_app.make_response(view()).get_json()
+    except Exception:
+        return None
+
+def _dashboard_status():
+    """Current health, webhook and payment queue widget data."""
+    now = time.time()
+    if _status_cache["data"] is None or now >= _status_cache["expires"]:
+        _status_cache["data"] = {
+            "health": _view_json("health"),
+            "webhooks": _view_json("webhooks.webhook_health"),
+            "queue": _pending_queue(),
+        }
+        _status_cache["expires"] = now + STATUS_POLL_SECONDS
+    return _status_cache["data"]
+
+@admin_bp.route('/status')
+@login_required
+def status():
+    """All dashboard widget data in one response."""
+    return _polled_json(_dashboard_status())
+
+@admin_bp.route('/stream')
+@login_required
+def status_stream():
+    """Server-sent events for the dashboard widgets: all of them on connect, then on change."""
+    def events():
+        sent = {}
+        deadline = time.monotonic() + STATUS_STREAM_SECONDS
+        yield f"retry: {STATUS_POLL_SECONDS * 1000}\n\n"
+        while True:
+            frames = []
+            for name, data in _dashboard_status().items():
+                if name not in sent or sent[name] != data:
+                    sent[name] = data
+                    frames.append(f"event: {name}\ndata: {_json_dumps(data).decode()}\n\n")
+            # Something is written every poll (a comment if nothing changed): once the client
+            # is gone that write fails and ends this generator rather than it polling on
+            yield "".join(frames) or ":\n\n"
+            if time.monotonic() >= deadline:
+                return
+            time.sleep(STATUS_POLL_SECONDS)
+    
+    response = current_app.response_class(stream_with_context(events()), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"  # don't let a proxy hold frames back
+    return response
+
+
+# SwarmSolve status -> (card classes, icon) for the dashboard's solutions section
+_SWARMSOLVE_STATUS = {
+    "open": ("bg-blue-900/40 border-blue-600 text-blue-400", "🔵"),
+    "approved": ("bg-green-900/40 border-green-600 text-green-400", "✅"),
+    "refunded": ("bg-gray-800 border-gray-600 text-gray-400", "↩️"),
+    "expired": ("bg-gray-800 border-gray-600 text-gray-500", "⏰"),
+}
+_SWARMSOLVE_STATUS_DEFAULT = ("bg-gray-800 border-gray-600 text-gray-400", "❓")
+
+@admin_bp.route('/swarmsolve')
+@login_required
+def swarmsolve_partial():
+    """Rendered SwarmSolve solutions list, swapped into the dashboard as HTML."""
+    data = _view_json("swarmsolve.list_solutions")
+    solutions = data.get("solutions") if data else None
+    for s in solutions or ():
+        s["status_class"], s["status_icon"] = _SWARMSOLVE_STATUS.get(s.get("status"), _SWARMSOLVE_STATUS_DEFAULT)
+        s["budget_fmt"] = f"{s['budget_watt']:,}" if s.get("budget_watt") else "?"
+        s["id_short"] = (s.get("id") or "-")[:12]
+    return render_template('admin/swarmsolve_partial.html', solutions=solutions)
 
 
 # =============================================================================
 # BAN MANAGEMENT
 # =============================================================================
 
-def _load_banned_users():
-    """Load banned users from data file."""
+def _load_banned_users(for_update=False):
+    """Load banned users from data file (a private copy to modify and save if for_update)."""
     banned_file = os.path.join("/app/data", "banned_users.json")
-    try:
-        with open(banned_file, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {"banned": [], "updated": None}
+    return _load_json(banned_file, {"banned": [], "updated": None}, for_update)
 
 def _save_banned_users(data):
     """Save banned users to data file."""
     banned_file = os.path.join("/app/data", "banned_users.json")
-    os.makedirs("/app/data", exist_ok=True)
-    with open(banned_file, 'w') as f:
-        json.dump(data, f, indent=2)
+    _atomic_write_json(banned_file, data)
 
 @admin_bp.route('/ban/<username>', methods=['POST'])
 @login_required
 def ban_user(username):
     """Ban a GitHub user from the bounty system."""
-    data = _load_banned_users()
+    data = _load_banned_users(for_update=True)
     banned_list = [u.lower() for u in data.get("banned", [])]
     
     if username.lower() not in banned_list:
         data.setdefault("banned", []).append(username)
-        data["updated"] = datetime.now().isoformat() + "Z"
+        data["updated"] = _now_iso()
         _save_banned_users(data)
     
     return redirect(url_for('admin.dashboard', message=f"🚫 Banned: {username}"))
@@ -3194,9 +2493,9 @@ def ban_user(username):
 @login_required
 def unban_user(username):
     """Unban a GitHub user."""
-    data = _load_banned_users()
+    data = _load_banned_users(for_update=True)
     data["banned"] = [u for u in data.get("banned", []) if u.lower() != username.lower()]
-    data["updated"] = datetime.now().isoformat() + "Z"
+    data["updated"] = _now_iso()
     _save_banned_users(data)
     
     return redirect(url_for('admin.dashboard', message=f"✅ Unbanned: {username}"))
@@ -3205,17 +2504,17 @@ def unban_user(username):
 @login_required
 def api_ban_user(username):
     """API endpoint to ban a user (for programmatic access)."""
-    data = _load_banned_users()
+    data = _load_banned_users(for_update=True)
     banned_list = [u.lower() for u in data.get("banned", [])]
     
     if username.lower() in banned_list:
-        return jsonify({"success": True, "message": f"{username} already banned", "banned": data["banned"]})
+        return _jsonify({"success": True, "message": f"{username} already banned", "banned": data["banned"]})
     
     data.setdefault("banned", []).append(username)
-    data["updated"] = datetime.now().isoformat() + "Z"
+    data["updated"] = _now_iso()
     _save_banned_users(data)
     
-    return jsonify({"success": True, "message": f"Banned {username}", "banned": data["banned"]})
+    return _jsonify({"success": True, "message": f"Banned {username}", "banned": data["banned"]})
 
 
 
@@ -3229,319 +2528,13 @@ def api_ban_user(username):
 # SECURITY SCAN
 # =============================================================================
 
-SECURITY_SCAN_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Security Scan - WattCoin Admin</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <style>
-        .finding-critical { border-left: 3px solid #ef4444; }
-        .finding-high { border-left: 3px solid #f97316; }
-        .finding-medium { border-left: 3px solid #eab308; }
-        .finding-low { border-left: 3px solid #6b7280; }
-        .severity-critical { color: #ef4444; }
-        .severity-high { color: #f97316; }
-        .severity-medium { color: #eab308; }
-        .severity-low { color: #6b7280; }
-        .spin { animation: spin 1s linear infinite; }
-        @keyframes spin { from { transform: rotate(0deg); } to { transform: rotate(360deg); } }
-    </style>
-</head>
-<body class="bg-gray-900 text-gray-100 min-h-screen">
-    <div class="max-w-6xl mx-auto p-6">
-        <!-- Header -->
-        <div class="flex justify-between items-center mb-4">
-            <div>
-                <h1 class="text-2xl font-bold text-green-400">⚡ WattCoin Admin</h1>
-                <p class="text-gray-500 text-sm">Security Scanner v1.0.0 | Full Repository Scan</p>
-            </div>
-            <a href="{{ url_for('admin.logout') }}" class="text-gray-400 hover:text-red-400 text-sm">Logout</a>
-        </div>
-        
-        <!-- Nav Tabs -->
-        <div class="flex gap-1 mb-6 border-b border-gray-700">
-            <a href="{{ url_for('admin.dashboard') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🎯 PR Bounties
-            </a>
-            <a href="{{ url_for('admin.submissions') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                📋 Agent Tasks
-            </a>
-            <a href="{{ url_for('internal.internal_page') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🔧 Internal Pipeline
-            </a>
-            <a href="{{ url_for('admin.api_keys') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🔑 Scraper Keys
-            </a>
-            <a href="{{ url_for('admin.clear_data') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-transparent text-gray-400 hover:text-gray-200">
-                🗑️ Clear Data
-            </a>
-            <a href="{{ url_for('admin.security_scan') }}" 
-               class="px-4 py-2 text-sm font-medium border-b-2 border-green-400 text-green-400">
-                🔒 Security Scan
-            </a>
-        </div>
-
-        <!-- Scan Controls -->
-        <div class="flex items-center gap-4 mb-6">
-            <button id="scan-btn" onclick="runScan()" 
-                    class="bg-green-600 hover:bg-green-500 text-white px-6 py-2 rounded-lg font-medium transition">
-                🔍 Run Scan Now
-            </button>
-            <div id="scan-status" class="text-sm text-gray-400"></div>
-        </div>
-
-        <!-- Results Banner -->
-        <div id="results-banner" class="hidden mb-6 px-4 py-3 rounded-lg"></div>
-
-        <!-- Last Scan Info -->
-        <div id="scan-info" class="grid grid-cols-4 gap-4 mb-6">
-            <div class="bg-gray-800 rounded-lg p-4">
-                <div class="text-xs text-gray-500 mb-1">Last Scan</div>
-                <div id="info-time" class="text-sm font-medium text-gray-300">Never</div>
-            </div>
-            <div class="bg-gray-800 rounded-lg p-4">
-                <div class="text-xs text-gray-500 mb-1">Files Scanned</div>
-                <div id="info-files" class="text-sm font-medium text-gray-300">—</div>
-            </div>
-            <div class="bg-gray-800 rounded-lg p-4">
-                <div class="text-xs text-gray-500 mb-1">Patterns Checked</div>
-                <div id="info-patterns" class="text-sm font-medium text-gray-300">—</div>
-            </div>
-            <div class="bg-gray-800 rounded-lg p-4">
-                <div class="text-xs text-gray-500 mb-1">Duration</div>
-                <div id="info-duration" class="text-sm font-medium text-gray-300">—</div>
-            </div>
-        </div>
-
-        <!-- Severity Summary -->
-        <div id="severity-summary" class="hidden grid grid-cols-4 gap-4 mb-6">
-            <div class="bg-gray-800 rounded-lg p-4 border-l-4 border-red-500">
-                <div class="text-xs text-gray-500 mb-1">Critical</div>
-                <div id="sev-critical" class="text-2xl font-bold text-red-400">0</div>
-            </div>
-            <div class="bg-gray-800 rounded-lg p-4 border-l-4 border-orange-500">
-                <div class="text-xs text-gray-500 mb-1">High</div>
-                <div id="sev-high" class="text-2xl font-bold text-orange-400">0</div>
-            </div>
-            <div class="bg-gray-800 rounded-lg p-4 border-l-4 border-yellow-500">
-                <div class="text-xs text-gray-500 mb-1">Medium</div>
-                <div id="sev-medium" class="text-2xl font-bold text-yellow-400">0</div>
-            </div>
-            <div class="bg-gray-800 rounded-lg p-4 border-l-4 border-gray-500">
-                <div class="text-xs text-gray-500 mb-1">Low</div>
-                <div id="sev-low" class="text-2xl font-bold text-gray-400">0</div>
-            </div>
-        </div>
-
-        <!-- Findings List -->
-        <div id="findings-container" class="hidden">
-            <h2 class="text-lg font-medium text-gray-300 mb-4">Findings by File</h2>
-            <div id="findings-list" class="space-y-3"></div>
-        </div>
-
-        <!-- Clean State -->
-        <div id="clean-state" class="hidden text-center py-12">
-            <div class="text-6xl mb-4">✅</div>
-            <div class="text-xl font-medium text-green-400">Repository Clean</div>
-            <div class="text-gray-500 mt-2">No security findings detected</div>
-        </div>
-
-        <!-- No Scan State -->
-        <div id="no-scan-state" class="text-center py-12">
-            <div class="text-6xl mb-4">🔒</div>
-            <div class="text-xl font-medium text-gray-400">No Scan Results</div>
-            <div class="text-gray-500 mt-2">Run a scan to check the public repo for leaked secrets, vendor references, and PII</div>
-        </div>
-
-        <!-- Cron Info -->
-        <div class="mt-8 p-4 bg-gray-800/50 rounded-lg">
-            <div class="text-xs text-gray-500">
-                <strong>Scheduled Scan:</strong> Runs daily at {{ scan_hour }}:00 UTC — results appear here automatically.
-                Scan checks {{ pattern_count }} patterns across all text files in the public repo.
-            </div>
-        </div>
-    </div>
-
-    <script>
-        function formatTime(isoStr) {
-            if (!isoStr) return 'Never';
-            const d = new Date(isoStr);
-            const now = new Date();
-            const diffMin = Math.floor((now - d) / 60000);
-            if (diffMin < 1) return 'Just now';
-            if (diffMin < 60) return diffMin + 'm ago';
-            if (diffMin < 1440) return Math.floor(diffMin/60) + 'h ago';
-            return Math.floor(diffMin/1440) + 'd ago';
-        }
-
-        function renderResults(data) {
-            if (!data) {
-                document.getElementById('no-scan-state').classList.remove('hidden');
-                return;
-            }
-
-            document.getElementById('no-scan-state').classList.add('hidden');
-
-            // Info cards
-            document.getElementById('info-time').textContent = formatTime(data.timestamp);
-            document.getElementById('info-files').textContent = (data.files_scanned || 0) + ' / ' + (data.files_total || 0);
-            document.getElementById('info-patterns').textContent = data.patterns_checked || '—';
-            document.getElementById('info-duration').textContent = (data.duration_seconds || 0) + 's';
-
-            // Error state
-            if (data.status === 'error') {
-                const banner = document.getElementById('results-banner');
-                banner.className = 'mb-6 px-4 py-3 rounded-lg bg-red-900/50 border border-red-500 text-red-300';
-                banner.textContent = '⚠️ Scan error: ' + (data.error || 'Unknown error');
-                banner.classList.remove('hidden');
-                return;
-            }
-
-            // Severity summary
-            const sev = data.severity_counts || {};
-            document.getElementById('sev-critical').textContent = sev.critical || 0;
-            document.getElementById('sev-high').textContent = sev.high || 0;
-            document.getElementById('sev-medium').textContent = sev.medium || 0;
-            document.getElementById('sev-low').textContent = sev.low || 0;
-
-            const totalFindings = data.findings_total || 0;
-
-            if (totalFindings > 0) {
-                document.getElementById('severity-summary').classList.remove('hidden');
-                document.getElementById('findings-container').classList.remove('hidden');
-                document.getElementById('clean-state').classList.add('hidden');
-
-                // Banner
-                const banner = document.getElementById('results-banner');
-                if (sev.critical > 0) {
-                    banner.className = 'mb-6 px-4 py-3 rounded-lg bg-red-900/50 border border-red-500 text-red-300';
-                    banner.textContent = '🚨 ' + totalFindings + ' finding(s) — ' + (sev.critical || 0) + ' critical';
-                } else if (sev.high > 0) {
-                    banner.className = 'mb-6 px-4 py-3 rounded-lg bg-orange-900/50 border border-orange-500 text-orange-300';
-                    banner.textContent = '⚠️ ' + totalFindings + ' finding(s) — review recommended';
-                } else {
-                    banner.className = 'mb-6 px-4 py-3 rounded-lg bg-yellow-900/50 border border-yellow-500 text-yellow-300';
-                    banner.textContent = '⚡ ' + totalFindings + ' finding(s) — low/medium severity';
-                }
-                banner.classList.remove('hidden');
-
-                // Render findings by file
-                const container = document.getElementById('findings-list');
-                container.innerHTML = '';
-                const byFile = data.findings_by_file || {};
-                
-                for (const [filepath, findings] of Object.entries(byFile)) {
-                    const fileDiv = document.createElement('div');
-                    fileDiv.className = 'bg-gray-800 rounded-lg overflow-hidden';
-                    
-                    const header = document.createElement('button');
-                    header.className = 'w-full flex justify-between items-center px-4 py-3 hover:bg-gray-750 transition text-left';
-                    header.innerHTML = '<span class="font-mono text-sm text-gray-300">' + filepath + '</span>' +
-                        '<span class="text-xs text-gray-500">' + findings.length + ' finding(s) ▼</span>';
-                    
-                    const body = document.createElement('div');
-                    body.className = 'hidden border-t border-gray-700';
-                    body.id = 'file-' + filepath.replace(/[^a-zA-Z0-9]/g, '_');
-                    
-                    header.onclick = function() {
-                        body.classList.toggle('hidden');
-                        const arrow = header.querySelector('span:last-child');
-                        arrow.textContent = body.classList.contains('hidden') 
-                            ? findings.length + ' finding(s) ▼' 
-                            : findings.length + ' finding(s) ▲';
-                    };
-
-                    findings.forEach(function(f) {
-                        const row = document.createElement('div');
-                        row.className = 'px-4 py-2 border-b border-gray-700/50 finding-' + f.severity;
-                        row.innerHTML = '<div class="flex items-center gap-3 mb-1">' +
-                            '<span class="text-xs font-medium severity-' + f.severity + ' uppercase">' + f.severity + '</span>' +
-                            '<span class="text-xs text-gray-400">Line ' + f.line + '</span>' +
-                            '<span class="text-xs text-gray-500">' + f.pattern_name + '</span>' +
-                            '</div>' +
-                            '<div class="font-mono text-xs text-gray-400 bg-gray-900 px-2 py-1 rounded overflow-x-auto">' + 
-                            escapeHtml(f.content) + '</div>';
-                        body.appendChild(row);
-                    });
-
-                    fileDiv.appendChild(header);
-                    fileDiv.appendChild(body);
-                    container.appendChild(fileDiv);
-                }
-            } else {
-                document.getElementById('severity-summary').classList.add('hidden');
-                document.getElementById('findings-container').classList.add('hidden');
-                document.getElementById('clean-state').classList.remove('hidden');
-                
-                const banner = document.getElementById('results-banner');
-                banner.className = 'mb-6 px-4 py-3 rounded-lg bg-green-900/50 border border-green-500 text-green-300';
-                banner.textContent = '✅ Repository clean — no findings';
-                banner.classList.remove('hidden');
-            }
-        }
-
-        function escapeHtml(str) {
-            const div = document.createElement('div');
-            div.textContent = str;
-            return div.innerHTML;
-        }
-
-        async function loadLatest() {
-            try {
-                const resp = await fetch('{{ url_for("admin.api_security_scan_latest") }}');
-                const data = await resp.json();
-                if (data) renderResults(data);
-            } catch(e) {
-                console.error('Failed to load scan results:', e);
-            }
-        }
-
-        async function runScan() {
-            const btn = document.getElementById('scan-btn');
-            const status = document.getElementById('scan-status');
-            
-            btn.disabled = true;
-            btn.innerHTML = '<span class="spin inline-block">⏳</span> Scanning...';
-            btn.className = 'bg-gray-600 text-gray-300 px-6 py-2 rounded-lg font-medium cursor-wait';
-            status.textContent = 'Scanning public repo — this may take 30-60 seconds...';
-
-            try {
-                const resp = await fetch('{{ url_for("admin.api_security_scan_run") }}', {method: 'POST'});
-                const data = await resp.json();
-                renderResults(data);
-                status.textContent = 'Scan complete';
-            } catch(e) {
-                status.textContent = 'Scan failed: ' + e.message;
-            } finally {
-                btn.disabled = false;
-                btn.innerHTML = '🔍 Run Scan Now';
-                btn.className = 'bg-green-600 hover:bg-green-500 text-white px-6 py-2 rounded-lg font-medium transition';
-            }
-        }
-
-        // Load latest results on page load
-        loadLatest();
-    </script>
-</body>
-</html>
-"""
-
-
 @admin_bp.route('/security-scan')
 @login_required
 def security_scan():
     """Security scan dashboard page."""
     scan_hour = os.getenv("SECURITY_SCAN_HOUR", "3")
     from security_scanner import SCAN_PATTERNS
-    return render_template_string(SECURITY_SCAN_TEMPLATE,
+    return render_template('admin/security_scan.html',
         scan_hour=scan_hour,
         pattern_count=len(SCAN_PATTERNS)
     )
@@ -3553,7 +2546,7 @@ def api_security_scan_run():
     """Trigger a full repo security scan."""
     from security_scanner import run_full_scan
     result = run_full_scan()
-    return jsonify(result)
+    return _jsonify(result)
 
 
 @admin_bp.route('/api/security-scan/latest')
@@ -3563,5 +2556,5 @@ def api_security_scan_latest():
     from security_scanner import load_latest_results
     result = load_latest_results()
     if result:
-        return jsonify(result)
-    return jsonify(None)
+        return _jsonify(result)
+    return _jsonify(None)
@@ -19,6 +19,7 @@ import requests
 from datetime import datetime, timedelta, timezone
 from flask import Blueprint, jsonify, request
 from collections import defaultdict
+from admin_blueprint import load_api_keys, resolve_api_key
 
 bounties_bp = Blueprint('bounties', __name__)
 
@@ -246,7 +247,6 @@ DAILY_CAP_WATT = 100000             # Total WATT auto-created per day
 RATE_LIMIT_PER_HOUR = 3             # Max proposals per agent per hour
 RATE_LIMIT_PER_DAY = 10             # Max proposals per agent per day
 PROPOSALS_FILE = "/app/data/bounty_proposals.json"
-API_KEYS_FILE = "/app/data/api_keys.json"
 BORDERLINE_SCORE_MIN = 7            # Score 7-8 → manual review queue
 BORDERLINE_SCORE_MAX = 8
 AUTO_APPROVE_MIN_SCORE = 8          # Score ≥ 8 → auto-approve (if within caps)
@@ -264,15 +264,6 @@ _rate_tracker = defaultdict(list)    # key -> [timestamps]
 _daily_watt_tracker = {"date": None, "total": 0}
 
 
-def load_api_keys():
-    """Load API keys from JSON file."""
-    try:
-        with open(API_KEYS_FILE, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {"keys": {}}
-
-
 def validate_api_key(api_key):
     """Validate API key and return key data or None."""
     if not api_key:
@@ -283,7 +274,8 @@ def validate_api_key(api_key):
         return {"owner_wallet": "env_proposal_key", "tier": "basic", "status": "active"}
     # Then check stored keys
     data = load_api_keys()
-    key_data = data.get("keys", {}).get(api_key)
+    keys = data.get("keys", {})
+    key_data = keys.get(resolve_api_key(keys, api_key))
     if key_data and key_data.get("status") == "active":
         return key_data
     return None
@@ -1122,7 +1122,11 @@ def list_solutions():
             "max_claims": MAX_CLAIMS_PER_SOLUTION
         } for s in solutions]
 
-        return jsonify({"solutions": public, "count": len(public)}), 200
+        # Pollers get a short private cache and a 304 while the listing is unchanged
+        response = jsonify({"solutions": public, "count": len(public)})
+        response.set_etag(hashlib.blake2b(response.get_data(), digest_size=8).hexdigest())
+        response.headers["Cache-Control"] = "private, max-age=15"
+        return response.make_conditional(request)
 
     except Exception as e:
         print(f"[SWARMSOLVE] List error: {e}", flush=True)
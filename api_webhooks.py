@@ -2504,9 +2504,17 @@ def process_payment_queue():
 # HEALTH CHECK
 # =============================================================================
 
+# Polled by every open admin tab: re-read the payment queue at most every 5s
+WEBHOOK_HEALTH_TTL = 5
+_webhook_health_cache = {"data": None, "expires": 0}
+
 @webhooks_bp.route('/webhooks/health', methods=['GET'])
 def webhook_health():
     """Simple health check for webhook endpoint."""
+    now = time.time()
+    if _webhook_health_cache["data"] is not None and now < _webhook_health_cache["expires"]:
+        return jsonify(_webhook_health_cache["data"]), 200
+    
     # Count pending payments in queue
     pending_count = 0
     queue_file = "/app/data/payment_queue.json"
@@ -2518,11 +2526,13 @@ def webhook_health():
     except Exception:
         pass
     
-    return jsonify({
+    _webhook_health_cache["data"] = {
         "status": "ok",
         "webhook_secret_configured": bool(GITHUB_WEBHOOK_SECRET),
         "pending_payments": pending_count
-    }), 200
+    }
+    _webhook_health_cache["expires"] = now + WEBHOOK_HEALTH_TTL
+    return jsonify(_webhook_health_cache["data"]), 200
 
 
 
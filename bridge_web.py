@@ -117,7 +117,7 @@ logger.info("Flask-Limiter initialized with default limits: 1000/hour, 100/minut
 # =============================================================================
 # REGISTER ADMIN BLUEPRINT
 # =============================================================================
-from admin_blueprint import admin_bp
+from admin_blueprint import admin_bp, load_api_keys, save_api_keys, resolve_api_key
 from api_bounties import bounties_bp
 from api_llm import llm_bp, verify_watt_payment, save_used_signature
 from api_reputation import reputation_bp
@@ -257,7 +257,6 @@ MAX_REQUESTS_PER_IP = 100
 MAX_REQUESTS_PER_URL = 10
 
 # API Key config
-API_KEYS_FILE = "/app/data/api_keys.json"
 DATA_FILE = "/app/data/bounty_reviews.json"
 API_KEY_RATE_LIMITS = {
     "basic": {"requests_per_hour": 500, "requests_per_url": 50},
@@ -281,40 +280,25 @@ _rate_limit_api_key_url = defaultdict(deque)
 # API KEY VALIDATION
 # =============================================================================
 
-def _load_api_keys():
-    """Load API keys from JSON file."""
-    try:
-        with open(API_KEYS_FILE, 'r') as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return {"keys": {}}
-
-def _save_api_keys(data):
-    """Save API keys to JSON file."""
-    try:
-        os.makedirs(os.path.dirname(API_KEYS_FILE), exist_ok=True)
-        with open(API_KEYS_FILE, 'w') as f:
-            json.dump(data, f, indent=2)
-    except Exception as e:
-        print(f"Error saving API keys: {e}")
-
 def _validate_api_key(api_key):
     """Validate API key and return key data if valid."""
     if not api_key:
         return None
-    data = _load_api_keys()
-    key_data = data.get("keys", {}).get(api_key)
+    data = load_api_keys()
+    keys = data.get("keys", {})
+    key_data = keys.get(resolve_api_key(keys, api_key))
     if key_data and key_data.get("status") == "active":
         return key_data
     return None
 
 def _increment_api_key_usage(api_key):
     """Increment usage count for an API key."""
-    data = _load_api_keys()
-    if api_key in data.get("keys", {}):
-        data["keys"][api_key]["usage_count"] = data["keys"][api_key].get("usage_count", 0) + 1
-        data["keys"][api_key]["last_used"] = datetime.utcnow().isoformat() + "Z"
-        _save_api_keys(data)
+    data = load_api_keys(for_update=True)
+    key_id = resolve_api_key(data.get("keys", {}), api_key)
+    if key_id:
+        data["keys"][key_id]["usage_count"] = data["keys"][key_id].get("usage_count", 0) + 1
+        data["keys"][key_id]["last_used"] = datetime.utcnow().isoformat() + "Z"
+        save_api_keys(data, durable=False)  # a lost bump after a crash is harmless; no fsync per scrape
 
 def _check_api_key_rate_limit(api_key, url, tier):
     """Check rate limit for API key. Returns (allowed, retry_after)."""
@@ -1394,18 +1378,25 @@ def proxy_moltbook():
         return jsonify({'error': f'Moltbook proxy error: {str(e)}'}), 500
 
 
+# Monitors and every open admin tab poll /health: re-count active nodes at most every 5s
+HEALTH_TTL = 5
+_health_cache = {"data": None, "expires": 0}
+
 @app.route('/health')
 def health():
-    active_nodes = len(get_active_nodes())
-    return jsonify({
-        'status': 'ok', 
-        'version': '3.4.0',
-        'ai': bool(ai_client), 
-        'claude': bool(claude_client),
-        'proxy': True,
-        'admin': True,
-        'active_nodes': active_nodes
-    })
+    now = time.time()
+    if _health_cache["data"] is None or now >= _health_cache["expires"]:
+        _health_cache["data"] = {
+            'status': 'ok', 
+            'version': '3.4.0',
+            'ai': bool(ai_client), 
+            'claude': bool(claude_client),
+            'proxy': True,
+            'admin': True,
+            'active_nodes': len(get_active_nodes())
+        }
+        _health_cache["expires"] = now + HEALTH_TTL
+    return jsonify(_health_cache["data"])
 
 
 @app.route('/api/v1/pricing', methods=['GET'])
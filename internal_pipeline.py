@@ -8,7 +8,8 @@ import json
 import requests
 import functools
 from datetime import datetime
-from flask import Blueprint, render_template_string, request, session, redirect, url_for, jsonify
+from flask import Blueprint, current_app, render_template, request, session, redirect, url_for, jsonify
+from admin_blueprint import ADMIN_CSS_VERSION
 
 # Create Blueprint
 internal_bp = Blueprint('internal', __name__)
@@ -95,6 +96,11 @@ def get_pr_files(pr_number):
 # MAIN PAGE
 # =============================================================================
 
+@functools.lru_cache(maxsize=None)
+def _internal_template():
+    """INTERNAL_TEMPLATE compiled once; render_template_string re-parses it on every call."""
+    return current_app.jinja_env.from_string(INTERNAL_TEMPLATE)
+
 @internal_bp.route('/admin/internal')
 @login_required
 def internal_page():
@@ -114,8 +120,9 @@ def internal_page():
         "pending": len([p for p in prs if p["number"] not in review_map]),
     }
     
-    return render_template_string(
-        INTERNAL_TEMPLATE,
+    return render_template(
+        _internal_template(),
+        admin_css_version=ADMIN_CSS_VERSION,
         prs=prs,
         review_map=review_map,
         stats=stats,
@@ -177,7 +184,7 @@ INTERNAL_TEMPLATE = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Internal Pipeline - WattCoin Admin</title>
-    <script src="https://cdn.tailwindcss.com"></script>
+    <link rel="stylesheet" href="{{ url_for('admin.static', filename='admin.css', v=admin_css_version) }}">
 </head>
 <body class="bg-gray-900 text-gray-100 min-h-screen">
     <div class="max-w-6xl mx-auto p-6">
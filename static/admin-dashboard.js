@@ -0,0 +1,186 @@
+// Admin dashboard: payment queue processing, live status widgets and SwarmSolve list.
+// Route URLs come from window.ADMIN_URLS, set inline by the dashboard template.
+
+async function processQueue() {
+    const btn = document.getElementById('process-btn');
+    const resultDiv = document.getElementById('process-result');
+
+    btn.disabled = true;
+    btn.textContent = '⏳ Processing...';
+    resultDiv.className = 'mb-4 bg-gray-800 rounded-lg p-4';
+    resultDiv.innerHTML = '<span class="text-yellow-400">Processing payments...</span>';
+
+    try {
+        const resp = await fetch(ADMIN_URLS.processQueue, { method: 'POST' });
+        const data = await resp.json();
+
+        if (data.success && data.results && data.results.length > 0) {
+            resultDiv.innerHTML = '<div class="text-green-400 font-bold mb-2">Payment Results:</div>' +
+                data.results.map(r => '<div class="text-sm py-1">' + r + '</div>').join('');
+        } else if (data.success && data.processed === 0) {
+            resultDiv.innerHTML = '<span class="text-gray-400">No pending payments in queue.</span>';
+        } else {
+            resultDiv.innerHTML = '<span class="text-red-400">Error: ' + (data.message || 'Unknown error') + '</span>';
+        }
+    } catch (err) {
+        resultDiv.innerHTML = '<span class="text-red-400">Request failed: ' + err.message + '</span>';
+    }
+
+    btn.disabled = false;
+    btn.textContent = '⚡ Process Payment Queue';
+    // The queue badge and list update through the status stream
+}
+
+function renderHealth(data) {
+    const dot = document.getElementById('health-dot');
+    const label = document.getElementById('health-label');
+    const detail = document.getElementById('health-detail');
+
+    if (data) {
+        if (data.status === 'ok') {
+            dot.className = 'w-3 h-3 rounded-full bg-green-400 shadow-lg shadow-green-400/50';
+            label.textContent = 'System Online';
+            label.className = 'text-green-400';
+
+            // Format uptime
+            const secs = data.uptime_seconds || 0;
+            const hrs = Math.floor(secs / 3600);
+            const mins = Math.floor((secs % 3600) / 60);
+            const uptimeStr = hrs > 0 ? hrs + 'h ' + mins + 'm' : mins + 'm';
+            detail.textContent = 'v' + (data.version || '?') + ' · ' + uptimeStr + ' uptime';
+            detail.className = 'text-gray-500';
+
+            // Active nodes/jobs
+            const nodesLabel = document.getElementById('nodes-label');
+            const nodesDetail = document.getElementById('nodes-detail');
+            const jobs = data.active_jobs || 0;
+            nodesLabel.textContent = 'Active Jobs';
+            nodesLabel.className = jobs > 0 ? 'text-blue-400' : 'text-gray-400';
+            nodesDetail.textContent = jobs + ' running';
+            nodesDetail.className = jobs > 0 ? 'text-blue-300' : 'text-gray-500';
+        } else {
+            dot.className = 'w-3 h-3 rounded-full bg-yellow-400 shadow-lg shadow-yellow-400/50';
+            label.textContent = 'Degraded';
+            label.className = 'text-yellow-400';
+            detail.textContent = data.status || 'Unknown status';
+        }
+    } else {
+        dot.className = 'w-3 h-3 rounded-full bg-red-500 shadow-lg shadow-red-500/50';
+        label.textContent = 'System Offline';
+        label.className = 'text-red-400';
+        detail.textContent = 'Health check failed';
+        detail.className = 'text-red-500';
+    }
+}
+
+function renderWebhooks(data) {
+    const dot = document.getElementById('webhook-dot');
+    const label = document.getElementById('webhook-label');
+    const wDetail = document.getElementById('webhook-detail');
+    const queueWidget = document.getElementById('queue-widget');
+    const queueLabel = document.getElementById('queue-label');
+    const queueDetail = document.getElementById('queue-detail');
+
+    if (data) {
+        if (data.status === 'ok' && data.webhook_secret_configured) {
+            dot.className = 'w-3 h-3 rounded-full bg-green-400 shadow-lg shadow-green-400/50';
+            label.textContent = 'Webhooks OK';
+            label.className = 'text-green-400';
+            wDetail.textContent = 'Secret configured';
+            wDetail.className = 'text-gray-500';
+        } else if (data.status === 'ok') {
+            dot.className = 'w-3 h-3 rounded-full bg-yellow-400 shadow-lg shadow-yellow-400/50';
+            label.textContent = 'Webhooks ⚠️';
+            label.className = 'text-yellow-400';
+            wDetail.textContent = 'No secret set';
+            wDetail.className = 'text-yellow-500';
+        }
+
+        // Payment queue badge
+        const pending = data.pending_payments || 0;
+        if (pending > 0) {
+            queueWidget.style.display = 'flex';
+            queueLabel.textContent = '⏳ ' + pending + ' Payment' + (pending > 1 ? 's' : '');
+            queueDetail.textContent = 'Pending in queue';
+        } else {
+            queueWidget.style.display = 'none';
+        }
+    } else {
+        dot.className = 'w-3 h-3 rounded-full bg-red-500 shadow-lg shadow-red-500/50';
+        label.textContent = 'Webhooks Down';
+        label.className = 'text-red-400';
+        wDetail.textContent = 'Check failed';
+        wDetail.className = 'text-red-500';
+    }
+}
+
+// The server sends every widget's data on connect, then again whenever it changes. It ends
+// each stream after a minute and the browser reconnects, so an error only means "down" if
+// the stream has not reopened a little later.
+if (window.EventSource) {
+    const statusStream = new EventSource(ADMIN_URLS.statusStream);
+    let downTimer = null;
+    statusStream.addEventListener('health', e => renderHealth(JSON.parse(e.data)));
+    statusStream.addEventListener('webhooks', e => renderWebhooks(JSON.parse(e.data)));
+    statusStream.addEventListener('queue', e => renderQueue(JSON.parse(e.data)));
+    statusStream.onopen = () => { clearTimeout(downTimer); downTimer = null; };
+    statusStream.onerror = () => {
+        downTimer = downTimer || setTimeout(() => { renderHealth(null); renderWebhooks(null); }, 15000);
+    };
+} else {
+    refresh();
+    setInterval(refresh, 30000);
+}
+loadSwarmSolve();
+
+// Every widget from one request, for browsers without server-sent events
+async function refresh() {
+    try {
+        const d = await (await fetch(ADMIN_URLS.status)).json();
+        renderHealth(d.health);
+        renderWebhooks(d.webhooks);
+        renderQueue(d.queue);
+    } catch (err) {
+        renderHealth(null);
+        renderWebhooks(null);
+    }
+}
+
+function renderQueue(data) {
+    const section = document.getElementById('queue-detail-section');
+    const items = document.getElementById('queue-items');
+    const pending = data.pending || [];
+
+    if (pending.length === 0) {
+        section.style.display = 'none';
+        return;
+    }
+
+    section.style.display = 'block';
+    let html = '';
+    for (const p of pending) {
+        const wallet = p.wallet || '';
+        const short = wallet.length > 12 ? wallet.substring(0,4) + '...' + wallet.slice(-4) : wallet;
+        const age = p.queued_ago || '';
+        html += '<div class="bg-yellow-900/20 border border-yellow-700 rounded-lg px-4 py-3 flex justify-between items-center">';
+        html += '<div>';
+        html += '<span class="text-yellow-400 font-medium">PR #' + p.pr_number + '</span>';
+        html += ' → <code class="text-gray-400 text-xs">' + short + '</code>';
+        html += ' • <span class="text-white font-bold">' + (p.amount ? p.amount.toLocaleString() : '?') + ' WATT</span>';
+        if (p.author) html += ' • <span class="text-gray-500">@' + p.author + '</span>';
+        html += '</div>';
+        html += '<div class="text-gray-500 text-xs">' + age + '</div>';
+        html += '</div>';
+    }
+    items.innerHTML = html;
+}
+
+async function loadSwarmSolve() {
+    const section = document.getElementById('swarmsolve-section');
+    try {
+        const resp = await fetch(ADMIN_URLS.swarmsolve);
+        section.innerHTML = await resp.text();
+    } catch (err) {
+        section.innerHTML = '<div class="bg-gray-800 rounded-lg p-4 text-red-400 text-sm">Failed to load solutions: ' + err.message + '</div>';
+    }
+}
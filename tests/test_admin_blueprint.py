@@ -0,0 +1,293 @@
+import json
+import os
+
+import admin_blueprint
+
+
+def test_load_data_reuses_parse_until_file_changes(monkeypatch, tmp_path):
+    """Unchanged data files are served from the cache; external writes are picked up."""
+    path = tmp_path / "bounty_reviews.json"
+    path.write_text(json.dumps({"reviews": {"1": {"status": "approved"}}, "payouts": []}))
+    monkeypatch.setattr(admin_blueprint, "DATA_FILE", str(path))
+    monkeypatch.setattr(admin_blueprint, "_JSON_CACHE", {})
+
+    first = admin_blueprint.load_data()
+    with monkeypatch.context() as m:
+        m.setattr(admin_blueprint, "_json_loads", None)  # a cache hit must not parse
+        assert admin_blueprint.load_data() is first
+
+        # Writers get their own copy: unsaved edits are invisible to other loads
+        update = admin_blueprint.load_data(for_update=True)
+        update["reviews"]["2"] = {"status": "rejected"}
+        assert update == {"reviews": {"1": {"status": "approved"}, "2": {"status": "rejected"}}, "payouts": []}
+        assert "2" not in admin_blueprint.load_data()["reviews"]
+
+    path.write_text(json.dumps({"reviews": {}, "payouts": [{"pr_number": 2}]}))
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert admin_blueprint.load_data() == {"reviews": {}, "payouts": [{"pr_number": 2}]}
+
+
+def test_save_data_updates_cache(monkeypatch, tmp_path):
+    path = tmp_path / "bounty_reviews.json"
+    monkeypatch.setattr(admin_blueprint, "DATA_FILE", str(path))
+    monkeypatch.setattr(admin_blueprint, "_JSON_CACHE", {})
+
+    data = admin_blueprint.load_data(for_update=True)
+    data["reviews"]["7"] = {"status": "rejected"}
+    assert admin_blueprint.save_data(data)
+
+    cached = admin_blueprint.load_data()
+    assert cached == data and cached is not data
+    assert json.loads(path.read_text())["reviews"]["7"]["status"] == "rejected"
+
+
+def test_load_json_missing_or_corrupt_file_returns_default(monkeypatch, tmp_path):
+    monkeypatch.setattr(admin_blueprint, "_JSON_CACHE", {})
+    assert admin_blueprint._load_json(str(tmp_path / "missing.json"), {"tasks": []}) == {"tasks": []}
+
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+    assert admin_blueprint._load_json(str(bad), {"tasks": []}) == {"tasks": []}
+
+    empty = tmp_path / "empty.json"
+    empty.write_bytes(b"")
+    assert admin_blueprint._load_json(str(empty), {"tasks": []}) == {"tasks": []}
+
+
+def test_atomic_write_json_replaces_file_without_leftovers(monkeypatch, tmp_path):
+    monkeypatch.setattr(admin_blueprint, "_JSON_CACHE", {})
+    path = tmp_path / "nested" / "queue.json"
+
+    admin_blueprint._atomic_write_json(str(path), [{"pr_number": 1}])
+    admin_blueprint._atomic_write_json(str(path), [{"pr_number": 2}])
+
+    assert json.loads(path.read_text()) == [{"pr_number": 2}]
+    assert os.listdir(path.parent) == ["queue.json"]
+
+
+def test_save_api_keys_fsyncs_unless_not_durable(monkeypatch, tmp_path):
+    monkeypatch.setattr(admin_blueprint, "API_KEYS_FILE", str(tmp_path / "api_keys.json"))
+    monkeypatch.setattr(admin_blueprint, "_JSON_CACHE", {})
+    synced = []
+    monkeypatch.setattr(admin_blueprint.os, "fsync", synced.append)
+
+    assert admin_blueprint.save_api_keys({"keys": {"k": {"usage_count": 1}}}, durable=False)
+    assert synced == []
+    assert admin_blueprint.save_api_keys({"keys": {"k": {"usage_count": 2}}})
+    assert len(synced) == 1
+    assert admin_blueprint.load_api_keys() == {"keys": {"k": {"usage_count": 2}}}
+
+
+def test_external_tasks_view_data_streams_large_files(monkeypatch, tmp_path):
+    """Large files take the streaming path (when ijson is installed) with the same result."""
+    path = tmp_path / "external_tasks.json"
+    tasks = [{"id": f"ext_{i}", "title": "t" * 200, "amount": 10, "poster": "p" * 44,
+              "status": "completed" if i % 2 else "open", "created_at": "2026-01-01T00:00"}
+             for i in range(4000)]
+    path.write_text(json.dumps({"tasks": tasks}))
+    monkeypatch.setattr(admin_blueprint, "EXTERNAL_TASKS_FILE", str(path))
+    monkeypatch.setattr(admin_blueprint, "_JSON_CACHE", {})
+    assert path.stat().st_size > admin_blueprint._STREAM_PARSE_MIN_BYTES
+
+    streamed = admin_blueprint._external_tasks_view_data()
+    monkeypatch.setattr(admin_blueprint, "_STREAM_PARSE_MIN_BYTES", float("inf"))
+    loaded = admin_blueprint._external_tasks_view_data()
+
+    assert streamed == loaded
+    assert loaded["ext_stats"]["total"] == 4000
+    assert loaded["ext_stats"]["total_paid"] == 20000
+    assert [t["id"] for t in loaded["external_tasks"]] == [f"ext_{i}" for i in range(3999, 3984, -1)]
+
+
+def test_saved_api_keys_are_validated_without_reading_the_file(monkeypatch, tmp_path):
+    """A save caches its parse, and API key checks elsewhere go through the same cached loader."""
+    import api_bounties
+
+    monkeypatch.setattr(admin_blueprint, "API_KEYS_FILE", str(tmp_path / "api_keys.json"))
+    monkeypatch.setattr(admin_blueprint, "_JSON_CACHE", {})
+    monkeypatch.delenv("PROPOSAL_API_KEY", raising=False)
+
+    data = admin_blueprint.load_api_keys(for_update=True)
+    data["keys"][admin_blueprint.hash_api_key("wc_secret")] = {"status": "active", "tier": "pro"}
+    assert admin_blueprint.save_api_keys(data)
+
+    with monkeypatch.context() as m:
+        m.setattr(admin_blueprint, "open", None, raising=False)  # no read from disk
+        m.setattr(admin_blueprint, "_json_loads", None)  # and no parse
+        assert api_bounties.validate_api_key("wc_secret")["tier"] == "pro"
+        assert api_bounties.validate_api_key("wc_other") is None
+        assert admin_blueprint.load_api_keys() is admin_blueprint.load_api_keys()
+
+
+def test_find_submission_resolves_into_callers_copy(monkeypatch, tmp_path):
+    """The id index follows the submissions file, and lookups return the caller's own objects."""
+    path = tmp_path / "task_submissions.json"
+    path.write_text(json.dumps({"submissions": [{"id": "a", "n": 1}, {"id": "b"}, {"id": "a", "n": 2}]}))
+    monkeypatch.setattr(admin_blueprint, "SUBMISSIONS_FILE", str(path))
+    monkeypatch.setattr(admin_blueprint, "_JSON_CACHE", {})
+    monkeypatch.setattr(admin_blueprint, "_submission_positions", (None, {}))
+
+    shared = admin_blueprint.load_submissions()
+    assert admin_blueprint._find_submission(shared, "a") is shared["submissions"][0]
+    assert admin_blueprint._find_submission(shared, "c") is None
+
+    data = admin_blueprint.load_submissions(for_update=True)
+    sub = admin_blueprint._find_submission(data, "b")
+    assert sub is data["submissions"][1]
+    sub["status"] = "rejected"
+    data["submissions"].append({"id": "c"})
+    assert admin_blueprint._find_submission(data, "c") is data["submissions"][3]
+    assert "status" not in admin_blueprint._find_submission(shared, "b")
+
+    # Saving changes the stamp, so the next lookup indexes the new file
+    assert admin_blueprint.save_submissions(data)
+    saved = admin_blueprint.load_submissions()
+    assert admin_blueprint._find_submission(saved, "c") == {"id": "c"}
+    assert admin_blueprint._submission_positions[1]["c"] == 3
+
+    # A list that is not a load of the file falls back to a scan
+    assert admin_blueprint._find_submission({"submissions": [{"id": "b", "n": 3}]}, "b")["n"] == 3
+
+
+def test_minimize_diff_drops_context_and_generated_files():
+    diff = "\n".join([
+        "diff --git a/app.py b/app.py",
+        "--- a/app.py",
+        "+++ b/app.py",
+        "@@ -1,7 +1,7 @@",
+        " one", " two", " three",
+        "-old",
+        "+new",
+        " four", " five", " six",
+        "diff --git a/package-lock.json b/package-lock.json",
+        "--- a/package-lock.json",
+        "+++ b/package-lock.json",
+        "@@ -1 +1 @@",
+        "-x",
+        "+y",
+    ])
+    assert admin_blueprint._minimize_diff(diff).split("\n") == [
+        "diff --git a/app.py b/app.py",
+        "--- a/app.py",
+        "+++ b/app.py",
+        "@@ -1,7 +1,7 @@",
+        "...", " three",
+        "-old",
+        "+new",
+        " four", "...",
+        "diff --git a/package-lock.json b/package-lock.json",
+        "[... 5 lines elided (generated/binary file)]",
+    ]
+
+
+def test_extract_json_handles_fenced_and_chatty_replies():
+    assert admin_blueprint._extract_json('{"score": 9}') == {"score": 9}
+    assert admin_blueprint._extract_json('```json\n{"feedback": "use {x}", "concerns": []}\n```') == {
+        "feedback": "use {x}", "concerns": []}
+    assert admin_blueprint._extract_json('Sure! {"score": 4} Hope that helps {}') == {"score": 4}
+    assert admin_blueprint._extract_json("no json here") is None
+
+
+def test_fail_on_concerns_blocks_pass_and_high_score():
+    review = {"pass": True, "score": 9, "concerns": ["no tests"]}
+    admin_blueprint._fail_on_concerns(review)
+    assert review == {"pass": False, "score": 8, "concerns": ["no tests"]}
+
+    review = {"pass": True, "score": "9", "concerns": ["odd score"]}
+    admin_blueprint._fail_on_concerns(review)
+    assert review["pass"] is False
+
+    review = {"pass": True, "score": 10, "concerns": []}
+    admin_blueprint._fail_on_concerns(review)
+    assert review["pass"] is True and review["score"] == 10
+
+
+def test_truncate_diff_cuts_at_file_or_hunk_boundary():
+    file_a = "diff --git a/a.py b/a.py\n@@ -1 +1 @@\n" + "+a\n" * 40
+    file_b = "diff --git a/b.py b/b.py\n@@ -1 +1 @@\n" + "+b\n" * 40
+    diff = file_a + file_b
+    assert admin_blueprint._truncate_diff(diff, len(diff)) == diff
+    assert admin_blueprint._truncate_diff(diff, len(file_a) + 20) == file_a.rstrip("\n")
+
+    hunks = "diff --git a/c.py b/c.py\n" + "".join(f"@@ -{i} +{i} @@\n+line {i}\n" for i in range(50))
+    cut = admin_blueprint._truncate_diff(hunks, 300)
+    assert len(cut) <= 300 and hunks.startswith(cut) and hunks[len(cut):].startswith("\n@@")
+
+
+def test_mark_payouts_paid_saves_batch_once(monkeypatch, tmp_path):
+    path = tmp_path / "bounty_reviews.json"
+    path.write_text(json.dumps({"reviews": {}, "payouts": [
+        {"pr_number": 1, "status": "pending"}, {"pr_number": 2, "status": "pending"},
+        {"pr_number": 3, "status": "pending"}]}))
+    monkeypatch.setattr(admin_blueprint, "DATA_FILE", str(path))
+    monkeypatch.setattr(admin_blueprint, "_JSON_CACHE", {})
+    saves = []
+    real_save = admin_blueprint.save_data
+    monkeypatch.setattr(admin_blueprint, "save_data", lambda data: saves.append(1) or real_save(data))
+
+    assert admin_blueprint._mark_payouts_paid({1: "sig1", 3: "", 9: "sig9"}) == [1, 3]
+    assert len(saves) == 1
+
+    payouts = json.loads(path.read_text())["payouts"]
+    assert [p["status"] for p in payouts] == ["paid", "pending", "paid"]
+    assert payouts[0]["tx_sig"] == "sig1" and "tx_sig" not in payouts[2]
+
+
+def test_review_counts_recount_only_when_data_file_changes(monkeypatch, tmp_path):
+    path = tmp_path / "bounty_reviews.json"
+    path.write_text(json.dumps({"reviews": {"1": {"status": "approved"}, "2": {"status": "rejected"},
+                                            "3": {"status": "approved"}, "4": {}}}))
+    monkeypatch.setattr(admin_blueprint, "DATA_FILE", str(path))
+    monkeypatch.setattr(admin_blueprint, "_JSON_CACHE", {})
+    monkeypatch.setattr(admin_blueprint, "_review_counts_cache", {"stamp": None, "counts": (0, 0)})
+
+    assert admin_blueprint._review_counts() == (2, 1)
+    monkeypatch.setattr(admin_blueprint, "load_data", lambda: {"reviews": {}})
+    assert admin_blueprint._review_counts() == (2, 1)
+
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert admin_blueprint._review_counts() == (0, 0)
+
+
+def test_status_stream_sends_changes_then_ends(monkeypatch):
+    """Each poll writes a frame (a comment when nothing changed) and the stream closes at its deadline."""
+    from flask import Flask
+
+    snapshots = iter([{"queue": {"n": 1}}, {"queue": {"n": 1}}, {"queue": {"n": 2}}])
+    clock = iter([0, 0, 10, 20])
+    monkeypatch.setattr(admin_blueprint, "_dashboard_status", lambda: next(snapshots))
+    monkeypatch.setattr(admin_blueprint.time, "monotonic", lambda: next(clock))
+    monkeypatch.setattr(admin_blueprint.time, "sleep", lambda seconds: None)
+    monkeypatch.setattr(admin_blueprint, "STATUS_STREAM_SECONDS", 20)
+
+    with Flask(__name__).test_request_context():
+        response = admin_blueprint.status_stream.__wrapped__()
+        frames = list(response.response)
+
+    assert frames == [
+        "retry: 5000\n\n",
+        'event: queue\ndata: {"n":1}\n\n',
+        ":\n\n",
+        'event: queue\ndata: {"n":2}\n\n',
+    ]
+
+
+def test_new_api_key_reveal_is_single_use_and_expires(monkeypatch):
+    monkeypatch.setattr(admin_blueprint, "_pending_reveals", {})
+    now = [1000.0]
+    monkeypatch.setattr(admin_blueprint.time, "time", lambda: now[0])
+
+    token = admin_blueprint._stash_new_key("wc_first")
+    assert admin_blueprint._pop_new_key(token) == "wc_first"
+    assert admin_blueprint._pop_new_key(token) is None
+
+    stale = admin_blueprint._stash_new_key("wc_stale")
+    now[0] += admin_blueprint.REVEAL_TTL_SECONDS
+    assert admin_blueprint._pop_new_key(stale) is None
+
+    admin_blueprint._stash_new_key("wc_old")
+    now[0] += admin_blueprint.REVEAL_TTL_SECONDS
+    admin_blueprint._stash_new_key("wc_new")
+    assert [key for key, _ in admin_blueprint._pending_reveals.values()] == ["wc_new"]